@@ -1,6 +1,8 @@
 from controllers.auth_controller import AuthController
 from controllers.app_controller import AppController
 from views.auth_view import AuthView
+from runtime.threads import apply_process_settings
+from runtime.vision import start_warmup
 
 
 # ================= START MAIN APP =================
@@ -15,4 +17,9 @@ if __name__ == "__main__":
     auth_controller = AuthController()
 
     app = AuthView(auth_controller, start_main_app)
+
+    # Load the vision stack while the user is logging in
+    apply_process_settings()
+    start_warmup()
+
     app.mainloop()
\ No newline at end of file
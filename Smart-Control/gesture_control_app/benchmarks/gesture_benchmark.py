@@ -0,0 +1,77 @@
+"""
+Per-frame cost of dynamic gesture matching.
+
+Builds a recogniser with the built-in templates plus noisy copies of
+them (to reach --templates), then times match() on noisy swipes,
+circles and random paths, and reports how many full DTWs LB_Keogh
+pruning left per query.
+
+Run from the gesture_control_app directory:
+    python -m benchmarks.gesture_benchmark --templates 48
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from gestures import dynamic
+from gestures.dynamic import DynamicGestureRecognizer, builtin_templates, normalise
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--templates", type=int, default=48)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--noise", type=float, default=0.08)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = builtin_templates()
+    recognizer = DynamicGestureRecognizer(base)
+
+    names = list(base)
+    while len(recognizer.templates) < args.templates:
+        name = names[len(recognizer.templates) % len(names)]
+        series = base[name] + rng.normal(0, args.noise, base[name].shape)
+        recognizer.add_template(f"{name}_{len(recognizer.templates)}", series)
+
+    queries = []
+    for i in range(args.queries):
+        if i % 4 == 3:
+            series = np.cumsum(rng.normal(0, 0.3, base[names[0]].shape), axis=0)
+        else:
+            series = base[names[i % len(names)]]
+        queries.append(normalise(series + rng.normal(0, args.noise, series.shape)))
+
+    # Count the full DTWs that survive LB_Keogh pruning
+    calls = [0]
+    original = dynamic.dtw
+
+    def counted(*a, **kw):
+        calls[0] += 1
+        return original(*a, **kw)
+
+    dynamic.dtw = counted
+
+    timings = []
+    matched = 0
+    for query in queries:
+        start = time.perf_counter()
+        name, _ = recognizer.match(query)
+        timings.append((time.perf_counter() - start) * 1000)
+        matched += name is not None
+
+    dynamic.dtw = original
+
+    timings = np.array(timings)
+    print(f"{len(recognizer.templates)} templates, {len(queries)} queries")
+    print(f"  match ms   p50 {np.median(timings):.3f}   "
+          f"p95 {np.percentile(timings, 95):.3f}   max {timings.max():.3f}")
+    print(f"  DTWs/query {calls[0] / len(queries):.1f} "
+          f"(of {len(recognizer.templates)})")
+    print(f"  matched    {matched}/{len(queries)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Stress-test the gesture logic with synthetic hands.
+
+Plays scripted hands from simulation/ through the modes' gesture logic,
+without a camera or MediaPipe, and reports:
+- per-frame label accuracy of every mode's classify_hand() on held
+  poses, with landmark jitter and occlusion dropouts
+- trigger latency of the Volume lock sequence and Presentation swipes,
+  fed straight into the real VolumePlugin / PresentationPlugin.on_frame()
+  with their OS actions recorded instead of performed
+- false triggers per minute over a long run of random poses
+- frames per second of the generator and the hand tracker with many hands
+
+Run from the gesture_control_app directory:
+    python -m benchmarks.gesture_stress
+    python -m benchmarks.gesture_stress --jitter 0.006 --dropout 0.02 --hands 2
+"""
+
+import argparse
+import io
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from models.mode_registry import MODE_REGISTRY, load_plugin
+from recording.batch import load_classifiers
+from runtime.tracking import HandTracker
+from simulation.hand_model import POSES
+from simulation.synthetic import HandScript, SyntheticHands
+
+FRAME_SIZE = (640, 480)
+
+# Pose -> label each mode's classify_hand() should give
+EXPECTED = {
+    "Mouse": {"PINCH": "LEFT_PINCH", "PINCH_MIDDLE": "RIGHT_PINCH",
+              "PINCH_RING": "DOUBLE_PINCH", "ONE": "POINT", "FIST": ""},
+    "Keyboard": {"PINCH": "PINCH", "OPEN": "", "ONE": ""},
+    "Media": {"FIST": "0", "ONE": "1", "PEACE": "2", "THREE": "3",
+              "FOUR": "4", "OPEN": "5"},
+    "Volume": {"PEACE": "PEACE", "THUMBS_UP": "THUMBS_UP", "OPEN": "PINCH"},
+    "Presentation": {"FIST": "FIST", "ONE": "NEXT", "PEACE": "PREVIOUS",
+                     "THREE": "START", "THUMBS_UP": "EXIT"},
+}
+
+
+def stream(scripts, args, seed=0):
+    return SyntheticHands(scripts, args.fps, args.jitter, args.dropout, seed)
+
+
+# ================= ACCURACY =================
+def accuracy(classifiers, args):
+    print("Label accuracy (held poses, both hands)")
+    for mode_name, classify in classifiers.items():
+        expected = EXPECTED.get(mode_name, {})
+        right = total = 0
+        wrong = {}
+        for side in ("Right", "Left"):
+            script = HandScript(side)
+            for pose in expected:
+                script.hold(pose, args.hold)
+
+            # The first frames of each hold are the blend from the last pose
+            hands = stream([script], args)
+            for t, results, truth in hands:
+                if truth[0] is None or (t % args.hold) < 0.15:
+                    continue
+                hand = results.multi_hand_landmarks[0]
+                label = classify(hand, side, FRAME_SIZE)
+                total += 1
+                if label == expected[truth[0]]:
+                    right += 1
+                else:
+                    key = f"{truth[0]}->{label or '-'}"
+                    wrong[key] = wrong.get(key, 0) + 1
+
+        worst = ", ".join(f"{k} {v}" for k, v in
+                          sorted(wrong.items(), key=lambda kv: -kv[1])[:3])
+        print(f"  {mode_name:<13} {right / max(total, 1) * 100:5.1f}% of {total}"
+              + (f"   ({worst})" if worst else ""))
+
+
+# ================= TRIGGERS =================
+class StubActions:
+    """The runtime's Actions without the OS: intents are kept, not performed."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.intents = []
+
+    def register(self, event, handler):
+        self.handlers[event] = handler
+
+    def perform(self, intents):
+        self.intents.extend(intents or ())
+
+
+class StubEndpoint:
+    """Stands in for Volume's pycaw endpoint, so the speakers are left alone."""
+
+    def __init__(self):
+        self.level = 0.0
+
+    def GetVolumeRange(self):
+        return -65.25, 0.0, 0.03125
+
+    def GetMasterVolumeLevel(self):
+        return self.level
+
+    def SetMasterVolumeLevel(self, level, context):
+        self.level = level
+
+
+class PluginDriver:
+    """
+    Runs a mode's real ModePlugin on synthetic frames, as the runtime
+    does after inference: track hands, then on_frame(). update() returns
+    what the plugin triggered this frame, if anything.
+    """
+
+    def __init__(self, plugin_class, fps):
+        self.plugin = plugin_class()
+        self.plugin.runtime = argparse.Namespace(frame_size=FRAME_SIZE, fps=fps,
+                                                 tracker=HandTracker(),
+                                                 actions=StubActions())
+        self.setup(self.plugin)
+        # The plugins' console messages would bury the report
+        self.quiet = redirect_stdout(io.StringIO())
+        with self.quiet:
+            self.plugin.on_start()
+
+    def setup(self, plugin):
+        pass
+
+    def update(self, t, results):
+        runtime = self.plugin.runtime
+        visible = runtime.tracker.update(results, t)
+        with self.quiet:
+            intents = self.plugin.on_frame(visible, runtime.tracker.features(), t)
+        runtime.actions.perform(intents)
+        return self.triggered(intents)
+
+    def triggered(self, intents):
+        return None
+
+
+class VolumeLock(PluginDriver):
+    """VolumePlugin; triggers TOGGLE_LOCK when its PEACE PEACE lock flips."""
+
+    def setup(self, plugin):
+        plugin.open_endpoint = StubEndpoint
+        self.locked = False
+
+    def triggered(self, intents):
+        locked, self.locked = self.locked, self.plugin.volume_locked
+        return "TOGGLE_LOCK" if locked != self.locked else None
+
+
+class PresentationSwipes(PluginDriver):
+    """PresentationPlugin; triggers the swipe that pressed a key."""
+
+    ACTIONS = ("SWIPE_RIGHT", "SWIPE_LEFT")
+
+    def triggered(self, intents):
+        label = self.plugin.label
+        return label if intents and label in self.ACTIONS else None
+
+
+def load_plugins(mode_names):
+    """{mode: ModePlugin class} for every mode that imports here."""
+    plugins = {}
+    for mode_name in mode_names:
+        try:
+            plugins[mode_name] = load_plugin(mode_name)
+        except Exception as e:
+            # e.g. pycaw is Windows only
+            print(f"Skipping {mode_name} triggers: {e}")
+    return plugins
+
+
+def latency(name, make_logic, make_script, target, args):
+    delays, misses = [], 0
+    for trial in range(args.trials):
+        script, onset = make_script()
+        logic = make_logic()
+        fired = None
+        for t, results, _ in stream([script], args, seed=trial):
+            if logic.update(t, results) == target and fired is None:
+                fired = t
+        if fired is None or fired < onset:
+            misses += 1
+        else:
+            delays.append((fired - onset) * 1000)
+
+    if delays:
+        print(f"  {name:<20} p50 {np.median(delays):6.0f} ms   "
+              f"p95 {np.percentile(delays, 95):6.0f} ms   "
+              f"missed {misses}/{args.trials}")
+    else:
+        print(f"  {name:<20} missed {misses}/{args.trials}")
+
+
+def triggers(plugins, args):
+    print("Trigger latency (from the completing movement's onset)")
+
+    if "Volume" in plugins:
+        def lock_script():
+            script = (HandScript().hold("OPEN", 1.0).hold("PEACE", 0.3)
+                      .hold("OPEN", 0.25).hold("PEACE", 0.4).hold("OPEN", 1.0))
+            return script, script.onsets("PEACE")[1]
+
+        latency("Volume PEACE PEACE", lambda: VolumeLock(plugins["Volume"], args.fps),
+                lock_script, "TOGGLE_LOCK", args)
+
+    if "Presentation" not in plugins:
+        return
+    for dx, target in ((0.35, "SWIPE_RIGHT"), (-0.35, "SWIPE_LEFT")):
+        def swipe_script(dx=dx, target=target):
+            script = (HandScript(x=0.5 - dx / 2).hold("ONE", 0.6)
+                      .swipe("ONE", dx, 0.0, 0.3).hold("ONE", 0.6))
+            return script, script.onsets(target)[0]
+
+        latency(f"Presentation {target}",
+                lambda: PresentationSwipes(plugins["Presentation"], args.fps),
+                swipe_script, target, args)
+
+
+def false_triggers(plugins, args):
+    seconds = args.soak_minutes * 60
+    poses = [p for p in POSES if p != "PEACE"]
+    script = HandScript.random(seconds, seed=1, poses=poses)
+
+    logics = {}
+    if "Presentation" in plugins:
+        logics["Presentation swipe"] = PresentationSwipes(plugins["Presentation"], args.fps)
+    if "Volume" in plugins:
+        logics["Volume lock"] = VolumeLock(plugins["Volume"], args.fps)
+    fired = {name: 0 for name in logics}
+
+    for t, results, _ in stream([script], args, seed=1):
+        for name, logic in logics.items():
+            if logic.update(t, results):
+                fired[name] += 1
+
+    print(f"False triggers ({args.soak_minutes:g} min of random poses, no PEACE, no swipes)")
+    for name, count in fired.items():
+        print(f"  {name:<20} {count / args.soak_minutes:.2f} per minute ({count})")
+
+
+# ================= THROUGHPUT =================
+def throughput(args):
+    seconds = args.frames / args.fps
+    scripts = [HandScript.random(seconds, seed=i, side=("Right", "Left")[i % 2],
+                                 x=(i + 0.5) / args.hands, size=0.1)
+               for i in range(args.hands)]
+
+    hands = stream(scripts, args)
+    frames = []
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        frames.append(hands.process())
+    generate = time.perf_counter() - start
+
+    tracker = HandTracker(max_hands=args.hands)
+    start = time.perf_counter()
+    for i, results in enumerate(frames):
+        tracker.update(results, i / args.fps)
+        tracker.features()
+    track = time.perf_counter() - start
+
+    print(f"Throughput ({args.hands} hands, {args.frames} frames)")
+    print(f"  generator {args.frames / generate:8.0f} frames/s")
+    print(f"  tracker   {args.frames / track:8.0f} frames/s "
+          f"({len(tracker.tracks)} tracks at the end)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--jitter", type=float, default=0.003,
+                        help="landmark noise, normalised units")
+    parser.add_argument("--dropout", type=float, default=0.01,
+                        help="chance per frame that an occlusion starts")
+    parser.add_argument("--hold", type=float, default=1.0)
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--soak-minutes", type=float, default=10)
+    parser.add_argument("--hands", type=int, default=4)
+    parser.add_argument("--frames", type=int, default=3000)
+    args = parser.parse_args()
+
+    classifiers = load_classifiers(list(MODE_REGISTRY))
+    plugins = load_plugins(["Volume", "Presentation"])
+    accuracy(classifiers, args)
+    triggers(plugins, args)
+    false_triggers(plugins, args)
+    throughput(args)
+
+
+if __name__ == "__main__":
+    main()
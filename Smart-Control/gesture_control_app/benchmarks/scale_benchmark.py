@@ -0,0 +1,135 @@
+"""
+Landmark accuracy vs. speed at several inference widths.
+
+For every mode's HANDS_CONFIG, runs the same frames through a fresh
+Hands graph at full resolution (the reference) and at each inference
+width, and reports per-frame inference time, detection agreement and
+landmark error against the reference in display-frame pixels.
+
+Run from the gesture_control_app directory:
+    python -m benchmarks.scale_benchmark --video hands.mp4
+    python -m benchmarks.scale_benchmark --camera 0 --frames 300 --width 1280 --height 720
+"""
+
+import argparse
+import time
+from importlib import import_module
+
+import cv2
+import numpy as np
+import mediapipe as mp
+
+from models.mode_registry import MODE_REGISTRY
+from runtime.inference import HandInference
+
+DEFAULT_WIDTHS = [640, 480, 320, 256]
+
+
+# ---------------- INPUT ----------------
+def load_frames(args):
+    if args.video:
+        cap = cv2.VideoCapture(args.video)
+    else:
+        cap = cv2.VideoCapture(args.camera)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, args.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, args.height)
+
+    frames = []
+    while len(frames) < args.frames:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.flip(frame, 1))
+    cap.release()
+    return frames
+
+
+def mode_configs(names):
+    configs = {}
+    for name in names:
+        module_name = MODE_REGISTRY[name].split(":")[0]
+        try:
+            configs[name] = import_module(module_name).HANDS_CONFIG
+        except Exception as e:
+            print(f"Skipping {name}: {e}")
+    return configs
+
+
+# ---------------- MEASUREMENT ----------------
+def run_pass(frames, config, infer_width):
+    """Landmarks (frames x 21 x 2, NaN when missed) and ms per frame."""
+    hands = mp.solutions.hands.Hands(**config)
+    inference = HandInference(hands, infer_width)
+
+    landmarks = np.full((len(frames), 21, 2), np.nan)
+    timings = []
+
+    for i, frame in enumerate(frames):
+        start = time.perf_counter()
+        results = inference.process(frame)
+        timings.append((time.perf_counter() - start) * 1000)
+
+        if results.multi_hand_landmarks:
+            hand = results.multi_hand_landmarks[0].landmark
+            landmarks[i] = [(lm.x, lm.y) for lm in hand]
+
+    hands.close()
+    return landmarks, np.array(timings)
+
+
+def compare(reference, landmarks, frame_shape):
+    h, w = frame_shape[:2]
+    scale = np.array([w, h])
+
+    ref_found = ~np.isnan(reference[:, 0, 0])
+    found = ~np.isnan(landmarks[:, 0, 0])
+    both = ref_found & found
+
+    agreement = np.mean(ref_found == found) * 100
+    if not both.any():
+        return agreement, np.nan, np.nan
+
+    error_px = np.linalg.norm((landmarks[both] - reference[both]) * scale, axis=2)
+    return agreement, error_px.mean(), np.percentile(error_px, 95)
+
+
+# ---------------- MAIN ----------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--video")
+    parser.add_argument("--camera", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--widths", type=int, nargs="+", default=DEFAULT_WIDTHS)
+    parser.add_argument("--modes", nargs="+", default=list(MODE_REGISTRY))
+    args = parser.parse_args()
+
+    frames = load_frames(args)
+    if not frames:
+        raise SystemExit("No frames captured")
+    shape = frames[0].shape
+    print(f"{len(frames)} frames at {shape[1]}x{shape[0]}\n")
+
+    for mode_name, config in mode_configs(args.modes).items():
+        reference, ref_ms = run_pass(frames, config, None)
+
+        print(f"{mode_name}  {config}")
+        print(f"  {'width':>6} {'ms p50':>8} {'ms p95':>8} "
+              f"{'detect %':>9} {'err px':>8} {'err p95':>8}")
+        print(f"  {'full':>6} {np.median(ref_ms):8.2f} "
+              f"{np.percentile(ref_ms, 95):8.2f} {100:9.1f} {0:8.2f} {0:8.2f}")
+
+        for width in args.widths:
+            if width >= shape[1]:
+                continue
+            landmarks, ms = run_pass(frames, config, width)
+            agreement, err, err95 = compare(reference, landmarks, shape)
+            print(f"  {width:>6} {np.median(ms):8.2f} "
+                  f"{np.percentile(ms, 95):8.2f} {agreement:9.1f} "
+                  f"{err:8.2f} {err95:8.2f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Startup benchmark for Smart Control.
+
+Measures, each in a fresh interpreter:
+  1. `-X importtime` breakdown of `import app`
+  2. Time from process launch to the first MainView window
+  3. Time from process launch to the first processed camera frame
+
+Run from the gesture_control_app directory:
+    python -m benchmarks.startup_benchmark
+    python -m benchmarks.startup_benchmark --max-window-ms 1500
+
+Any --max-* budget that is exceeded makes the script exit with status 1,
+so it can guard against startup regressions.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_WINDOW_SCRIPT = """
+import time
+from controllers.app_controller import AppController
+controller = AppController()
+controller.view.root.update()
+print(time.time())
+controller.view.root.destroy()
+"""
+
+FIRST_FRAME_SCRIPT = """
+import sys
+import time
+from models.mode_registry import load_mode
+load_mode(sys.argv[1])
+
+import cv2
+import mediapipe as mp
+hands = mp.solutions.hands.Hands(max_num_hands=1)
+cap = cv2.VideoCapture(0)
+ok, frame = cap.read()
+if not ok:
+    sys.exit("camera returned no frame")
+hands.process(cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB))
+print(time.time())
+cap.release()
+hands.close()
+"""
+
+
+# ---------------- HELPERS ----------------
+def run_child(args):
+    """Run a child interpreter in APP_DIR; return (launch time, result)."""
+    launched = time.time()
+    result = subprocess.run(
+        [sys.executable] + args,
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True
+    )
+    return launched, result
+
+
+def time_to_marker(args):
+    """Milliseconds between launch and the timestamp the child prints."""
+    launched, result = run_child(args)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        print(f"  child failed: {lines[-1] if lines else result.returncode}")
+        return None
+    return (float(result.stdout.strip().splitlines()[-1]) - launched) * 1000
+
+
+def import_breakdown(module, top_n):
+    _, result = run_child(["-X", "importtime", "-c", f"import {module}"])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    rows.sort(reverse=True)
+    total_us = max((row[0] for row in rows), default=0)
+    return total_us / 1000, rows[:top_n]
+
+
+# ---------------- MAIN ----------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", default="Mouse")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--skip-window", action="store_true")
+    parser.add_argument("--skip-frame", action="store_true")
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--max-window-ms", type=float)
+    parser.add_argument("--max-frame-ms", type=float)
+    args = parser.parse_args()
+
+    failures = []
+
+    def check(label, value, budget):
+        if value is None:
+            print(f"{label:<28} failed")
+            return
+        print(f"{label:<28} {value:8.1f} ms")
+        if budget is not None and value > budget:
+            failures.append(f"{label}: {value:.1f} ms > {budget} ms")
+
+    # 1. Import time
+    import_ms, rows = import_breakdown("app", args.top)
+    print(f"Top {args.top} imports by cumulative time (import app):")
+    for cumulative_us, self_us, name in rows:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f})  {name}")
+    print()
+
+    check("import app", import_ms, args.max_import_ms)
+
+    # 2. First window
+    if not args.skip_window:
+        check(
+            "launch -> first window",
+            time_to_marker(["-c", FIRST_WINDOW_SCRIPT]),
+            args.max_window_ms
+        )
+
+    # 3. First processed frame
+    if not args.skip_frame:
+        check(
+            f"launch -> first frame ({args.mode})",
+            time_to_marker(["-c", FIRST_FRAME_SCRIPT, args.mode]),
+            args.max_frame_ms
+        )
+
+    if failures:
+        print("\nStartup budget exceeded:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
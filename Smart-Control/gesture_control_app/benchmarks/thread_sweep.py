@@ -0,0 +1,217 @@
+"""
+Sweep thread count, CPU affinity and priority settings.
+
+Replays the same frames through the capture -> inference pipeline once
+per setting, each in a fresh process (OpenCV's pool and MediaPipe's
+graph threads are sized when they start), and reports throughput,
+per-frame latency and CPU time per frame. Capture decodes JPEG buffers
+on its own thread, as the MJPG camera path does.
+
+Run from the gesture_control_app directory:
+    python -m benchmarks.thread_sweep --video hands.mp4
+    python -m benchmarks.thread_sweep --camera 0 --mode Keyboard --save
+"""
+
+import argparse
+import itertools
+import os
+import time
+from importlib import import_module
+from multiprocessing import get_context
+from queue import Empty, Queue
+from threading import Thread
+
+import cv2
+import numpy as np
+
+from models.mode_registry import MODE_REGISTRY
+
+JPEG_QUALITY = 90
+POLL_SECONDS = 1.0
+
+
+# ================= INPUT =================
+def load_frames(args):
+    """Recorded frames as JPEG buffers, like an MJPG camera delivers."""
+    if args.video:
+        cap = cv2.VideoCapture(args.video)
+    else:
+        cap = cv2.VideoCapture(args.camera)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, args.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, args.height)
+
+    frames = []
+    while len(frames) < args.frames:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        ok, jpeg = cv2.imencode(".jpg", frame,
+                                [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        frames.append(jpeg)
+    cap.release()
+    return frames
+
+
+def settings_grid(cpu_count, raise_priority):
+    """Every combination worth comparing on this machine."""
+    counts = sorted({1, 2, max(1, cpu_count // 2)}) + [None]
+
+    # Pinned: capture on the last core, inference on the rest
+    layouts = [(None, None)]
+    if cpu_count > 1:
+        layouts.append(([cpu_count - 1], list(range(cpu_count - 1))))
+
+    for opencv_threads, inference_threads, (capture, inference) in \
+            itertools.product(counts, counts, layouts):
+        yield dict(
+            opencv_threads=opencv_threads,
+            inference_threads=inference_threads,
+            capture_cpus=capture,
+            inference_cpus=inference,
+            raise_priority=raise_priority
+        )
+
+
+# ================= ONE RUN (child process) =================
+def run_setting(settings, mode_name, infer_width, frames, results):
+    from runtime import threads
+    from runtime.inference import HandInference
+    from runtime.vision import get_hands
+
+    threads.set_config(**settings)
+    threads.apply_process_settings()
+
+    module_name = MODE_REGISTRY[mode_name].split(":")[0]
+    config = import_module(module_name).HANDS_CONFIG
+    inference = HandInference(get_hands(config), infer_width)
+
+    decoded = Queue(maxsize=2)
+
+    def capture():
+        threads.pin_thread("capture")
+        for jpeg in frames:
+            decoded.put(cv2.flip(cv2.imdecode(jpeg, cv2.IMREAD_COLOR), 1))
+        decoded.put(None)
+
+    threads.pin_thread("inference")
+    Thread(target=capture, daemon=True).start()
+
+    timings = []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    while True:
+        frame = decoded.get()
+        if frame is None:
+            break
+        start = time.perf_counter()
+        inference.process(frame)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    results.put((len(timings) / wall, timings, cpu * 1000 / len(timings)))
+
+
+# ================= MAIN =================
+def collect(process, results, timeout):
+    """
+    (result, None) from the child, or (None, why) if it exited without a
+    result (e.g. mediapipe failed to import) or ran past `timeout` seconds.
+    """
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            return results.get(timeout=POLL_SECONDS), None
+        except Empty:
+            pass
+
+        if process.exitcode is not None:
+            # It may have exited right after putting its result
+            try:
+                return results.get(timeout=POLL_SECONDS), None
+            except Empty:
+                return None, f"failed, exit code {process.exitcode}"
+        if time.perf_counter() > deadline:
+            process.terminate()
+            return None, f"timed out after {timeout:g} s"
+
+
+def describe(settings):
+    def show(value):
+        if value is None:
+            return "-"
+        if isinstance(value, list):
+            return ",".join(map(str, value))
+        return str(value)
+
+    return (f"{show(settings['opencv_threads']):>4} "
+            f"{show(settings['inference_threads']):>4} "
+            f"{show(settings['capture_cpus']):>8} "
+            f"{show(settings['inference_cpus']):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--video")
+    parser.add_argument("--camera", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--mode", default="Mouse", choices=list(MODE_REGISTRY))
+    parser.add_argument("--infer-width", type=int)
+    parser.add_argument("--raise-priority", action="store_true")
+    parser.add_argument("--timeout", type=float, default=300,
+                        help="seconds before a setting's run is given up")
+    parser.add_argument("--save", action="store_true",
+                        help="write the fastest setting to thread_config.json")
+    args = parser.parse_args()
+
+    frames = load_frames(args)
+    if not frames:
+        raise SystemExit("No frames captured")
+
+    cpu_count = os.cpu_count() or 1
+    print(f"{len(frames)} frames, {args.mode} mode, {cpu_count} CPUs\n")
+    print(f"{'cv2':>4} {'mp':>4} {'capture':>8} {'inference':>12} "
+          f"{'fps':>7} {'ms p50':>8} {'ms p95':>8} {'cpu ms':>8}")
+
+    context = get_context("spawn")
+    results = context.Queue()
+    best = None
+
+    for settings in settings_grid(cpu_count, args.raise_priority):
+        process = context.Process(
+            target=run_setting,
+            args=(settings, args.mode, args.infer_width, frames, results)
+        )
+        process.start()
+        result, failure = collect(process, results, args.timeout)
+        process.join()
+
+        if failure:
+            print(f"{describe(settings)}   {failure}")
+            continue
+
+        fps, timings, cpu_ms = result
+        p95 = np.percentile(timings, 95)
+        print(f"{describe(settings)} {fps:7.1f} {np.median(timings):8.2f} "
+              f"{p95:8.2f} {cpu_ms:8.2f}")
+
+        # Lowest tail latency wins; CPU per frame breaks near-ties
+        score = (round(p95, 1), cpu_ms)
+        if best is None or score < best[0]:
+            best = (score, settings)
+
+    if best is None:
+        raise SystemExit("\nEvery setting failed")
+
+    print(f"\nFastest: {describe(best[1])}")
+    if args.save:
+        from runtime.threads import save_config
+        save_config(best[1])
+        print("Saved to thread_config.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,227 @@
+import time
+from threading import Condition, Thread
+
 import cv2
 
+from camera.probe import apply_mode, capture_backend, choose_mode, device_modes
+from runtime.threads import pin_thread
+
+# A source timestamp further than this from our monotonic clock is
+# assumed to come from some other clock and is not used for timing
+SOURCE_CLOCK_TOLERANCE = 1.0
+READ_TIMEOUT = 2.0
+
+
+class Frame:
+    """
+    A captured image plus its capture metadata.
+    - seq: sequence number assigned by CameraInput (1, 2, 3, ...);
+      a buffer the driver hands back again keeps its previous seq
+    - t: capture time on the time.perf_counter() clock
+    - t_source: backend timestamp in seconds, or None if unavailable
+    """
+
+    __slots__ = ("image", "seq", "t", "t_source")
+
+    def __init__(self, image, seq, t, t_source=None):
+        self.image = image
+        self.seq = seq
+        self.t = t
+        self.t_source = t_source
+
+
+class FrameStats:
+    """
+    Gap / duplicate / drop accounting for a frame source.
+    Uses the backend timestamp when there is one, capture time otherwise.
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.gaps = 0
+        self.dropped = 0
+        self.duplicates = 0
+        self.period = None
+        self._last = None
+
+    def update(self, stamp):
+        self.frames += 1
+        last, self._last = self._last, stamp
+        if last is None or not self.period:
+            return
+
+        interval = stamp - last
+        if interval <= 0.25 * self.period:
+            # Driver handed us the same (or a buffered) frame again
+            self.duplicates += 1
+            return
+
+        missed = round(interval / self.period) - 1
+        if missed > 0:
+            self.gaps += 1
+            self.dropped += missed
+
+    def restart(self, period):
+        self.period = period
+        self._last = None
+
+
+class _MjpegReader:
+    """
+    Grabs raw MJPG buffers and decodes them on a worker thread, so
+    JPEG decode overlaps with inference instead of stalling the loop.
+    Keeps only the newest decoded frame.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.running = True
+        self.latest = None
+        self.count = 0
+        self._ready = Condition()
+
+        self._thread = Thread(target=self._run, name="mjpeg-decode",
+                              daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        pin_thread("capture")
+        while self.running:
+            if not self.cap.grab():
+                break
+            t = time.perf_counter()
+            t_source = _source_time(self.cap)
+
+            ok, raw = self.cap.retrieve()
+            image = cv2.imdecode(raw, cv2.IMREAD_COLOR) if ok else None
+            if image is None:
+                continue
+
+            with self._ready:
+                self.latest = (cv2.flip(image, 1), t, t_source)
+                self.count += 1
+                self._ready.notify_all()
+
+        with self._ready:
+            self.running = False
+            self._ready.notify_all()
+
+    def next(self, after):
+        """Newest frame once more than `after` frames were decoded."""
+        with self._ready:
+            self._ready.wait_for(
+                lambda: self.count > after or not self.running,
+                READ_TIMEOUT
+            )
+            if self.count <= after:
+                return None, after
+            return self.latest, self.count
+
+    def stop(self):
+        self.running = False
+        self._thread.join()
+
+
+def _source_time(cap):
+    # V4L2 / MSMF report the buffer timestamp in milliseconds
+    return cap.get(cv2.CAP_PROP_POS_MSEC) / 1000 or None
+
+
 class CameraInput:
-    def __init__(self, cam_index=0):
-        self.cap = cv2.VideoCapture(cam_index)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    def __init__(self, cam_index=0, width=640, height=480, fps=30):
+        self.cam_index = cam_index
+        self.cap = cv2.VideoCapture(cam_index, capture_backend())
+        self.modes = device_modes(cam_index, self.cap)
+        self.size = None
+        self.fps = None
+        self.mode = None
+        self.seq = 0
+        self.stats = FrameStats()
+        self._last_source = None
+
+        self._reader = None
+        self._decoded = 0
+
+        self.configure(width, height, fps)
+
+    def configure(self, width, height, fps=30):
+        # Changing the capture mode is much cheaper than reopening
+        if self.size == (width, height) and self.fps == fps:
+            return
+        self._stop_reader()
+
+        self.mode = choose_mode(self.modes, width, height, fps)
+        if self.mode:
+            # At the rate asked for, not the mode's listed one: a mode
+            # probed by trial only knows the rate it accepted for
+            # CANDIDATE_FPS, which is far above the idle rate
+            apply_mode(self.cap, self.mode, fps)
+        else:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.size = (width, height)
+        self.fps = fps
+
+        actual_fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.stats.restart(1 / actual_fps if actual_fps > 0 else None)
+
+        if self.mode and self.mode.fourcc == "MJPG":
+            self._start_reader()
+
+    # ================= MJPG DECODE THREAD =================
+    def _start_reader(self):
+        # Ask the backend for the undecoded JPEG buffer; backends that
+        # ignore this hand back a BGR image and we decode inline instead
+        self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+        ok, raw = self.cap.read()
+        if not ok or raw.ndim == 3 or raw.shape[0] != 1:
+            self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+            return
+
+        self._reader = _MjpegReader(self.cap)
+        self._decoded = 0
+
+    def _stop_reader(self):
+        if self._reader:
+            self._reader.stop()
+            self._reader = None
+            self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+
+    # ================= FRAMES =================
+    def read(self):
+        """Return the next mirrored Frame, or None when capture fails."""
+        if self._reader:
+            latest, self._decoded = self._reader.next(self._decoded)
+            if latest is None:
+                return None
+            image, t, t_source = latest
+        else:
+            success, image = self.cap.read()
+            t = time.perf_counter()
+            if not success:
+                return None
+            t_source = _source_time(self.cap)
+            image = cv2.flip(image, 1)
+
+        # On Linux the V4L2 timestamp is on CLOCK_MONOTONIC, so it can
+        # back-date the capture time to when the sensor delivered it
+        if t_source is not None:
+            age = time.monotonic() - t_source
+            if 0 <= age < SOURCE_CLOCK_TOLERANCE:
+                t = time.perf_counter() - age
+
+        # Same backend timestamp as last time: a repeated buffer
+        if t_source is None or t_source != self._last_source:
+            self.seq += 1
+        self._last_source = t_source
+        self.stats.update(t_source if t_source is not None else t)
 
+        return Frame(image, self.seq, t, t_source)
 
     def get_frame(self):
-        success, frame = self.cap.read()
-        if not success:
-            return None
-        return cv2.flip(frame, 1)
+        frame = self.read()
+        return frame.image if frame is not None else None
 
     def release(self):
+        self._stop_reader()
         self.cap.release()
@@ -0,0 +1,110 @@
+"""
+Serve a video file (or a test pattern) as an MJPEG-over-HTTP stream.
+
+A local stand-in for a network camera, to try camera/network.py
+without one: point CAMERA_SOURCE in runtime/vision.py at the printed
+URL. --drop-every closes each connection after that many frames, to
+exercise reconnection.
+
+Run from the gesture_control_app directory:
+    python -m camera.mjpeg_server --video hands.mp4
+    python -m camera.mjpeg_server --size 1280x720 --fps 60 --drop-every 300
+"""
+
+import argparse
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+import numpy as np
+
+BOUNDARY = "frame"
+
+
+def load_jpegs(args):
+    """The stream's frames, JPEG-encoded once up front."""
+    width, height = map(int, args.size.split("x"))
+    frames = []
+    if args.video:
+        cap = cv2.VideoCapture(args.video)
+        while len(frames) < args.frames:
+            ok, image = cap.read()
+            if not ok:
+                break
+            frames.append(image)
+        cap.release()
+    else:
+        # A bright square circling on a gradient
+        base = np.tile(np.linspace(40, 160, width, dtype=np.uint8), (height, 1))
+        for i in range(args.frames):
+            image = cv2.cvtColor(base, cv2.COLOR_GRAY2BGR)
+            angle = 2 * np.pi * i / args.frames
+            x = int(width / 2 + width / 3 * np.cos(angle))
+            y = int(height / 2 + height / 3 * np.sin(angle))
+            cv2.rectangle(image, (x - 40, y - 40), (x + 40, y + 40),
+                          (255, 255, 255), -1)
+            frames.append(image)
+
+    quality = [cv2.IMWRITE_JPEG_QUALITY, args.quality]
+    return [cv2.imencode(".jpg", image, quality)[1].tobytes() for image in frames]
+
+
+def make_handler(jpegs, fps, drop_every):
+    class StreamHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type",
+                             f"multipart/x-mixed-replace; boundary={BOUNDARY}")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+
+            sent = 0
+            next_time = time.perf_counter()
+            try:
+                while not drop_every or sent < drop_every:
+                    jpeg = jpegs[sent % len(jpegs)]
+                    self.wfile.write(
+                        f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                        f"Content-Length: {len(jpeg)}\r\n\r\n".encode()
+                        + jpeg + b"\r\n"
+                    )
+                    sent += 1
+                    next_time += 1 / fps
+                    time.sleep(max(0.0, next_time - time.perf_counter()))
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    return StreamHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--video")
+    parser.add_argument("--size", default="640x480", help="test pattern size")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--quality", type=int, default=85)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--drop-every", type=int, default=0,
+                        help="close connections after this many frames")
+    args = parser.parse_args()
+
+    jpegs = load_jpegs(args)
+    if not jpegs:
+        raise SystemExit("No frames to serve")
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port),
+                                 make_handler(jpegs, args.fps, args.drop_every))
+    print(f"Serving {len(jpegs)} frames at {args.fps:g} fps on "
+          f"http://127.0.0.1:{args.port}/stream")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
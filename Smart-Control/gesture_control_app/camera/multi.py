@@ -0,0 +1,399 @@
+import queue
+import time
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from camera.camera_input import READ_TIMEOUT, Frame, FrameStats
+from runtime.results import make_results
+
+# ---------------- CONFIG ----------------
+MAX_FRAME_SIZE = (1280, 720)    # largest image a camera process can hand over
+FRAME_SLOTS = 3                 # per camera: newest, being read, being written
+MAX_HANDS = 2
+SYNC_WINDOW = 0.05              # results this close to the newest are "now"
+SWITCH_MARGIN = 0.05            # confidence a camera needs over the current one
+MIN_FUSE_SCORE = 0.6            # weakest view that still joins a fusion
+SELECTION = "best"              # "best" camera, or "fuse" its hands with others'
+
+DEFAULT_HANDS_CONFIG = dict(
+    max_num_hands=MAX_HANDS,
+    min_detection_confidence=0.6,
+    min_tracking_confidence=0.6
+)
+# ----------------------------------------
+
+_SIDES = ("Left", "Right")
+
+# Per-slot header in front of the images. `seq` is 0 while the camera
+# process writes the slot and the slot's frame number once it is done,
+# so a reader that sees the same non-zero seq before and after copying
+# knows the landmarks and image belong together and weren't torn.
+SLOT_DTYPE = np.dtype([
+    ("seq", "<i8"), ("t", "<f8"), ("h", "<i4"), ("w", "<i4"),
+    ("hands", "<i4"), ("sides", "i1", (MAX_HANDS,)),
+    ("scores", "<f4", (MAX_HANDS,)), ("points", "<f4", (MAX_HANDS, 21, 3))
+])
+# Control words: the newest finished slot, and the slot the reader is
+# copying (-1 for none); the camera process writes into neither
+LATEST, READING = 0, 1
+_CONTROL_BYTES = 64
+_IMAGES_OFFSET = -(-(_CONTROL_BYTES + FRAME_SLOTS * SLOT_DTYPE.itemsize) // 64) * 64
+
+
+def _shm_size():
+    width, height = MAX_FRAME_SIZE
+    return _IMAGES_OFFSET + FRAME_SLOTS * width * height * 3
+
+
+def _shm_views(buf):
+    """(control, slot headers, slot images) over one camera's shared memory."""
+    width, height = MAX_FRAME_SIZE
+    control = np.ndarray(2, np.int64, buf)
+    headers = np.ndarray(FRAME_SLOTS, SLOT_DTYPE, buf, _CONTROL_BYTES)
+    images = np.ndarray((FRAME_SLOTS, height, width, 3), np.uint8, buf,
+                        _IMAGES_OFFSET)
+    return control, headers, images
+
+
+# ================= CAMERA PROCESS =================
+def _camera_main(source, size, shm_name, ready, commands, stop):
+    """Capture and hand tracking for one camera, in its own process."""
+    import cv2
+    from camera.network import open_source
+    from runtime.inference import HandInference
+    from runtime.vision import get_hands
+
+    cv2.setNumThreads(1)    # one process per camera is the parallelism
+
+    shm = SharedMemory(name=shm_name)
+    control, headers, images = _shm_views(shm.buf)
+    width, height = MAX_FRAME_SIZE
+
+    camera = open_source(source, *size)
+    hands = HandInference(get_hands(DEFAULT_HANDS_CONFIG))
+    frames = 0
+    slot = 0
+    last_seq = 0
+
+    try:
+        while not stop.is_set():
+            while True:
+                try:
+                    command, *args = commands.get_nowait()
+                except queue.Empty:
+                    break
+                if command == "hands":
+                    config, infer_width = args
+                    hands = HandInference(get_hands(config), infer_width)
+                elif command == "size":
+                    camera.configure(*args)
+
+            frame = camera.read()
+            if frame is None:
+                time.sleep(0.1)
+                continue
+            if frame.seq == last_seq:
+                continue                    # a network stream that is down
+            last_seq = frame.seq
+
+            image = frame.image
+            h, w = image.shape[:2]
+            if w > width or h > height:
+                scale = min(width / w, height / h)
+                image = cv2.resize(image, (int(w * scale), int(h * scale)),
+                                   interpolation=cv2.INTER_AREA)
+                h, w = image.shape[:2]
+
+            result = hands.process(image)
+            detected = (result.multi_hand_landmarks or [])[:MAX_HANDS]
+            handedness = result.multi_handedness or []
+
+            # Never the newest slot (the reader may be about to take it)
+            # nor the one being copied
+            busy = (control[LATEST], control[READING])
+            for step in range(1, FRAME_SLOTS + 1):
+                if (slot + step) % FRAME_SLOTS not in busy:
+                    break
+            slot = (slot + step) % FRAME_SLOTS
+
+            header = headers[slot:slot + 1]
+            header["seq"] = 0
+            images[slot, :h, :w] = image
+            header["t"], header["h"], header["w"] = frame.t, h, w
+            header["hands"] = len(detected)
+            for k, hand in enumerate(detected):
+                header["points"][0, k] = [(lm.x, lm.y, lm.z) for lm in hand.landmark]
+                label = handedness[k].classification[0] if k < len(handedness) else None
+                header["sides"][0, k] = _SIDES.index(label.label) if label else 1
+                header["scores"][0, k] = label.score if label else 0.0
+            frames += 1
+            header["seq"] = frames
+
+            control[LATEST] = slot
+            ready.set()
+    finally:
+        camera.release()
+        del control, headers, images
+        shm.close()
+
+
+# ================= SELECTION =================
+class CameraView:
+    """The newest hand-tracking result of one camera."""
+
+    __slots__ = ("index", "seq", "t", "slot", "shape", "points", "sides", "scores")
+
+    def __init__(self, index, slot, header):
+        count = int(header["hands"])
+        self.index = index
+        self.slot = slot
+        self.seq = int(header["seq"])
+        self.t = float(header["t"])
+        self.shape = (int(header["h"]), int(header["w"]))
+        self.points = header["points"][:count].copy()
+        self.sides = [_SIDES[side] for side in header["sides"][:count]]
+        self.scores = [float(score) for score in header["scores"][:count]]
+
+    @property
+    def confidence(self):
+        return max(self.scores, default=0.0)
+
+
+def fuse(primary, others, transforms=None):
+    """
+    (points, side, score) hands of `primary`, each averaged with the
+    same-handed hand of the other views, weighted by score. `transforms`
+    maps a camera index to a 3x3 homography from its normalised image
+    coordinates into the primary's; cameras without one are taken as
+    seeing the same image coordinates.
+    """
+    hands = []
+    for k, side in enumerate(primary.sides):
+        total = primary.scores[k]
+        fused = primary.points[k] * total
+        for view in others:
+            if side not in view.sides:
+                continue
+            j = view.sides.index(side)
+            score = view.scores[j]
+            if score < MIN_FUSE_SCORE:
+                continue
+            points = view.points[j]
+            matrix = (transforms or {}).get(view.index)
+            if matrix is not None:
+                points = points.copy()
+                xy1 = np.c_[points[:, :2], np.ones(21)] @ np.asarray(matrix).T
+                points[:, :2] = xy1[:, :2] / xy1[:, 2:3]
+            fused = fused + points * score
+            total += score
+        hands.append((fused / total, side, primary.scores[k]))
+    return hands
+
+
+# ================= MULTI CAMERA =================
+class MultiCamera:
+    """
+    N cameras, each captured and tracked in its own process, behind the
+    CameraInput interface. Each camera process writes its frame and
+    landmarks into a shared-memory slot and marks it as its newest;
+    results are never queued, so a slow reader skips frames instead of
+    getting old ones. read() takes the newest result of every camera,
+    picks the one seeing the hand with the highest confidence (with a
+    margin against flicker) and returns that camera's frame. `results`
+    then holds the chosen hands, which MultiCameraHands hands to the
+    mode in place of its own inference.
+
+    SELECTION = "fuse" also averages each hand with the same hand seen
+    by the other cameras (score-weighted, within SYNC_WINDOW). Views are
+    only comparable in image coordinates when the cameras are aligned
+    or `transforms` maps them (see fuse()).
+    """
+
+    def __init__(self, sources, width=640, height=480, fps=30,
+                 selection=SELECTION, transforms=None):
+        self.sources = list(sources)
+        self.selection = selection
+        self.transforms = transforms
+        self.size = (width, height)
+        self.fps = fps
+        self.mode = None
+        self.seq = 0
+        self.stats = FrameStats()
+        self.current = 0
+        self.results = make_results([])
+        self.switches = 0
+
+        context = get_context("spawn")
+        self._ready = context.Event()
+        self._stop = context.Event()
+        self._latest = {}
+        self._taken = [0] * len(self.sources)
+        self._shm = []
+        self._views = []
+        self._commands = []
+        self._processes = []
+
+        for index, source in enumerate(self.sources):
+            shm = SharedMemory(create=True, size=_shm_size())
+            views = _shm_views(shm.buf)
+            views[0][:] = -1            # no newest slot, nothing being read
+            views[1]["seq"] = 0
+            commands = context.Queue()
+            process = context.Process(
+                target=_camera_main,
+                args=(source, self.size, shm.name, self._ready,
+                      commands, self._stop),
+                name=f"camera-{index}", daemon=True
+            )
+            process.start()
+            self._shm.append(shm)
+            self._views.append(views)
+            self._commands.append(commands)
+            self._processes.append(process)
+
+    # ================= COMMANDS =================
+    def _send(self, *command):
+        for commands in self._commands:
+            commands.put(command)
+
+    def configure(self, width, height, fps=30):
+        if (width, height) != self.size or fps != self.fps:
+            self.size = (width, height)
+            self.fps = fps
+            self._send("size", width, height, fps)
+
+    def set_hands(self, config, infer_width=None):
+        """Tracking config every camera process should use."""
+        self._send("hands", dict(DEFAULT_HANDS_CONFIG, **config), infer_width)
+
+    # ================= FRAMES =================
+    def _take(self, index):
+        """The camera's newest result if it is new to us, else None."""
+        control, headers, _ = self._views[index]
+        slot = int(control[LATEST])
+        if slot < 0:
+            return None
+
+        control[READING] = slot
+        try:
+            header = headers[slot].copy()
+            if (header["seq"] <= self._taken[index]
+                    or headers[slot]["seq"] != header["seq"]):
+                return None     # nothing new, or overwritten while copying
+        finally:
+            control[READING] = -1
+
+        self._taken[index] = int(header["seq"])
+        return CameraView(index, slot, header)
+
+    def _copy_image(self, view):
+        """The view's image, or None if its slot has been reused since."""
+        control, headers, images = self._views[view.index]
+        control[READING] = view.slot
+        try:
+            if headers[view.slot]["seq"] != view.seq:
+                return None
+            h, w = view.shape
+            image = images[view.slot, :h, :w].copy()
+            if headers[view.slot]["seq"] != view.seq:
+                return None     # torn: the camera wrote while we copied
+        finally:
+            control[READING] = -1
+        return image
+
+    def _drain(self, timeout):
+        """Take every camera's new result; wait up to `timeout` for one."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            # Cleared before looking, so a result published meanwhile
+            # still wakes the wait below
+            self._ready.clear()
+            found = False
+            for index in range(len(self.sources)):
+                view = self._take(index)
+                if view is not None:
+                    self._latest[index] = view
+                    found = True
+            if found:
+                return True
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not self._ready.wait(remaining):
+                return False
+
+    def _select(self):
+        newest = max(view.t for view in self._latest.values())
+        fresh = [view for view in self._latest.values()
+                 if newest - view.t <= SYNC_WINDOW]
+
+        best = max(fresh, key=lambda view: view.confidence)
+        current = self._latest.get(self.current)
+        if (current is not None and current in fresh and current is not best
+                and best.confidence < current.confidence + SWITCH_MARGIN):
+            best = current
+        if best.index != self.current:
+            self.current = best.index
+            self.switches += 1
+
+        hands = [(best.points[k], side, best.scores[k])
+                 for k, side in enumerate(best.sides)]
+        if self.selection == "fuse" and hands:
+            others = [view for view in fresh if view is not best]
+            hands = fuse(best, others, self.transforms)
+        return best, make_results(hands)
+
+    def read(self):
+        while True:
+            if not self._drain(READ_TIMEOUT):
+                return None
+            view, results = self._select()
+            # Landmarks and image must be the same frame; if the slot was
+            # reused, that camera has a newer result to take instead
+            image = self._copy_image(view)
+            if image is not None:
+                break
+            self._latest.pop(view.index, None)
+        self.results = results
+
+        self.seq += 1
+        self.stats.update(view.t)
+        return Frame(image, self.seq, view.t)
+
+    def get_frame(self):
+        frame = self.read()
+        return frame.image if frame is not None else None
+
+    def release(self):
+        self._stop.set()
+        for process in self._processes:
+            process.join(2.0)
+            if process.is_alive():
+                process.terminate()
+        self._views = []
+        for shm in self._shm:
+            shm.close()
+            shm.unlink()
+
+
+class MultiCameraHands:
+    """
+    HandInference stand-in for a MultiCamera: inference already ran in
+    the camera processes, so process() returns the hands chosen for the
+    frame the camera returned last.
+    """
+
+    def __init__(self, camera, config, infer_width=None):
+        self.camera = camera
+        self.infer_width = infer_width
+        self.config = config
+        camera.set_hands(config, infer_width)
+
+    def set_width(self, infer_width):
+        if infer_width != self.infer_width:
+            self.infer_width = infer_width
+            self.camera.set_hands(self.config, infer_width)
+
+    def process(self, image):
+        return self.camera.results
@@ -0,0 +1,266 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Condition, Event, Thread
+from urllib.request import urlopen
+
+import cv2
+import numpy as np
+
+from camera.camera_input import READ_TIMEOUT, CameraInput, Frame, FrameStats
+from runtime.threads import pin_thread
+
+# ---------------- CONFIG ----------------
+DECODE_THREADS = 3          # JPEG decoders; cv2.imdecode releases the GIL
+CONNECT_TIMEOUT = 5.0
+RECONNECT_MIN = 0.5         # first retry delay, doubled up to RECONNECT_MAX
+RECONNECT_MAX = 8.0
+MIRROR = True               # flip like the local camera (selfie view)
+# ----------------------------------------
+
+
+class NetworkSource:
+    """
+    Frame source for a camera on another machine, with the interface of
+    CameraInput (read / get_frame / configure / release / stats).
+
+    A receiver thread pulls the stream and reconnects with exponential
+    backoff whenever it drops. Only the newest decoded frame is kept:
+    read() returns it once, and while the stream is down it returns the
+    last frame again (same seq) instead of ending the mode; before the
+    first frame arrives, a blank one with seq 0. Only release() makes
+    read() return None.
+    """
+
+    name = "network"
+
+    def __init__(self, url, mirror=MIRROR):
+        self.url = url
+        self.mirror = mirror
+        self.size = None
+        self.fps = None
+        self.mode = None
+        self.seq = 0                 # frames received, decoded or not
+        self.stats = FrameStats()
+        self.connected = False
+        self.reconnects = 0
+
+        self._stop = Event()
+        self._ready = Condition()
+        self._latest = None
+        self._returned = 0
+
+        self._thread = Thread(target=self._run, name=f"{self.name}-receive",
+                              daemon=True)
+        self._thread.start()
+
+    # ================= RECEIVER THREAD =================
+    def _run(self):
+        pin_thread("capture")
+        delay = RECONNECT_MIN
+        while not self._stop.is_set():
+            received = self.seq
+            error = "stream ended"
+            try:
+                self._stream()
+            except (OSError, ValueError) as e:
+                error = e
+            self.connected = False
+            if self._stop.is_set():
+                break
+
+            # A connection that delivered frames starts the backoff over
+            if self.seq > received:
+                delay = RECONNECT_MIN
+            print(f"[Camera] {self.url}: {error}; reconnecting in {delay:.1f}s")
+            self.reconnects += 1
+            self._stop.wait(delay)
+            delay = min(delay * 2, RECONNECT_MAX)
+
+    def _stream(self):
+        """Receive until the stream ends; raise OSError on failure."""
+        raise NotImplementedError
+
+    def _publish(self, image, seq, t):
+        if self.mirror:
+            image = cv2.flip(image, 1)
+        with self._ready:
+            # Decoders can finish out of order; never go back in time
+            if self._latest is None or seq > self._latest.seq:
+                self._latest = Frame(image, seq, t)
+                self._ready.notify_all()
+
+    # ================= FRAMES =================
+    def read(self):
+        """Newest Frame not returned yet; the previous one while the stream is down."""
+        with self._ready:
+            self._ready.wait_for(
+                lambda: (self._latest is not None
+                         and self._latest.seq > self._returned)
+                or self._stop.is_set(),
+                READ_TIMEOUT
+            )
+            frame = self._latest
+        if self._stop.is_set():
+            return None
+        if frame is None:
+            # Not connected yet: a placeholder the loop sees as a repeat
+            width, height = self.size or (640, 480)
+            return Frame(np.zeros((height, width, 3), np.uint8), 0,
+                         time.perf_counter())
+        self._returned = frame.seq
+        return frame
+
+    def get_frame(self):
+        frame = self.read()
+        return frame.image if frame is not None else None
+
+    def configure(self, width, height, fps=30):
+        # The remote camera's mode is not ours to change
+        self.size = (width, height)
+        self.fps = fps
+
+    def release(self):
+        self._stop.set()
+        with self._ready:
+            self._ready.notify_all()
+        self._thread.join(CONNECT_TIMEOUT)
+
+
+class MjpegSource(NetworkSource):
+    """
+    MJPEG over HTTP (multipart/x-mixed-replace, as IP cameras and
+    mjpg-streamer serve it). JPEG decode runs on a pool of
+    DECODE_THREADS; when every decoder is busy the newly received frame
+    is skipped (counted in stats.dropped) rather than queued, so a slow
+    machine shows recent frames at a lower rate instead of falling behind.
+    """
+
+    name = "mjpeg"
+
+    def __init__(self, url, mirror=MIRROR, decode_threads=DECODE_THREADS):
+        self._pool = ThreadPoolExecutor(decode_threads,
+                                        thread_name_prefix="mjpeg-decode")
+        self._slots = BoundedSemaphore(decode_threads)
+        super().__init__(url, mirror)
+
+    def _stream(self):
+        with urlopen(self.url, timeout=CONNECT_TIMEOUT) as response:
+            content_type = response.headers.get("Content-Type", "")
+            if "multipart" not in content_type:
+                raise ValueError(f"not an MJPEG stream ({content_type})")
+            self.connected = True
+
+            while not self._stop.is_set():
+                jpeg = _read_part(response)
+                if jpeg is None:
+                    return
+                self.seq += 1
+                t = time.perf_counter()
+                self.stats.update(t)
+
+                if not self._slots.acquire(blocking=False):
+                    self.stats.dropped += 1
+                    continue
+                self._pool.submit(self._decode, jpeg, self.seq, t)
+
+    def _decode(self, jpeg, seq, t):
+        try:
+            image = cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+            if image is not None:
+                self._publish(image, seq, t)
+        finally:
+            self._slots.release()
+
+    def release(self):
+        super().release()
+        self._pool.shutdown(wait=False)
+
+
+def _read_part(response):
+    """Next JPEG of a multipart stream, or None at the end."""
+    headers = {}
+    while True:
+        line = response.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if headers:
+                break
+            continue                        # blank line before the boundary
+        if line.startswith(b"--"):
+            continue                        # boundary
+        name, _, value = line.partition(b":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = headers.get(b"content-length")
+    if length is not None:
+        data = response.read(int(length))
+        return data if len(data) == int(length) else None
+
+    # No length: read up to the JPEG end-of-image marker
+    data = bytearray()
+    while not data.endswith(b"\xff\xd9"):
+        chunk = response.read(1)
+        if not chunk:
+            return None
+        data += chunk
+    return bytes(data)
+
+
+class RtspSource(NetworkSource):
+    """
+    RTSP (H.264 / H.265) through OpenCV's FFmpeg backend. Inter-frame
+    video can't be split across a pool by frame, so decode uses
+    FFmpeg's own DECODE_THREADS decoder threads; the receiver thread
+    grabs continuously so the loop always gets the newest frame.
+    """
+
+    name = "rtsp"
+
+    def _stream(self):
+        cap = cv2.VideoCapture(self.url, cv2.CAP_FFMPEG)
+        try:
+            if not cap.isOpened():
+                raise OSError("could not open stream")
+            if hasattr(cv2, "CAP_PROP_N_THREADS"):
+                cap.set(cv2.CAP_PROP_N_THREADS, DECODE_THREADS)
+            self.connected = True
+
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            self.stats.restart(1 / fps if 0 < fps < 240 else None)
+
+            while not self._stop.is_set():
+                ok, image = cap.read()
+                if not ok:
+                    return
+                self.seq += 1
+                t = time.perf_counter()
+                self.stats.update(t)
+                self._publish(image, self.seq, t)
+        finally:
+            cap.release()
+
+
+def open_source(source, width=640, height=480, fps=30):
+    """
+    CameraInput for a device index, a network source for a URL, and a
+    MultiCamera for a list of several sources.
+    """
+    if isinstance(source, (list, tuple)):
+        if len(source) > 1:
+            from camera.multi import MultiCamera
+            return MultiCamera(source, width, height, fps)
+        source = source[0]
+
+    if isinstance(source, str) and not source.isdigit():
+        scheme = source.split("://", 1)[0].lower()
+        if scheme in ("http", "https"):
+            camera = MjpegSource(source)
+        elif scheme in ("rtsp", "rtsps"):
+            camera = RtspSource(source)
+        else:
+            raise ValueError(f"Unsupported camera source: {source}")
+        camera.configure(width, height, fps)
+        return camera
+    return CameraInput(int(source), width, height, fps)
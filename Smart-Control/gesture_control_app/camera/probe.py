@@ -0,0 +1,180 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import namedtuple
+
+import cv2
+
+# ---------------- CONFIG ----------------
+CACHE_PATH = "camera_modes.json"
+CANDIDATE_FOURCCS = ("MJPG", "YUYV")
+CANDIDATE_SIZES = [
+    (1920, 1080), (1280, 720), (960, 540),
+    (848, 480), (640, 480), (320, 240)
+]
+CANDIDATE_FPS = 60
+# ----------------------------------------
+
+CameraMode = namedtuple("CameraMode", "fourcc width height fps")
+
+
+# ================= BACKEND =================
+def capture_backend():
+    """Use V4L2 directly on Linux; let OpenCV pick elsewhere."""
+    return cv2.CAP_V4L2 if sys.platform.startswith("linux") else cv2.CAP_ANY
+
+
+def device_name(cam_index):
+    path = f"/sys/class/video4linux/video{cam_index}/name"
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return f"camera{cam_index}"
+
+
+# ================= LISTING =================
+def list_modes(cam_index, cap=None):
+    """
+    Every (fourcc, width, height, fps) the device offers.
+    Asks v4l2-ctl when it is installed, otherwise probes a set of
+    common modes through OpenCV and keeps what the driver accepts.
+    """
+    modes = _list_modes_v4l2(cam_index)
+    if not modes:
+        modes = _list_modes_by_trial(cam_index, cap)
+    return sorted(set(modes))
+
+
+def _list_modes_v4l2(cam_index):
+    if shutil.which("v4l2-ctl") is None:
+        return []
+
+    try:
+        output = subprocess.run(
+            ["v4l2-ctl", "-d", f"/dev/video{cam_index}",
+             "--list-formats-ext"],
+            capture_output=True, text=True, timeout=5
+        ).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+
+    modes = []
+    fourcc = size = None
+    for line in output.splitlines():
+        match = re.search(r"'(\w{4})'", line)
+        if match and line.strip().startswith("["):
+            fourcc = match.group(1)
+            continue
+
+        match = re.search(r"Size: \w+ (\d+)x(\d+)", line)
+        if match:
+            size = (int(match.group(1)), int(match.group(2)))
+            continue
+
+        match = re.search(r"\(([\d.]+) fps\)", line)
+        if match and fourcc and size:
+            modes.append(CameraMode(fourcc, *size, round(float(match.group(1)))))
+
+    return modes
+
+
+def _list_modes_by_trial(cam_index, cap=None):
+    own_cap = cap is None
+    if own_cap:
+        cap = cv2.VideoCapture(cam_index, capture_backend())
+
+    modes = []
+    for fourcc in CANDIDATE_FOURCCS:
+        for width, height in CANDIDATE_SIZES:
+            apply_mode(cap, CameraMode(fourcc, width, height, CANDIDATE_FPS))
+            actual = CameraMode(
+                _fourcc_str(cap.get(cv2.CAP_PROP_FOURCC)),
+                int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                round(cap.get(cv2.CAP_PROP_FPS))
+            )
+            if actual.width and actual.height:
+                modes.append(actual)
+
+    if own_cap:
+        cap.release()
+    return modes
+
+
+def _fourcc_str(value):
+    code = int(value)
+    return "".join(chr((code >> 8 * i) & 0xFF) for i in range(4))
+
+
+# ================= SELECTION =================
+def choose_mode(modes, width, height, fps):
+    """
+    Best mode for a target: at least the requested size and rate,
+    closest in size, compressed (MJPG) when that is what reaches the
+    rate, then the frame rate closest to the target (the lowest that
+    still reaches it, so a low-power target really slows capture down).
+    """
+    target_area = width * height
+
+    def score(mode):
+        reaches = mode.fps >= fps
+        return (
+            mode.width >= width and mode.height >= height,
+            reaches,
+            -abs(mode.width * mode.height - target_area),
+            mode.fourcc == "MJPG",
+            -mode.fps if reaches else mode.fps
+        )
+
+    return max(modes, key=score) if modes else None
+
+
+def apply_mode(cap, mode, fps=None):
+    """Switch `cap` to `mode`, at `fps` instead of the mode's rate if given."""
+    # FOURCC first: drivers validate size / rate against the format
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode.fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode.width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode.height)
+    cap.set(cv2.CAP_PROP_FPS, fps or mode.fps)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+
+# ================= CACHE =================
+def _load_cache():
+    try:
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    tmp = CACHE_PATH + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp, CACHE_PATH)
+
+
+def device_modes(cam_index, cap=None):
+    """
+    Every mode this device offers, for choose_mode(). Called when the
+    camera opens; the list is cached per device name, so only the first
+    start on a given camera pays for probing, and switching modes later
+    (e.g. to idle) never probes on the frame loop.
+    """
+    key = f"{device_name(cam_index)}|modes"
+    cache = _load_cache()
+
+    if key in cache:
+        return [CameraMode(*mode) for mode in cache[key]]
+
+    modes = list_modes(cam_index, cap)
+    if modes:
+        cache[key] = [list(mode) for mode in modes]
+        _save_cache(cache)
+        print(f"[Camera] {device_name(cam_index)}: {len(modes)} modes")
+    return modes
@@ -1,8 +1,13 @@
 import sys
-from threading import Thread
+from threading import Event, Thread
 
 from models.app_state import AppState
-from models.mode_registry import MODE_REGISTRY
+from models.mode_registry import load_mode
+from runtime import profiler
+from runtime import trace
+from runtime import vision
+from runtime.telemetry import BUS, TelemetryCollector
+from runtime.threads import pin_thread
 
 from views.main_view import MainView
 from views.instruction_view import InstructionView
@@ -22,6 +27,13 @@ class AppController:
         self.state = AppState()
         self.view = MainView(self)
         self.mode_thread = None
+        self.stop_event = None
+
+        # Live FPS / latency / CPU for the telemetry panel
+        self.telemetry = TelemetryCollector(
+            frame_stats=vision.frame_stats
+        )
+        profiler.add_frame_listener(self.telemetry.on_frame)
 
     # ================= APP START =================
     def run(self):
@@ -35,49 +47,158 @@ class AppController:
     def start_mode(self, mode_name):
 
         if self.state.mode_running:
-            self.view.update_status(
-                "⚠ A mode is already running",
-                "#ff4d4d"
-            )
+            self.switch_mode(mode_name)
             return
 
+        self._launch(mode_name, previous_thread=None)
+
+    # ================= SWITCH MODE =================
+    def switch_mode(self, mode_name):
+        """
+        Hot switch: the running loop stops at its next frame and the new
+        mode picks up the same open camera and cached hand tracker.
+        """
+        if (self.state.current_mode == mode_name
+                and not self.stop_event.is_set()):
+            return
+
+        previous_thread = self.mode_thread
+        self.stop_event.set()
+        self._launch(mode_name, previous_thread)
+
+    def _launch(self, mode_name, previous_thread):
         self.state.start_mode(mode_name)
         self.view.update_status(
             f"Running: {mode_name}",
             "#00ffcc"
         )
 
+        self.stop_event = Event()
         self.mode_thread = Thread(
             target=self._run_mode_thread,
-            args=(mode_name,)
+            args=(mode_name, self.stop_event, previous_thread)
         )
         self.mode_thread.daemon = True
         self.mode_thread.start()
 
     # ================= THREAD WRAPPER =================
-    def _run_mode_thread(self, mode_name):
+    def _run_mode_thread(self, mode_name, stop_event, previous_thread):
         try:
-            mode_function = MODE_REGISTRY.get(mode_name)
+            # Only one loop may read the shared camera at a time
+            if previous_thread:
+                previous_thread.join()
+
+            mode_function = load_mode(mode_name)
+            pin_thread("inference")
 
-            if mode_function:
-                mode_function()
+            if mode_function and not stop_event.is_set():
+                _publish_mode(mode_name, "START")
+                mode_function(stop_event)
 
         finally:
-            # When camera window closes
-            self.state.stop_mode()
+            _publish_mode(mode_name, "STOP")
+
+            # Camera window closed or mode stopped; a newer mode
+            # owns the state if we were switched away from
+            if self.stop_event is stop_event:
+                self.state.stop_mode()
+
+                # Tk widgets may only be touched from the UI thread
+                BUS.post("status", ("System Ready", "#aaaaaa"))
+
+    # ================= PROFILING =================
+    def profile_mode(self, seconds):
+        if not self.state.mode_running:
             self.view.update_status(
-                "System Ready",
-                "#aaaaaa"
+                "Start a mode before profiling",
+                "#ffaa00"
             )
+            return
 
-    # ================= STOP MODE (Optional future feature) =================
-    def stop_mode(self):
-        # Currently modes close via ESC in camera window
+        profiler.request_profile(seconds)
         self.view.update_status(
-            "Close camera window to stop mode",
-            "#ffaa00"
+            f"Profiling {self.state.current_mode} for {seconds}s",
+            "#00ffcc"
+        )
+
+    def set_slow_frame_logging(self, enabled):
+        profiler.set_frame_budget(
+            profiler.DEFAULT_FRAME_BUDGET_MS if enabled else None
         )
 
+    # ================= TRACING =================
+    def set_tracing(self, enabled):
+        if enabled:
+            path = trace.start_trace()
+            self.view.update_status(f"Recording trace: {path}", "#00ffcc")
+        else:
+            recorder = trace.stop_trace()
+            if recorder:
+                self.view.update_status(
+                    f"Trace saved: {recorder.path}",
+                    "#aaaaaa"
+                )
+
+    # ================= SESSION RECORDING =================
+    def set_recording(self, enabled):
+        # Imported on first use: the recorder pulls in NumPy, which the
+        # app window doesn't need to open
+        from recording import session
+
+        if enabled:
+            directory = session.start_recording(video=True)
+            self.view.update_status(f"Recording session: {directory}", "#00ffcc")
+        else:
+            recorder = session.stop_recording()
+            if recorder:
+                self.view.update_status(
+                    f"Session saved: {recorder.directory} "
+                    f"({recorder.records} frames)",
+                    "#aaaaaa"
+                )
+
+    # ================= STREAMING =================
+    def set_streaming(self, enabled):
+        from streaming import server as stream
+
+        if enabled:
+            try:
+                stream.start_streaming()
+            except OSError as e:
+                # e.g. the WebSocket port is taken
+                self.view.update_status(f"Streaming failed: {e}", "#ff5555")
+                self.view.streaming_var.set(False)
+                return
+            self.view.update_status(
+                f"Streaming on ws://{stream.WEBSOCKET_HOST}:{stream.WEBSOCKET_PORT}",
+                "#00ffcc"
+            )
+        else:
+            server = stream.stop_streaming()
+            if server:
+                self.view.update_status(
+                    f"Streaming stopped ({server.frames} frames)", "#aaaaaa"
+                )
+
+    # ================= STOP MODE =================
+    def stop_mode(self):
+        # The loop exits at its next frame; the thread wrapper resets state
+        if self.stop_event:
+            self.stop_event.set()
+
     # ================= EXIT APP =================
     def exit_app(self):
-        sys.exit()
\ No newline at end of file
+        trace.stop_trace()
+        if "recording.session" in sys.modules:
+            sys.modules["recording.session"].stop_recording()
+        if "streaming.server" in sys.modules:
+            sys.modules["streaming.server"].stop_streaming()
+        vision.release_all()
+        sys.exit()
+
+
+def _publish_mode(mode_name, state):
+    # The streaming server module is loaded by the modes or the toggle
+    stream = sys.modules.get("streaming.server")
+    if stream is not None:
+        stream.publish_mode(mode_name, state)
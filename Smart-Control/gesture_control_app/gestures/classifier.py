@@ -0,0 +1,241 @@
+import os
+
+import numpy as np
+
+# ---------------- CONFIG ----------------
+KNN_K = 5
+MLP_HIDDEN = 32
+MLP_EPOCHS = 300
+MLP_LEARNING_RATE = 0.01
+MLP_WEIGHT_DECAY = 1e-4
+FRAME_ASPECT = 640 / 480    # width / height of the frames, unless told otherwise
+# ----------------------------------------
+
+WRIST = 0
+MIDDLE_MCP = 9
+FINGERTIPS = [4, 8, 12, 16, 20]
+_PAIR_I, _PAIR_J = np.triu_indices(len(FINGERTIPS), k=1)
+
+
+# ================= FEATURES =================
+def landmark_features(points, right=None, aspect=FRAME_ASPECT):
+    """
+    Rotation / scale / position invariant features for (N, 21, 3) or
+    (21, 3) landmarks: the hand is moved to the wrist, turned so the
+    wrist -> middle knuckle axis points up, scaled to that length and
+    left hands are mirrored onto right hands. `aspect` is the frame's
+    width / height (one per hand, or one for all).
+
+    Returns (N, 52): 21 normalised (x, y) points and the 10 pairwise
+    fingertip distances.
+    """
+    points = np.asarray(points, dtype=np.float32)
+    single = points.ndim == 2
+    if single:
+        points = points[None]
+
+    xy = points[:, :, :2] - points[:, WRIST:WRIST + 1, :2]
+    # x and y are fractions of the frame's width and height; rotating
+    # them before bringing both to the same unit would shear the hand
+    xy[:, :, 0] *= np.asarray(aspect, np.float32).reshape(-1, 1)
+    axis = xy[:, MIDDLE_MCP]
+    length = np.linalg.norm(axis, axis=1, keepdims=True)
+    length[length == 0] = 1.0
+
+    # Rotate each hand so `axis` maps to (0, -1): image y points down
+    cos = -axis[:, 1:2] / length
+    sin = -axis[:, 0:1] / length
+    x = (xy[:, :, 0] * cos - xy[:, :, 1] * sin) / length
+    y = (xy[:, :, 0] * sin + xy[:, :, 1] * cos) / length
+
+    if right is False:
+        x = -x
+    elif right is not None and right is not True:
+        x = np.where(np.asarray(right, dtype=bool).reshape(-1, 1), x, -x)
+
+    tip_x = x[:, FINGERTIPS]
+    tip_y = y[:, FINGERTIPS]
+    tip_distances = np.hypot(tip_x[:, _PAIR_I] - tip_x[:, _PAIR_J],
+                             tip_y[:, _PAIR_I] - tip_y[:, _PAIR_J])
+
+    features = np.concatenate([x, y, tip_distances], axis=1)
+    return features[0] if single else features
+
+
+# ================= BACKENDS =================
+class _KNN:
+    """k nearest neighbours with the training set's squared norms precomputed."""
+
+    def __init__(self, train, targets, k=KNN_K):
+        self.train = train.astype(np.float32)
+        self.targets = targets.astype(np.int32)
+        self.k = k
+        self.norms = np.einsum("ij,ij->i", self.train, self.train)
+
+    def scores(self, x, n_classes):
+        # |a - b|^2 = |a|^2 - 2 a.b + |b|^2; |a|^2 doesn't change the ranking
+        distances = self.norms[None, :] - 2 * x @ self.train.T
+        k = min(self.k, len(self.train))
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        votes = np.zeros((len(x), n_classes), np.float32)
+        np.add.at(votes, (np.arange(len(x))[:, None], self.targets[nearest]), 1)
+        return votes / k
+
+    def arrays(self):
+        return dict(knn_train=self.train, knn_targets=self.targets,
+                    knn_k=np.int32(self.k))
+
+    @classmethod
+    def from_arrays(cls, data):
+        return cls(data["knn_train"], data["knn_targets"], int(data["knn_k"]))
+
+
+class _MLP:
+    """One hidden ReLU layer and a softmax output."""
+
+    def __init__(self, w1, b1, w2, b2):
+        self.w1, self.b1, self.w2, self.b2 = w1, b1, w2, b2
+
+    @classmethod
+    def train(cls, x, targets, n_classes, hidden=MLP_HIDDEN,
+              epochs=MLP_EPOCHS, lr=MLP_LEARNING_RATE,
+              weight_decay=MLP_WEIGHT_DECAY, seed=0):
+        rng = np.random.default_rng(seed)
+        params = [
+            rng.normal(0, np.sqrt(2 / x.shape[1]), (x.shape[1], hidden)),
+            np.zeros(hidden),
+            rng.normal(0, np.sqrt(1 / hidden), (hidden, n_classes)),
+            np.zeros(n_classes),
+        ]
+        moments = [np.zeros_like(p) for p in params]
+        velocities = [np.zeros_like(p) for p in params]
+        onehot = np.eye(n_classes)[targets]
+
+        # Full-batch Adam: training sets are a few thousand frames
+        for step in range(1, epochs + 1):
+            w1, b1, w2, b2 = params
+            h = np.maximum(x @ w1 + b1, 0)
+            p = _softmax(h @ w2 + b2)
+
+            d_logits = (p - onehot) / len(x)
+            d_h = (d_logits @ w2.T) * (h > 0)
+            grads = [x.T @ d_h + weight_decay * w1, d_h.sum(0),
+                     h.T @ d_logits + weight_decay * w2, d_logits.sum(0)]
+
+            for i, g in enumerate(grads):
+                moments[i] = 0.9 * moments[i] + 0.1 * g
+                velocities[i] = 0.999 * velocities[i] + 0.001 * g * g
+                m = moments[i] / (1 - 0.9 ** step)
+                v = velocities[i] / (1 - 0.999 ** step)
+                params[i] -= lr * m / (np.sqrt(v) + 1e-8)
+
+        return cls(*(p.astype(np.float32) for p in params))
+
+    def scores(self, x, n_classes):
+        h = np.maximum(x @ self.w1 + self.b1, 0)
+        return _softmax(h @ self.w2 + self.b2)
+
+    def arrays(self):
+        return dict(mlp_w1=self.w1, mlp_b1=self.b1,
+                    mlp_w2=self.w2, mlp_b2=self.b2)
+
+    @classmethod
+    def from_arrays(cls, data):
+        return cls(data["mlp_w1"], data["mlp_b1"],
+                   data["mlp_w2"], data["mlp_b2"])
+
+
+def _softmax(logits):
+    e = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return e / e.sum(axis=1, keepdims=True)
+
+
+_BACKENDS = {"knn": _KNN, "mlp": _MLP}
+
+
+# ================= CLASSIFIER =================
+class GestureClassifier:
+    """
+    Static hand pose classifier over landmark_features().
+
+    Backends: "knn" (training set kept, norms precomputed) or "mlp"
+    (one hidden layer). Either is saved with its labels and feature
+    standardisation in one .npz, and predicts a frame with a couple of
+    small matrix products.
+    """
+
+    def __init__(self, backend, model, labels, mean, std):
+        self.backend = backend
+        self.model = model
+        self.labels = list(labels)
+        self.mean = mean.astype(np.float32)
+        self.std = std.astype(np.float32)
+
+    @classmethod
+    def fit(cls, points, labels, right=None, backend="knn",
+            aspect=FRAME_ASPECT, **options):
+        features = landmark_features(points, right, aspect)
+        names, targets = np.unique(np.asarray(labels), return_inverse=True)
+
+        mean = features.mean(axis=0)
+        std = features.std(axis=0) + 1e-6
+        x = (features - mean) / std
+
+        if backend == "knn":
+            model = _KNN(x, targets, **options)
+        elif backend == "mlp":
+            model = _MLP.train(x, targets, len(names), **options)
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+        return cls(backend, model, names, mean, std)
+
+    # ================= PREDICTION =================
+    def predict_proba(self, points, right=None, aspect=FRAME_ASPECT):
+        """(N, classes) scores for (N, 21, 3) landmarks."""
+        x = (landmark_features(points, right, aspect) - self.mean) / self.std
+        if x.ndim == 1:
+            x = x[None]
+        return self.model.scores(x, len(self.labels))
+
+    def predict(self, points, right=True, aspect=FRAME_ASPECT):
+        """(label, confidence) for one hand's (21, 3) landmarks."""
+        scores = self.predict_proba(points, right, aspect)[0]
+        best = int(np.argmax(scores))
+        return self.labels[best], float(scores[best])
+
+    def predict_landmarks(self, hand_landmarks, side="Right", frame_size=None):
+        """Same as predict() for a mediapipe landmark list."""
+        points = np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark],
+                          dtype=np.float32)
+        aspect = frame_size[0] / frame_size[1] if frame_size else FRAME_ASPECT
+        return self.predict(points, side != "Left", aspect)
+
+    # ================= STORAGE =================
+    def save(self, path):
+        np.savez_compressed(
+            path,
+            backend=self.backend,
+            labels=np.array(self.labels),
+            mean=self.mean,
+            std=self.std,
+            **self.model.arrays()
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            backend = str(data["backend"])
+            model = _BACKENDS[backend].from_arrays(data)
+            return cls(backend, model, data["labels"].tolist(),
+                       data["mean"], data["std"])
+
+
+def load_classifier(path):
+    """GestureClassifier from `path`, or None if there is no such model."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return GestureClassifier.load(path)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"[Gestures] Could not load {path}: {e}")
+        return None
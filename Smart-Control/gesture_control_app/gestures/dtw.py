@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Dynamic time warping between short 2D trajectories (L x 2 arrays),
+# with a Sakoe-Chiba band of `radius` and squared Euclidean cell cost.
+
+
+def envelope(series, radius):
+    """
+    LB_Keogh envelope of a template: per-point max / min over
+    +-radius samples, shape (L, 2) each.
+    """
+    padded = np.pad(series, ((radius, radius), (0, 0)), mode="edge")
+    windows = sliding_window_view(padded, 2 * radius + 1, axis=0)
+    return windows.max(axis=2), windows.min(axis=2)
+
+
+def lb_keogh(query, upper, lower):
+    """
+    Lower bound of dtw(query, template) for the template's envelope:
+    the squared distance from each query point to the envelope.
+    `upper` / `lower` may be stacked (T x L x 2) to bound T templates
+    in one call.
+    """
+    above = np.maximum(query - upper, 0)
+    below = np.maximum(lower - query, 0)
+    return np.sum(above * above + below * below, axis=(-2, -1))
+
+
+def dtw(query, template, radius, best=math.inf):
+    """
+    Banded DTW distance, abandoned early (returns inf) as soon as every
+    cell of a row already costs more than `best`.
+    """
+    n = len(query)
+    diff = query[:, None, :] - template[None, :, :]
+    cost = np.einsum("ijk,ijk->ij", diff, diff).tolist()
+
+    inf = math.inf
+    previous = [inf] * n
+    for i in range(n):
+        row = cost[i]
+        current = [inf] * n
+        row_min = inf
+
+        for j in range(max(0, i - radius), min(n, i + radius + 1)):
+            if i == 0 and j == 0:
+                step = 0.0
+            else:
+                step = previous[j]
+                if j:
+                    step = min(step, previous[j - 1], current[j - 1])
+            value = row[j] + step
+            current[j] = value
+            if value < row_min:
+                row_min = value
+
+        if row_min >= best:
+            return inf
+        previous = current
+
+    return previous[n - 1]
@@ -0,0 +1,158 @@
+import math
+
+import numpy as np
+
+from gestures.dtw import dtw, envelope, lb_keogh
+
+# ---------------- CONFIG ----------------
+WINDOW_SECONDS = 0.8      # trajectory length that is matched
+SERIES_LENGTH = 24        # samples after resampling
+BAND_RADIUS = 3           # DTW warping window, in samples
+MATCH_THRESHOLD = 0.12    # mean squared distance per sample
+MIN_TRAVEL = 0.12         # fingertip path extent, normalised frame units
+COOLDOWN = 0.6            # seconds between two recognitions
+INDEX_TIP = 8
+# ----------------------------------------
+
+
+# ================= TEMPLATES =================
+def normalise(trajectory):
+    """Centre a trajectory and scale its larger extent to [-1, 1]."""
+    centred = trajectory - trajectory.mean(axis=0)
+    extent = np.abs(centred).max()
+    return centred / extent if extent > 0 else centred
+
+
+def _ease(n):
+    # Hands accelerate and decelerate; a linear ramp matches worse
+    return (1 - np.cos(np.linspace(0, math.pi, n))) / 2
+
+
+def builtin_templates(length=SERIES_LENGTH):
+    """
+    Swipes and circles in mirrored image coordinates (x right, y down),
+    so "SWIPE_RIGHT" is a move to the user's right.
+    """
+    ramp = _ease(length) * 2 - 1
+    flat = np.zeros(length)
+    angle = _ease(length) * 2 * math.pi
+
+    shapes = {
+        "SWIPE_RIGHT": (ramp, flat),
+        "SWIPE_LEFT": (-ramp, flat),
+        "SWIPE_DOWN": (flat, ramp),
+        "SWIPE_UP": (flat, -ramp),
+        "CIRCLE_CW": (np.cos(angle), np.sin(angle)),
+        "CIRCLE_CCW": (np.cos(angle), -np.sin(angle)),
+    }
+    return {name: normalise(np.column_stack(xy)) for name, xy in shapes.items()}
+
+
+def load_templates(path, length=SERIES_LENGTH):
+    """Templates saved with np.savez(path, NAME=trajectory, ...)."""
+    with np.load(path) as data:
+        return {name: normalise(resample(data[name], length))
+                for name in data.files}
+
+
+def resample(trajectory, length):
+    source = np.linspace(0, 1, len(trajectory))
+    target = np.linspace(0, 1, length)
+    return np.column_stack([
+        np.interp(target, source, trajectory[:, k]) for k in range(2)
+    ])
+
+
+# ================= RECOGNISER =================
+class DynamicGestureRecognizer:
+    """
+    Matches the recent fingertip trajectory against templates with DTW.
+
+    Each frame the last WINDOW_SECONDS of one landmark are read from a
+    LandmarkHistory, resampled to SERIES_LENGTH points and normalised.
+    Templates are then checked cheapest-first: LB_Keogh against each
+    template's precomputed envelope skips any template that cannot beat
+    the best match so far, and DTW itself abandons a template as soon
+    as a whole row exceeds that best. Most frames do one or two full
+    DTWs whatever the number of templates.
+    """
+
+    def __init__(self, templates=None, window=WINDOW_SECONDS,
+                 length=SERIES_LENGTH, radius=BAND_RADIUS,
+                 threshold=MATCH_THRESHOLD, min_travel=MIN_TRAVEL,
+                 cooldown=COOLDOWN, landmark=INDEX_TIP):
+        self.window = window
+        self.length = length
+        self.radius = radius
+        self.threshold = threshold
+        self.min_travel = min_travel
+        self.cooldown = cooldown
+        self.landmark = landmark
+
+        self.templates = []
+        self._upper = np.empty((0, length, 2))
+        self._lower = np.empty((0, length, 2))
+        for name, series in (templates or builtin_templates(length)).items():
+            self.add_template(name, series)
+
+        self._grid = np.linspace(0, 1, length)
+        self._query = np.empty((length, 2))
+        self._ready_at = 0.0
+
+    def add_template(self, name, series):
+        series = normalise(resample(np.asarray(series, float), self.length))
+        upper, lower = envelope(series, self.radius)
+        self.templates.append((name, series))
+        self._upper = np.concatenate([self._upper, upper[None]])
+        self._lower = np.concatenate([self._lower, lower[None]])
+
+    def match(self, query):
+        """(name, mean squared distance) of the best template, or (None, inf)."""
+        best = self.threshold * self.length
+        best_name = None
+
+        # One vectorised LB_Keogh over every template, then DTW in
+        # order of the bound until no remaining bound can win
+        bounds = lb_keogh(query, self._upper, self._lower)
+        for k in np.argsort(bounds):
+            if bounds[k] >= best:
+                break
+            name, series = self.templates[k]
+            distance = dtw(query, series, self.radius, best)
+            if distance < best:
+                best, best_name = distance, name
+
+        if best_name is None:
+            return None, math.inf
+        return best_name, best / self.length
+
+    def update(self, history, now=None):
+        """Name of the gesture the recent trajectory matches, or None."""
+        points, t, _, _ = history.window(history.capacity)
+        if len(t) < 4:
+            return None
+
+        now = t[-1] if now is None else now
+        if now < self._ready_at:
+            return None
+
+        start = np.searchsorted(t, now - self.window)
+        if len(t) - start < 4:
+            return None
+
+        path = points[start:, self.landmark, :2]
+        travel = path.max(axis=0) - path.min(axis=0)
+        if travel.max() < self.min_travel:
+            return None
+
+        times = t[start:]
+        grid = times[0] + self._grid * (times[-1] - times[0])
+        query = self._query
+        query[:, 0] = np.interp(grid, times, path[:, 0])
+        query[:, 1] = np.interp(grid, times, path[:, 1])
+        query[:] = normalise(query)
+
+        name, _ = self.match(query)
+        if name is not None:
+            self._ready_at = now + self.cooldown
+        return name
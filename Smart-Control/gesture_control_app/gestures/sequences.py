@@ -0,0 +1,142 @@
+from collections import namedtuple
+
+# ---------------- CONFIG ----------------
+STABLE_FRAMES = 3         # frames a symbol must hold to count
+DEFAULT_WITHIN = 0.8      # max seconds between two steps
+# ----------------------------------------
+
+BLANK = ""
+
+# steps: symbols in order, e.g. ("FIST", "OPEN_PALM") or ("PEACE", "PEACE")
+# within: max seconds from one step to the next
+Sequence = namedtuple("Sequence", "name steps within")
+
+
+def sequence(name, steps, within=DEFAULT_WITHIN):
+    """Declare a sequence: sequence("PLAY_PAUSE", "FIST OPEN_PALM")."""
+    if isinstance(steps, str):
+        steps = steps.split()
+    return Sequence(name, tuple(steps), within)
+
+
+class Stabilizer:
+    """
+    Per-frame labels -> stable symbol: a label counts once it has been
+    seen for STABLE_FRAMES frames in a row, until then the previous
+    stable symbol stays.
+    """
+
+    def __init__(self, frames=STABLE_FRAMES):
+        self.frames = frames
+        self.symbol = BLANK
+        self._candidate = BLANK
+        self._run = 0
+
+    def update(self, label):
+        if label == self._candidate:
+            self._run += 1
+        else:
+            self._candidate, self._run = label, 1
+
+        if self._run >= self.frames:
+            self.symbol = label
+        return self.symbol
+
+
+class SequenceAutomaton:
+    """
+    Deterministic automaton over stable gesture symbols.
+
+    The input is the stream of symbol onsets: each time the stable
+    symbol changes to something other than BLANK, that symbol is one
+    step. Holding a pose is one step however long it lasts, and letting
+    go (BLANK) between two equal steps is what makes "PEACE PEACE".
+
+    All sequences are compiled into one transition table (the
+    Aho-Corasick construction: a state is the longest sequence prefix
+    that ends the input so far), so feeding a frame costs a comparison
+    and at most one dict lookup, whatever the number of sequences.
+    A state expires when its next step doesn't arrive within the
+    sequence's `within`; the automaton then restarts.
+    """
+
+    def __init__(self, sequences):
+        self.sequences = list(sequences)
+        self._compile()
+        self.reset()
+
+    # ================= COMPILE =================
+    def _compile(self):
+        prefixes = {()}
+        for seq in self.sequences:
+            for n in range(1, len(seq.steps) + 1):
+                prefixes.add(seq.steps[:n])
+
+        alphabet = {step for seq in self.sequences for step in seq.steps}
+
+        # Number states breadth-first so the start state is 0
+        ordered = sorted(prefixes, key=lambda p: (len(p), p))
+        index = {prefix: i for i, prefix in enumerate(ordered)}
+
+        self._transitions = []
+        for prefix in ordered:
+            row = {}
+            for symbol in alphabet:
+                state = prefix + (symbol,)
+                while state not in prefixes:
+                    state = state[1:]
+                row[symbol] = index[state]
+            self._transitions.append(row)
+
+        # Accepting states, and the longest time a state may wait for
+        # its next step (the most lenient sequence that passes through)
+        self._accept = {}
+        self._timeout = [0.0] * len(ordered)
+        for seq in self.sequences:
+            self._accept.setdefault(index[seq.steps], seq.name)
+            for n in range(1, len(seq.steps)):
+                state = index[seq.steps[:n]]
+                self._timeout[state] = max(self._timeout[state], seq.within)
+
+        # Output also fires when a sequence is a suffix of a longer prefix
+        for prefix in ordered:
+            for k in range(1, len(prefix)):
+                name = self._accept.get(index.get(prefix[k:]))
+                if name and index[prefix] not in self._accept:
+                    self._accept[index[prefix]] = name
+
+        self.state_count = len(ordered)
+
+    # ================= RUN =================
+    def reset(self):
+        self.state = 0
+        self._last_symbol = BLANK
+        self._deadline = None
+
+    def in_progress(self, t):
+        """True between the steps of a sequence, until it completes or expires."""
+        return self.state != 0 and (self._deadline is None or t <= self._deadline)
+
+    def feed(self, symbol, t):
+        """Feed this frame's stable symbol; returns a completed sequence name or None."""
+        if self._deadline is not None and t > self._deadline:
+            self.state = 0
+            self._deadline = None
+
+        if symbol == self._last_symbol:
+            return None
+        self._last_symbol = symbol
+        if symbol == BLANK:
+            return None
+
+        self.state = self._transitions[self.state].get(symbol, 0)
+
+        name = self._accept.get(self.state)
+        if name is not None:
+            self.state = 0
+            self._deadline = None
+            return name
+
+        timeout = self._timeout[self.state]
+        self._deadline = t + timeout if self.state else None
+        return None
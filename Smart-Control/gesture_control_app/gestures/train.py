@@ -0,0 +1,165 @@
+"""
+Record labelled hand poses and train a gesture classifier.
+
+Run from the gesture_control_app directory:
+    python -m gestures.train record --label 3 --seconds 20
+    python -m gestures.train train sessions/*.npz --backend mlp
+
+record: shows the camera; SPACE starts / pauses recording, ESC stops.
+Every frame with a hand is saved with the label to sessions/.
+train: fits on the recorded frames, reports hold-out accuracy and the
+per-frame prediction time, then saves the model trained on all frames
+(by default to media_gesture_model.npz, the model Media mode loads).
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from gestures.classifier import FRAME_ASPECT, GestureClassifier
+
+SESSION_DIR = "sessions"
+
+
+# ================= SESSIONS =================
+def load_sessions(paths):
+    """Concatenate (points, labels, right, aspect) from session files."""
+    points, labels, right, aspect = [], [], [], []
+    for path in paths:
+        with np.load(path) as data:
+            points.append(data["points"])
+            labels.append(data["labels"])
+            right.append(data["right"])
+            # Sessions recorded before the aspect was saved: 640x480
+            frame_aspect = float(data["aspect"]) if "aspect" in data else FRAME_ASPECT
+            aspect.append(np.full(len(data["points"]), frame_aspect, np.float32))
+    return (np.concatenate(points), np.concatenate(labels),
+            np.concatenate(right), np.concatenate(aspect))
+
+
+def save_session(path, points, labels, right, aspect):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.savez_compressed(path, points=np.array(points, np.float32),
+                        labels=np.array(labels), right=np.array(right, bool),
+                        aspect=np.float32(aspect))
+
+
+# ================= RECORD =================
+def record(args):
+    import cv2
+    from runtime.vision import get_camera, get_inference, release_all
+
+    camera = get_camera()
+    hands = get_inference(camera, dict(max_num_hands=1))
+    points, right = [], []
+    aspect = FRAME_ASPECT
+    recording = False
+    deadline = None
+
+    print("SPACE to start / pause recording, ESC to finish")
+    while True:
+        captured = camera.read()
+        if captured is None:
+            break
+        frame = captured.image
+        aspect = frame.shape[1] / frame.shape[0]
+        results = hands.process(frame)
+
+        if recording and results.multi_hand_landmarks:
+            hand = results.multi_hand_landmarks[0]
+            points.append([(lm.x, lm.y, lm.z) for lm in hand.landmark])
+            side = results.multi_handedness[0].classification[0].label
+            right.append(side != "Left")
+
+        status = "REC" if recording else "paused"
+        cv2.putText(frame, f"{args.label}  {status}  {len(points)} frames",
+                    (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8,
+                    (0, 0, 255) if recording else (200, 200, 200), 2)
+        cv2.imshow("Record gesture", frame)
+
+        key = cv2.waitKey(1) & 0xFF
+        if key == ord(' '):
+            recording = not recording
+            if recording and deadline is None:
+                deadline = time.perf_counter() + args.seconds
+        if key == 27 or (deadline and time.perf_counter() > deadline):
+            break
+
+    cv2.destroyAllWindows()
+    release_all()
+
+    if not points:
+        raise SystemExit("Nothing recorded")
+
+    path = args.out or os.path.join(
+        SESSION_DIR, f"{args.label}_{time.strftime('%Y%m%d_%H%M%S')}.npz"
+    )
+    save_session(path, points, [args.label] * len(points), right, aspect)
+    print(f"Saved {len(points)} frames to {path}")
+
+
+# ================= TRAIN =================
+def train(args):
+    points, labels, right, aspect = load_sessions(args.sessions)
+    print(f"{len(points)} frames, labels: "
+          + ", ".join(f"{name} ({n})" for name, n in
+                      zip(*np.unique(labels, return_counts=True))))
+
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(points))
+    split = int(len(order) * (1 - args.holdout))
+    train_idx, test_idx = order[:split], order[split:]
+
+    options = {"k": args.k} if args.backend == "knn" else {}
+    if len(test_idx):
+        model = GestureClassifier.fit(points[train_idx], labels[train_idx],
+                                      right[train_idx], args.backend,
+                                      aspect[train_idx], **options)
+        scores = model.predict_proba(points[test_idx], right[test_idx],
+                                     aspect[test_idx])
+        predicted = np.array(model.labels)[scores.argmax(axis=1)]
+        print(f"Hold-out accuracy: {np.mean(predicted == labels[test_idx]) * 100:.1f}% "
+              f"on {len(test_idx)} frames")
+
+    model = GestureClassifier.fit(points, labels, right, args.backend, aspect,
+                                  **options)
+
+    start = time.perf_counter()
+    for i in range(200):
+        j = i % len(points)
+        model.predict(points[j], bool(right[j]), aspect[j])
+    per_frame_us = (time.perf_counter() - start) / 200 * 1e6
+    print(f"Prediction: {per_frame_us:.0f} us per frame ({args.backend})")
+
+    model.save(args.out)
+    print(f"Saved {args.out} ({os.path.getsize(args.out) / 1024:.1f} KiB)")
+
+
+# ================= MAIN =================
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record")
+    rec.add_argument("--label", required=True)
+    rec.add_argument("--seconds", type=float, default=20)
+    rec.add_argument("--out")
+
+    fit = commands.add_parser("train")
+    fit.add_argument("sessions", nargs="+")
+    fit.add_argument("--backend", choices=["knn", "mlp"], default="knn")
+    fit.add_argument("--k", type=int, default=5)
+    fit.add_argument("--holdout", type=float, default=0.2)
+    fit.add_argument("--out", default="media_gesture_model.npz")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args)
+    else:
+        train(args)
+
+
+if __name__ == "__main__":
+    main()
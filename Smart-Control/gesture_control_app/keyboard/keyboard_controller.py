@@ -1,23 +1,25 @@
 import cv2
 import numpy as np
-import mediapipe as mp
-from pynput.keyboard import Controller
-import time
 
-# Initialize keyboard controller
-keyboard = Controller()
+from runtime.mode_runtime import ModePlugin, intent
 
-# Initialize MediaPipe hands
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-
-hands = mp_hands.Hands(
+HANDS_CONFIG = dict(
     static_image_mode=False,
     max_num_hands=1,
     min_detection_confidence=0.7,
     min_tracking_confidence=0.7
 )
 
+# Infer on a 480-wide copy of the 1280x720 frame; the overlay still draws
+# at full resolution. See benchmarks/scale_benchmark.py
+INFER_WIDTH = 480
+
+# Loop rate; see runtime/scheduler.py
+TARGET_FPS = 30
+
+# Thumb-index distance (pixels) that presses the key under the fingertip
+CLICK_DISTANCE = 40
+
 # Keyboard layout
 keys = [
     ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"],
@@ -59,120 +61,127 @@ class Button:
         return x < px < x + w and y < py < y + h
 
 
-# ---------------- MAIN FUNCTION ----------------
-def run_keyboard():
-
-    # Create buttons inside function (important for threading safety)
-    button_list = []
-    start_x, start_y = 50, 200
-
-    for i, row in enumerate(keys):
-        x_offset = 0
-        for j, key in enumerate(row):
-            if key == "SPACE":
-                button_list.append(
-                    Button((start_x + 100, start_y + i * 100),
-                           key, (600, 85))
-                )
-            else:
-                button_list.append(
-                    Button((start_x + j * 90 + x_offset,
-                            start_y + i * 100),
-                           key)
-                )
-
-    cap = cv2.VideoCapture(0)
-    cap.set(3, 1280)
-    cap.set(4, 720)
-
-    final_text = ""
-    last_click_time = 0
-    click_cooldown = 0.3
-
-    print("Virtual Keyboard Started! Press 'q' to quit.")
-
-    while True:
-        success, img = cap.read()
-        if not success:
-            break
-
-        img = cv2.flip(img, 1)
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        results = hands.process(img_rgb)
-
+def classify_hand(hand_landmarks, side, frame_size):
+    """"PINCH" while the hand would press a key; see recording/batch.py."""
+    w, h = frame_size
+    index, thumb = hand_landmarks.landmark[8], hand_landmarks.landmark[4]
+    distance = np.hypot((index.x - thumb.x) * w, (index.y - thumb.y) * h)
+    return "PINCH" if distance < CLICK_DISTANCE else ""
+
+
+# ---------------- MODE PLUGIN ----------------
+class KeyboardPlugin(ModePlugin):
+    name = "Keyboard"
+    hands_config = HANDS_CONFIG
+    infer_width = INFER_WIDTH
+    target_fps = TARGET_FPS
+    capture_size = (1280, 720)
+    window_title = "Virtual Keyboard"
+    exit_key = ord('q')
+
+    def on_start(self):
+        # Create buttons per run (important for threading safety)
+        self.button_list = []
+        start_x, start_y = 50, 200
+
+        for i, row in enumerate(keys):
+            x_offset = 0
+            for j, key in enumerate(row):
+                if key == "SPACE":
+                    self.button_list.append(
+                        Button((start_x + 100, start_y + i * 100),
+                               key, (600, 85))
+                    )
+                else:
+                    self.button_list.append(
+                        Button((start_x + j * 90 + x_offset,
+                                start_y + i * 100),
+                               key)
+                    )
+
+        self.final_text = ""
+        self.last_click_time = 0
+        self.click_cooldown = 0.3
+
+        # This frame's fingertips, and the buttons under / pressed by them
+        self.tips = []
+        self.hovered = []
+        self.pressed = []
+
+        print("Virtual Keyboard Started! Press 'q' to quit.")
+
+    def on_frame(self, hands, features, current_time):
+        w, h = self.runtime.frame_size
+        intents = []
+        self.tips = []
+        self.hovered = []
+        self.pressed = []
+        self.label = ""
+
+        for hand in hands:
+            landmarks = hand.landmarks.landmark
+
+            # Index finger
+            index = landmarks[8]
+            index_x, index_y = int(index.x * w), int(index.y * h)
+
+            # Thumb
+            thumb = landmarks[4]
+            thumb_x, thumb_y = int(thumb.x * w), int(thumb.y * h)
+
+            self.tips.append((index_x, index_y))
+
+            distance = np.sqrt(
+                (index_x - thumb_x) ** 2 +
+                (index_y - thumb_y) ** 2
+            )
+
+            for button in self.button_list:
+                if button.is_over((index_x, index_y)):
+
+                    self.hovered.append(button)
+
+                    if (distance < CLICK_DISTANCE and
+                            (current_time - self.last_click_time) > self.click_cooldown):
+
+                        self.pressed.append(button)
+
+                        if button.text == "SPACE":
+                            self.final_text += " "
+                            intents.append(intent("key", key=" "))
+                        else:
+                            self.final_text += button.text
+                            intents.append(intent("key", key=button.text.lower()))
+
+                        self.last_click_time = current_time
+                        self.label = button.text
+                        print(f"Typed: {button.text}")
+
+        return intents
+
+    def draw(self, img):
         # Draw buttons
-        for button in button_list:
+        for button in self.button_list:
             button.draw(img)
 
         # Display typed text
         cv2.rectangle(img, (50, 50), (1230, 120),
                       (50, 50, 50), cv2.FILLED)
 
-        cv2.putText(img, final_text, (60, 95),
+        cv2.putText(img, self.final_text, (60, 95),
                     cv2.FONT_HERSHEY_PLAIN,
                     3, (255, 255, 255), 3)
 
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-
-                mp_drawing.draw_landmarks(
-                    img,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS
-                )
-
-                landmarks = hand_landmarks.landmark
-                h, w, _ = img.shape
+        for button in self.hovered:
+            button.draw(img, color=(0, 150, 0))
+        for button in self.pressed:
+            button.draw(img, color=(0, 255, 0))
 
-                # Index finger
-                index = landmarks[8]
-                index_x, index_y = int(index.x * w), int(index.y * h)
-
-                # Thumb
-                thumb = landmarks[4]
-                thumb_x, thumb_y = int(thumb.x * w), int(thumb.y * h)
-
-                cv2.circle(img, (index_x, index_y),
-                           15, (0, 255, 0), cv2.FILLED)
-
-                distance = np.sqrt(
-                    (index_x - thumb_x) ** 2 +
-                    (index_y - thumb_y) ** 2
-                )
-
-                current_time = time.time()
-
-                for button in button_list:
-                    if button.is_over((index_x, index_y)):
-
-                        button.draw(img, color=(0, 150, 0))
-
-                        if (distance < 40 and
-                                (current_time - last_click_time) > click_cooldown):
-
-                            button.draw(img, color=(0, 255, 0))
-
-                            if button.text == "SPACE":
-                                final_text += " "
-                                keyboard.press(' ')
-                            else:
-                                final_text += button.text
-                                keyboard.press(button.text.lower())
-
-                            last_click_time = current_time
-                            print(f"Typed: {button.text}")
+        for tip in self.tips:
+            cv2.circle(img, tip, 15, (0, 255, 0), cv2.FILLED)
 
         cv2.putText(img,
                     "Pinch to Click | Press 'q' to quit",
                     (50, 680),
                     cv2.FONT_HERSHEY_PLAIN,
                     2, (255, 255, 255), 2)
-
-        cv2.imshow("Virtual Keyboard", img)
-
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
-
-    cap.release()
-    cv2.destroyAllWindows()
-    print("Keyboard mode stopped.")
@@ -1,7 +1,6 @@
 import customtkinter as ctk
-import subprocess
-import sys
-import os
+
+from runtime.worker import ModeSupervisor
 
 
 ctk.set_appearance_mode("dark")
@@ -13,11 +12,14 @@ class SmartControlLauncher:
     def __init__(self):
         self.root = ctk.CTk()
         self.root.title("Smart Control - Launcher")
-        self.root.geometry("600x450")
+        self.root.geometry("600x500")
 
-        self.current_process = None
+        # One warm worker process: vision stack loaded, camera open
+        self.supervisor = ModeSupervisor()
 
         self.build_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.poll_status()
         self.root.mainloop()
 
     def build_ui(self):
@@ -30,9 +32,9 @@ class SmartControlLauncher:
         title.pack(pady=30)
 
         self.create_button("🖱 Mouse Control", "Mouse")
-        self.create_button("🎵 Media Controller", "Media Controller")
+        self.create_button("🎵 Media Controller", "Media")
         self.create_button("🔊 Volume Control", "Volume")
-        self.create_button("⌨ Keyboard Control", "keyboard")
+        self.create_button("⌨ Keyboard Control", "Keyboard")
 
         stop_btn = ctk.CTkButton(
             self.root,
@@ -43,35 +45,49 @@ class SmartControlLauncher:
         )
         stop_btn.pack(pady=25)
 
-    def create_button(self, text, folder_name):
+        self.status_label = ctk.CTkLabel(
+            self.root,
+            text="Worker: starting...",
+            font=ctk.CTkFont(size=13)
+        )
+        self.status_label.pack()
+
+    def create_button(self, text, mode_name):
 
         btn = ctk.CTkButton(
             self.root,
             text=text,
             width=300,
             height=50,
-            command=lambda: self.run_module(folder_name)
+            command=lambda: self.run_module(mode_name)
         )
         btn.pack(pady=10)
 
-    def run_module(self, folder_name):
+    def run_module(self, mode_name):
+        # The worker stops the current mode and reuses its camera
+        self.supervisor.start_mode(mode_name)
 
-        self.stop_module()
+    def stop_module(self):
+        self.supervisor.stop_mode()
 
-        module_path = os.path.join(folder_name, "main.py")
+    def poll_status(self):
+        status = self.supervisor.status()
 
-        if os.path.exists(module_path):
-            self.current_process = subprocess.Popen(
-                [sys.executable, module_path]
-            )
+        if not status["alive"]:
+            text = "Worker: not responding"
+        elif status["mode"]:
+            text = (f"{status['state']}: {status['mode']}  |  "
+                    f"{status['fps']:.1f} FPS  |  "
+                    f"{status['frame_ms']:.1f} ms/frame")
         else:
-            print(f"{module_path} not found")
+            text = f"Worker: {status['state']}"
 
-    def stop_module(self):
+        self.status_label.configure(text=text)
+        self.root.after(500, self.poll_status)
 
-        if self.current_process:
-            self.current_process.terminate()
-            self.current_process = None
+    def on_close(self):
+        self.supervisor.shutdown()
+        self.root.destroy()
 
 
 if __name__ == "__main__":
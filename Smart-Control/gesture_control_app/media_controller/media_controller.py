@@ -1,11 +1,23 @@
-import cv2
-import mediapipe as mp
-import pyautogui
-import time
+from gestures.classifier import load_classifier
+from runtime import trace
+from runtime.mode_runtime import ModePlugin, intent
+
+HANDS_CONFIG = dict(max_num_hands=1)
+
+# Trained finger-count model (labels "0".."5", see gestures/train.py);
+# count_fingers() is used when it is missing or unsure
+GESTURE_MODEL = "media_gesture_model.npz"
+MODEL_MIN_CONFIDENCE = 0.6
+
+# Landmark inference width (None = full frame); see benchmarks/scale_benchmark.py
+INFER_WIDTH = None
+
+# Loop rate; see runtime/scheduler.py
+TARGET_FPS = 30
 
 
 # ---------------- FINGER COUNT FUNCTION ----------------
-def count_fingers(lst):
+def count_fingers(lst, side="Right"):
     cnt = 0
 
     thresh = (lst.landmark[0].y * 100 - lst.landmark[9].y * 100) / 2
@@ -22,81 +34,105 @@ def count_fingers(lst):
     if (lst.landmark[17].y * 100 - lst.landmark[20].y * 100) > thresh:
         cnt += 1
 
-    if (lst.landmark[5].x * 100 - lst.landmark[4].x * 100) > 6:
+    # Thumb points the other way on a left hand
+    thumb_out = lst.landmark[5].x * 100 - lst.landmark[4].x * 100
+    if side == "Left":
+        thumb_out = -thumb_out
+    if thumb_out > 6:
         cnt += 1
 
     return cnt
 
 
-# ---------------- MAIN FUNCTION ----------------
-def run_media():
+# ---------------- GESTURE LOGIC ----------------
+class MediaGestures:
+    """
+    Finger count -> media key, once the count has changed and held for
+    0.2 s. Used by Media mode and by any mode routing a hand to media;
+    update() returns the key press as intents.
+    """
 
-    cap = cv2.VideoCapture(0)
+    def __init__(self, classifier=None):
+        self.classifier = classifier
+        self.count = None
+        self.start_init = False
+        self.start_time = 0
+        self.prev = -1
 
-    drawing = mp.solutions.drawing_utils
-    hands = mp.solutions.hands
-    hand_obj = hands.Hands(max_num_hands=1)
+    def update(self, hand_keyPoints, t, side="Right", frame_size=None):
+        cnt = self.count = self.finger_count(hand_keyPoints, side, frame_size)
+        intents = []
 
-    start_init = False
-    prev = -1
+        if self.prev != cnt:
 
-    print("Media Control Started (ESC to exit)")
+            if not self.start_init:
+                self.start_time = t
+                self.start_init = True
 
-    while True:
-        end_time = time.time()
-        ret, frm = cap.read()
-        if not ret:
-            break
+            elif (t - self.start_time) > 0.2:
 
-        frm = cv2.flip(frm, 1)
+                # -------- MEDIA CONTROLS --------
+                if cnt == 1:
+                    intents.append(intent("press", key="right"))   # Next
 
-        res = hand_obj.process(
-            cv2.cvtColor(frm, cv2.COLOR_BGR2RGB)
-        )
+                elif cnt == 2:
+                    intents.append(intent("press", key="left"))    # Previous
 
-        if res.multi_hand_landmarks:
+                elif cnt == 3:
+                    intents.append(intent("press", key="up"))      # Volume Up
 
-            hand_keyPoints = res.multi_hand_landmarks[0]
-            cnt = count_fingers(hand_keyPoints)
+                elif cnt == 4:
+                    intents.append(intent("press", key="down"))    # Volume Down
 
-            if prev != cnt:
+                elif cnt == 5:
+                    intents.append(intent("press", key="space"))   # Play/Pause
 
-                if not start_init:
-                    start_time = time.time()
-                    start_init = True
+                trace.gesture("Media", self.prev, cnt)
+                self.prev = cnt
+                self.start_init = False
 
-                elif (end_time - start_time) > 0.2:
+        return intents
 
-                    # -------- MEDIA CONTROLS --------
-                    if cnt == 1:
-                        pyautogui.press("right")   # Next
+    def finger_count(self, hand_keyPoints, side, frame_size=None):
+        if self.classifier:
+            label, confidence = self.classifier.predict_landmarks(
+                hand_keyPoints, side, frame_size
+            )
+            if confidence >= MODEL_MIN_CONFIDENCE and label.isdigit():
+                return int(label)
+        return count_fingers(hand_keyPoints, side)
 
-                    elif cnt == 2:
-                        pyautogui.press("left")    # Previous
 
-                    elif cnt == 3:
-                        pyautogui.press("up")      # Volume Up
+_offline = None
 
-                    elif cnt == 4:
-                        pyautogui.press("down")    # Volume Down
 
-                    elif cnt == 5:
-                        pyautogui.press("space")   # Play/Pause
+def classify_hand(hand_landmarks, side, frame_size):
+    """Finger count as the loop sees it (model first); see recording/batch.py."""
+    global _offline
+    if _offline is None:
+        _offline = MediaGestures(load_classifier(GESTURE_MODEL))
+    return str(_offline.finger_count(hand_landmarks, side, frame_size))
 
-                    prev = cnt
-                    start_init = False
 
-            drawing.draw_landmarks(
-                frm,
-                hand_keyPoints,
-                hands.HAND_CONNECTIONS
-            )
+# ---------------- MODE PLUGIN ----------------
+class MediaPlugin(ModePlugin):
+    name = "Media"
+    hands_config = HANDS_CONFIG
+    infer_width = INFER_WIDTH
+    target_fps = TARGET_FPS
+    window_title = "Media Control (ESC to exit)"
 
-        cv2.imshow("Media Control (ESC to exit)", frm)
+    def on_start(self):
+        self.gestures = MediaGestures(load_classifier(GESTURE_MODEL))
+        print("Media Control Started (ESC to exit)")
 
-        if cv2.waitKey(1) & 0xFF == 27:
-            break
+    def on_frame(self, hands, features, t):
+        if not hands:
+            self.label = ""
+            return []
 
-    cap.release()
-    cv2.destroyAllWindows()
-    print("Media mode stopped.")
+        hand = hands[0]
+        intents = self.gestures.update(hand.landmarks, t, hand.side,
+                                       self.runtime.frame_size)
+        self.label = str(self.gestures.count)
+        return intents
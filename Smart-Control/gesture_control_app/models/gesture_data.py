@@ -26,7 +26,7 @@ Hold Pinch → Drag
 
     "Volume": """
 Pinch → Adjust Volume
-Peace Sign → Lock / Unlock
+Peace Sign Twice → Lock / Unlock
 Thumbs Up → Max Volume
 """,
 
@@ -1,14 +1,48 @@
-from mouse.mouse_controller import run_mouse
-from keyboard.keyboard_controller import run_keyboard
-from media_controller.media_controller import run_media
-from volume.volume_controller import run_volume
-from presentation.presentation_controller import run_presentation
+from functools import partial
+from importlib import import_module
 
 
+# Mode name -> "module:PluginClass" (a runtime.mode_runtime.ModePlugin).
+# Modules are only imported when a mode is first started, so the app
+# window opens without pulling in mediapipe, pyautogui, pynput or pycaw.
 MODE_REGISTRY = {
-    "Mouse": run_mouse,
-    "Keyboard": run_keyboard,
-    "Media": run_media,
-    "Volume": run_volume,
-    "Presentation": run_presentation
-}
\ No newline at end of file
+    "Mouse": "mouse.mouse_controller:MousePlugin",
+    "Keyboard": "keyboard.keyboard_controller:KeyboardPlugin",
+    "Media": "media_controller.media_controller:MediaPlugin",
+    "Volume": "volume.volume_controller:VolumePlugin",
+    "Presentation": "presentation.presentation_controller:PresentationPlugin"
+}
+
+_loaded = {}
+
+
+def load_plugin(mode_name):
+    """
+    Import and return the plugin class for `mode_name`.
+    Returns None for unknown modes.
+    """
+    target = MODE_REGISTRY.get(mode_name)
+    if target is None:
+        return None
+
+    module_name, class_name = target.split(":")
+    return getattr(import_module(module_name), class_name)
+
+
+def load_mode(mode_name):
+    """
+    Return the run function for `mode_name`: `run(stop_event)` runs its
+    plugin in the shared frame loop. Returns None for unknown modes.
+    """
+    if mode_name in _loaded:
+        return _loaded[mode_name]
+
+    plugin_class = load_plugin(mode_name)
+    if plugin_class is None:
+        return None
+
+    from runtime.mode_runtime import run_plugins
+    mode_function = partial(run_plugins, [plugin_class])
+
+    _loaded[mode_name] = mode_function
+    return mode_function
@@ -1,10 +1,11 @@
 import cv2
-import mediapipe as mp
 import pyautogui
 import numpy as np
-import time
-import math
-from collections import deque
+
+from runtime.mode_runtime import ModePlugin, intent
+from runtime.tracking import HandRouter
+from gestures.classifier import load_classifier
+from media_controller.media_controller import GESTURE_MODEL, MediaGestures
 
 # ---------------- CONFIG ----------------
 CAM_WIDTH = 640
@@ -16,80 +17,104 @@ CLICK_DEBOUNCE = 0.25
 DRAG_HOLD_TIME = 0.15
 SENSITIVITY = 1.8
 
-pyautogui.FAILSAFE = False
-# ----------------------------------------
-
-screen_w, screen_h = pyautogui.size()
-
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(
+HANDS_CONFIG = dict(
     max_num_hands=2,
     min_detection_confidence=0.6,
     min_tracking_confidence=0.6
 )
 
+# Landmark inference width (None = full frame); see benchmarks/scale_benchmark.py
+INFER_WIDTH = None
+
+# Loop rate; see runtime/scheduler.py
+TARGET_FPS = 30
+
+# Per-hand routing, off by default: CURSOR_HAND None = any hand moves
+# the cursor; MEDIA_HAND None = no media keys. E.g. "Right" / "Left"
+# mouses with the right hand and plays media with the left.
+CURSOR_HAND = None
+MEDIA_HAND = None
+
+pyautogui.FAILSAFE = False
+# ----------------------------------------
+
 TIP_IDS = {"thumb": 4, "index": 8, "middle": 12, "ring": 16}
 
-# ---------------- HELPER FUNCTIONS ----------------
+# Rows / columns of HandFeatures.tip_distances and .extended
+THUMB, INDEX, MIDDLE, RING = 0, 1, 2, 3
+
+
+def classify_hand(hand_landmarks, side, frame_size):
+    """The cursor hand's pose this frame; see recording/batch.py."""
+    lm = hand_landmarks.landmark
 
-def norm_distance(a, b):
-    return math.hypot(a[0] - b[0], a[1] - b[1])
+    def distance(a, b):
+        return np.hypot(lm[a].x - lm[b].x, lm[a].y - lm[b].y)
 
-def get_tip_coords(landmarks, tip_id):
-    return landmarks[tip_id].x, landmarks[tip_id].y
+    if distance(TIP_IDS["thumb"], TIP_IDS["index"]) < PINCH_THRESHOLD:
+        return "LEFT_PINCH"
+    if distance(TIP_IDS["thumb"], TIP_IDS["middle"]) < PINCH_THRESHOLD:
+        return "RIGHT_PINCH"
+    if distance(TIP_IDS["index"], TIP_IDS["ring"]) < PINCH_THRESHOLD:
+        return "DOUBLE_PINCH"
+    if lm[TIP_IDS["index"]].y < lm[6].y:
+        return "POINT"
+    return ""
 
-# ---------------- MAIN FUNCTION ----------------
+# ---------------- MODE PLUGIN ----------------
 
-def run_mouse():
+class MousePlugin(ModePlugin):
+    """Cursor, clicks and drag on one hand; media keys on the other."""
 
-    last_left_click = 0
-    last_right_click = 0
-    last_double_click = 0
+    name = "Mouse"
+    hands_config = HANDS_CONFIG
+    infer_width = INFER_WIDTH
+    target_fps = TARGET_FPS
+    capture_size = (CAM_WIDTH, CAM_HEIGHT)
+    window_title = "Hand Mouse (ESC to exit)"
 
-    drag_state = False
-    drag_start_time = None
-    pos_buffer = deque(maxlen=SMOOTHING_BUFFER)
+    def on_start(self):
+        self.screen_w, self.screen_h = pyautogui.size()
 
-    prev_time = time.time()
+        self.last_left_click = 0
+        self.last_right_click = 0
+        self.last_double_click = 0
 
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAM_WIDTH)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAM_HEIGHT)
+        self.drag_state = False
+        self.drag_start_time = None
 
-    print("Hand mouse started. Press ESC to exit.")
+        routes = {"cursor": CURSOR_HAND}
+        if MEDIA_HAND:
+            routes["media"] = MEDIA_HAND
+        self.router = HandRouter(routes)
+        self.media = MediaGestures(load_classifier(GESTURE_MODEL)) if MEDIA_HAND else None
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
+        print("Hand mouse started. Press ESC to exit.")
 
-        frame = cv2.flip(frame, 1)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(rgb)
-        now = time.time()
+    def on_frame(self, hands, features, now):
+        intents = []
 
-        if results.multi_hand_landmarks:
-            hand_landmarks = results.multi_hand_landmarks[0]
-            landmarks = hand_landmarks.landmark
-            mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+        # ---------------- HAND ROUTING ----------------
+        routed = self.router.assign(self.runtime.tracker)
 
-            thumb = get_tip_coords(landmarks, TIP_IDS["thumb"])
-            index = get_tip_coords(landmarks, TIP_IDS["index"])
-            middle = get_tip_coords(landmarks, TIP_IDS["middle"])
-            ring = get_tip_coords(landmarks, TIP_IDS["ring"])
+        if "media" in routed:
+            media_hand = routed["media"]
+            intents += self.media.update(media_hand.landmarks, now, media_hand.side,
+                                         self.runtime.frame_size)
 
-            d_thumb_index = norm_distance(thumb, index)
-            d_thumb_middle = norm_distance(thumb, middle)
-            d_index_ring = norm_distance(index, ring)
+        hand = routed.get("cursor")
+        if hand is not None:
+            distances = features.tip_distances[hand.row]
 
-            index_tip_y = landmarks[TIP_IDS["index"]].y
-            index_pip_y = landmarks[6].y
+            d_thumb_index = distances[THUMB, INDEX]
+            d_thumb_middle = distances[THUMB, MIDDLE]
+            d_index_ring = distances[INDEX, RING]
 
             # ---------------- CURSOR MOVE ----------------
-            if index_tip_y < index_pip_y:
+            if features.extended[hand.row, INDEX]:
 
-                ix, iy = index
+                # Average the fingertip over the last few frames
+                ix, iy, _ = hand.history.mean(TIP_IDS["index"], SMOOTHING_BUFFER)
 
                 dx = (ix - 0.5) * SENSITIVITY + 0.5
                 dy = (iy - 0.5) * SENSITIVITY + 0.5
@@ -97,62 +122,55 @@ def run_mouse():
                 dx = np.clip(dx, 0, 1)
                 dy = np.clip(dy, 0, 1)
 
-                screen_x = np.interp(dx, [0, 1], [0, screen_w])
-                screen_y = np.interp(dy, [0, 1], [0, screen_h])
-
-                pos_buffer.append((screen_x, screen_y))
-
-                avg_x = sum([p[0] for p in pos_buffer]) / len(pos_buffer)
-                avg_y = sum([p[1] for p in pos_buffer]) / len(pos_buffer)
+                screen_x = np.interp(dx, [0, 1], [0, self.screen_w])
+                screen_y = np.interp(dy, [0, 1], [0, self.screen_h])
 
-                pyautogui.moveTo(avg_x, avg_y, _pause=False)
+                intents.append(intent("moveTo", x=int(screen_x), y=int(screen_y)))
 
             # ---------------- LEFT CLICK / DRAG ----------------
             if d_thumb_index < PINCH_THRESHOLD:
-                if drag_start_time is None:
-                    drag_start_time = now
+                if self.drag_start_time is None:
+                    self.drag_start_time = now
 
-                if now - drag_start_time > DRAG_HOLD_TIME and not drag_state:
-                    pyautogui.mouseDown(button='left')
-                    drag_state = True
+                if now - self.drag_start_time > DRAG_HOLD_TIME and not self.drag_state:
+                    intents.append(intent("mouseDown", button="left"))
+                    self.drag_state = True
             else:
-                if drag_start_time is not None:
-                    if drag_state:
-                        pyautogui.mouseUp(button='left')
-                        drag_state = False
+                if self.drag_start_time is not None:
+                    if self.drag_state:
+                        intents.append(intent("mouseUp", button="left"))
+                        self.drag_state = False
                     else:
-                        if now - last_left_click > CLICK_DEBOUNCE:
-                            pyautogui.click(button='left')
-                            last_left_click = now
-                    drag_start_time = None
+                        if now - self.last_left_click > CLICK_DEBOUNCE:
+                            intents.append(intent("click", button="left"))
+                            self.last_left_click = now
+                    self.drag_start_time = None
 
             # ---------------- RIGHT CLICK ----------------
-            if d_thumb_middle < PINCH_THRESHOLD and now - last_right_click > CLICK_DEBOUNCE:
-                pyautogui.click(button='right')
-                last_right_click = now
+            if d_thumb_middle < PINCH_THRESHOLD and now - self.last_right_click > CLICK_DEBOUNCE:
+                intents.append(intent("click", button="right"))
+                self.last_right_click = now
 
             # ---------------- DOUBLE CLICK ----------------
-            if d_index_ring < PINCH_THRESHOLD and now - last_double_click > 0.5:
-                pyautogui.doubleClick()
-                last_double_click = now
+            if d_index_ring < PINCH_THRESHOLD and now - self.last_double_click > 0.5:
+                intents.append(intent("doubleClick", button="left"))
+                self.last_double_click = now
 
-        # ---------------- FPS DISPLAY ----------------
-        cur_time = time.time()
-        fps = 1 / (cur_time - prev_time) if cur_time != prev_time else 0
-        prev_time = cur_time
+        self.label = "DRAG" if self.drag_state else ""
+        return intents
 
-        cv2.putText(frame, f"FPS: {int(fps)}",
+    def draw(self, frame):
+        # ---------------- FPS DISPLAY ----------------
+        cv2.putText(frame, f"FPS: {int(self.runtime.fps)}",
                     (10, 20),
                     cv2.FONT_HERSHEY_SIMPLEX,
                     0.6,
                     (0, 255, 255),
                     2)
 
-        cv2.imshow("Hand Mouse (ESC to exit)", frame)
-
-        if cv2.waitKey(1) & 0xFF == 27:
-            break
-
-    cap.release()
-    cv2.destroyAllWindows()
-    print("Mouse mode stopped.")
+    def on_stop(self):
+        # Don't leave the button held down after a drag
+        if self.drag_state:
+            self.drag_state = False
+            return [intent("mouseUp", button="left")]
+        return []
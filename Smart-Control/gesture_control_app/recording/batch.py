@@ -0,0 +1,340 @@
+"""
+Re-extract landmarks and re-label gestures for a directory of videos.
+
+Every video under the directory (recorded sessions' video.mp4 included)
+is split into chunks of frames. A pool of worker processes, each with
+its own MediaPipe graph, runs hand tracking on the chunks and labels
+every hand with each mode's classify_hand(), so labels follow the
+thresholds in the mode modules as they are now. Chunks are merged back
+in order, per video, into the session format of recording/session.py
+(landmarks.bin + session.json) plus labels.npy, and a summary report
+is written to the output directory.
+
+Run from the gesture_control_app directory:
+    python -m recording.batch recordings/ --out analysis/
+    python -m recording.batch videos/ --out analysis/ --workers 8 --mirror
+
+Chunks are independent, so throughput grows with --workers until the
+disk or the decoder is the limit; the report shows the speed-up over
+the summed worker time.
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from multiprocessing import get_context
+
+import numpy as np
+
+from models.mode_registry import MODE_REGISTRY
+from recording.session import (LANDMARKS_FILE, MAX_HANDS, RECORD_DTYPE,
+                               make_record, write_meta)
+
+# ---------------- CONFIG ----------------
+CHUNK_FRAMES = 300          # frames per task; ~10 s of 30 fps video
+IN_FLIGHT_PER_WORKER = 4    # chunks queued per worker, bounds memory
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mkv", ".mov")
+
+BATCH_HANDS_CONFIG = dict(
+    static_image_mode=False,
+    max_num_hands=MAX_HANDS,
+    min_detection_confidence=0.6,
+    min_tracking_confidence=0.6
+)
+# ----------------------------------------
+
+BATCH_MODE = "Batch"
+LABELS_FILE = "labels.npy"
+SUMMARY_FILE = "summary.json"
+
+
+# ================= MODES =================
+def load_classifiers(mode_names):
+    """{mode: classify_hand} for every mode that imports here."""
+    classifiers = {}
+    for mode_name in mode_names:
+        module_name = MODE_REGISTRY[mode_name].split(":")[0]
+        try:
+            classifiers[mode_name] = import_module(module_name).classify_hand
+        except Exception as e:
+            # e.g. pycaw is Windows only
+            print(f"[Batch] Skipping {mode_name}: {e}")
+    return classifiers
+
+
+def labels_dtype(mode_names):
+    """One S16 label per hand slot and mode, aligned with the records."""
+    return np.dtype([(name, "S16", (MAX_HANDS,)) for name in mode_names])
+
+
+# ================= WORKER =================
+_worker = {}
+
+
+def _init_worker(mode_names, mirror, infer_width):
+    import cv2
+    import mediapipe as mp
+    from runtime.inference import HandInference
+
+    # Parallelism comes from the processes; one thread each
+    cv2.setNumThreads(1)
+
+    _worker["new_hands"] = lambda: HandInference(
+        mp.solutions.hands.Hands(**BATCH_HANDS_CONFIG), infer_width
+    )
+    _worker["hands"] = None
+    _worker["classifiers"] = load_classifiers(mode_names)
+    _worker["mode_names"] = mode_names
+    _worker["mirror"] = mirror
+
+
+def process_chunk(path, start, stop, fps):
+    """
+    (records, labels, seconds) for frames [start, stop) of `path`;
+    stop=None reads to the end. Record times are seconds into the video.
+    """
+    import cv2
+
+    began = time.perf_counter()
+
+    # A fresh graph per chunk: tracking state carried over from another
+    # chunk (or video) would seed this chunk's first frames with hands
+    # that aren't in them
+    if _worker["hands"] is not None:
+        _worker["hands"].hands.close()
+    hands = _worker["hands"] = _worker["new_hands"]()
+    classifiers = _worker["classifiers"]
+
+    cap = cv2.VideoCapture(path)
+    if start:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+
+    records, labels = [], []
+    index = start
+    empty = np.zeros((), labels_dtype(_worker["mode_names"]))
+    while stop is None or index < stop:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        if _worker["mirror"]:
+            frame = cv2.flip(frame, 1)
+
+        results = hands.process(frame)
+        record = make_record(BATCH_MODE, index + 1, index / fps, results)
+        record["video_frame"] = index
+
+        label = empty.copy()
+        frame_size = (frame.shape[1], frame.shape[0])
+        detected = results.multi_hand_landmarks or []
+        sides = results.multi_handedness or []
+        for h, hand in enumerate(detected[:MAX_HANDS]):
+            side = sides[h].classification[0].label if h < len(sides) else "Right"
+            for mode_name, classify in classifiers.items():
+                label[mode_name][h] = str(classify(hand, side, frame_size)).encode()[:16]
+
+        records.append(record)
+        labels.append(label)
+        index += 1
+
+    cap.release()
+    return (np.array(records, RECORD_DTYPE), np.array(labels, empty.dtype),
+            time.perf_counter() - began)
+
+
+# ================= PLAN =================
+def find_videos(directory):
+    videos = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(VIDEO_EXTENSIONS):
+                videos.append(os.path.join(root, name))
+    return videos
+
+
+def plan_chunks(path, chunk_frames):
+    """(fps, [(start, stop), ...]) for one video."""
+    import cv2
+
+    cap = cv2.VideoCapture(path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+
+    if count <= 0:
+        # Unknown length (some containers): one task reads to the end
+        return fps, [(0, None)]
+    return fps, [(start, min(start + chunk_frames, count))
+                 for start in range(0, count, chunk_frames)]
+
+
+# ================= MERGE =================
+class VideoOutput:
+    """Appends one video's chunks, in order, to its output session."""
+
+    def __init__(self, source, directory, fps, mode_names):
+        self.source = source
+        self.directory = directory
+        self.fps = fps
+        self.mode_names = mode_names
+        self.frames = 0
+        self.hand_frames = 0
+        self.seconds = 0.0
+        self.counts = {name: Counter() for name in mode_names}
+        self._labels = []
+        self._file = None
+
+    def add(self, records, labels, seconds):
+        if self._file is None:
+            # Opened on the first chunk, so only one video is open at a time
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(os.path.join(self.directory, LANDMARKS_FILE), "wb")
+        self._file.write(records.tobytes())
+        self._labels.append(labels)
+        self.frames += len(records)
+        self.hand_frames += int(np.count_nonzero(records["hands"]))
+        self.seconds += seconds
+
+        for name in self.mode_names:
+            for h in range(MAX_HANDS):
+                present = records["hands"] > h
+                values, counts = np.unique(labels[name][present][:, h],
+                                           return_counts=True)
+                for value, n in zip(values, counts):
+                    self.counts[name][value.decode()] += int(n)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        labels = (np.concatenate(self._labels) if self._labels
+                  else np.zeros(0, labels_dtype(self.mode_names)))
+        np.save(os.path.join(self.directory, LABELS_FILE), labels)
+        write_meta(self.directory, created=time.strftime("%Y-%m-%d %H:%M:%S"),
+                   source=os.path.abspath(self.source), video=None,
+                   video_fps=self.fps, mode=BATCH_MODE,
+                   hands_config=BATCH_HANDS_CONFIG, modes=self.mode_names,
+                   labels=LABELS_FILE, frames=self.frames)
+
+    def summary(self):
+        return dict(source=self.source, frames=self.frames,
+                    hand_frames=self.hand_frames,
+                    worker_seconds=round(self.seconds, 2),
+                    labels={name: dict(counts.most_common())
+                            for name, counts in self.counts.items()})
+
+
+# ================= MAIN =================
+def run(args):
+    videos = find_videos(args.videos)
+    if not videos:
+        raise SystemExit(f"No videos in {args.videos}")
+
+    mode_names = list(load_classifiers(args.modes or list(MODE_REGISTRY)))
+
+    tasks = []
+    outputs = {}
+    for path in videos:
+        fps, chunks = plan_chunks(path, args.chunk_frames)
+        relative = os.path.splitext(os.path.relpath(path, args.videos))[0]
+        outputs[path] = VideoOutput(path, os.path.join(args.out, relative),
+                                    fps, mode_names)
+        tasks.extend((path, start, stop, fps) for start, stop in chunks)
+
+    print(f"[Batch] {len(videos)} videos, {len(tasks)} chunks, "
+          f"{args.workers} workers, modes: {', '.join(mode_names)}")
+
+    began = time.perf_counter()
+    executor = ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=get_context("spawn"),   # mediapipe isn't fork-safe
+        initializer=_init_worker,
+        initargs=(mode_names, args.mirror, args.infer_width),
+    )
+
+    # Keep a bounded window of chunks in flight and merge them in
+    # submission order, so each video's records come out in frame order
+    pending = deque()
+    queued = iter(tasks)
+    current = None
+    with executor:
+        for task in queued:
+            pending.append((task[0], executor.submit(process_chunk, *task)))
+            if len(pending) >= args.workers * IN_FLIGHT_PER_WORKER:
+                current = _merge(pending.popleft(), outputs, current)
+        while pending:
+            current = _merge(pending.popleft(), outputs, current)
+    if current is not None:
+        current.close()
+
+    wall = time.perf_counter() - began
+    report = _report(outputs.values(), wall, args.workers)
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, SUMMARY_FILE), "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[Batch] Report saved to {os.path.join(args.out, SUMMARY_FILE)}")
+
+
+def _merge(item, outputs, current):
+    path, future = item
+    output = outputs[path]
+    if output is not current:
+        if current is not None:
+            current.close()
+        current = output
+
+    records, labels, seconds = future.result()
+    output.add(records, labels, seconds)
+    return current
+
+
+def _report(outputs, wall, workers):
+    videos = [output.summary() for output in outputs]
+    frames = sum(v["frames"] for v in videos)
+    worker_seconds = sum(v["worker_seconds"] for v in videos)
+
+    totals = {}
+    for v in videos:
+        for name, counts in v["labels"].items():
+            totals.setdefault(name, Counter()).update(counts)
+
+    report = dict(
+        workers=workers,
+        videos=len(videos),
+        frames=frames,
+        wall_seconds=round(wall, 2),
+        fps=round(frames / wall, 1) if wall else 0.0,
+        worker_seconds=round(worker_seconds, 2),
+        speedup=round(worker_seconds / wall, 2) if wall else 0.0,
+        labels={name: dict(counts.most_common()) for name, counts in totals.items()},
+        per_video=videos,
+    )
+
+    print(f"[Batch] {frames} frames in {wall:.1f} s: {report['fps']} fps, "
+          f"{report['speedup']}x over one worker ({workers} workers)")
+    for name, counts in report["labels"].items():
+        top = ", ".join(f"{label or '-'} {n}" for label, n in list(counts.items())[:6])
+        print(f"  {name:<13} {top}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("videos", help="directory searched recursively for videos")
+    parser.add_argument("--out", default="analysis")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-frames", type=int, default=CHUNK_FRAMES)
+    parser.add_argument("--modes", nargs="+", choices=list(MODE_REGISTRY),
+                        help="modes to label with (default: all that import)")
+    parser.add_argument("--mirror", action="store_true",
+                        help="flip frames first (videos not from the app's camera)")
+    parser.add_argument("--infer-width", type=int,
+                        help="downscale frames to this width for inference")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+import json
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+# ---------------- CONFIG ----------------
+RECORDING_DIR = "recordings"
+MAX_HANDS = 2
+BUFFER_FRAMES = 1024       # landmark records waiting for the writer
+VIDEO_BUFFER_FRAMES = 8    # video frames waiting for the encoder
+VIDEO_FPS = 30
+VIDEO_FOURCC = "mp4v"
+# ----------------------------------------
+
+FORMAT_VERSION = 1
+LANDMARKS_FILE = "landmarks.bin"
+META_FILE = "session.json"
+VIDEO_FILE = "video.mp4"
+
+# One fixed-size record per processed frame. The landmarks file is
+# nothing but these records back to back, so a reader maps it with
+# np.memmap and indexes hours of frames without parsing.
+RECORD_DTYPE = np.dtype([
+    ("seq", "<u8"),                             # camera frame sequence
+    ("t", "<f8"),                               # capture time, perf_counter s
+    ("t_source", "<f8"),                        # backend timestamp or NaN
+    ("mode", "S12"),
+    ("gesture", "S16"),                         # mode's classified gesture
+    ("hands", "u1"),
+    ("landmarks", "<f4", (MAX_HANDS, 21, 3)),   # normalised x, y, z
+    ("handedness", "i1", (MAX_HANDS,)),         # 0 left, 1 right, -1 none
+    ("score", "<f4", (MAX_HANDS,)),
+    ("video_frame", "<i8"),                     # frame in video.mp4, or -1
+])
+
+_HANDEDNESS = {"Left": 0, "Right": 1}
+_STOP = object()
+
+
+# ================= FORMAT =================
+def make_record(mode, seq, t, results, gesture="", t_source=None):
+    """Pack one frame's hand results into a RECORD_DTYPE record."""
+    record = np.zeros((), RECORD_DTYPE)
+    record["seq"] = seq
+    record["t"] = t
+    record["t_source"] = np.nan if t_source is None else t_source
+    record["mode"] = mode.encode()[:12]
+    record["gesture"] = str(gesture).encode()[:16]
+    record["handedness"] = -1
+    record["video_frame"] = -1
+
+    detected = results.multi_hand_landmarks or []
+    sides = results.multi_handedness or []
+    record["hands"] = min(len(detected), MAX_HANDS)
+
+    landmarks = record["landmarks"]
+    for h, hand in enumerate(detected[:MAX_HANDS]):
+        for n, lm in enumerate(hand.landmark):
+            landmarks[h, n] = (lm.x, lm.y, lm.z)
+        if h < len(sides):
+            label = sides[h].classification[0]
+            record["handedness"][h] = _HANDEDNESS.get(label.label, -1)
+            record["score"][h] = label.score
+
+    return record
+
+
+def write_meta(directory, **meta):
+    meta = dict(meta, version=FORMAT_VERSION,
+                record_size=RECORD_DTYPE.itemsize,
+                dtype=RECORD_DTYPE.descr)
+    with open(os.path.join(directory, META_FILE), "w") as f:
+        json.dump(meta, f, indent=2, default=str)
+
+
+def open_session(directory):
+    """
+    (meta, records) for a recorded session. `records` is a read-only
+    np.memmap of RECORD_DTYPE; opening it costs the same for a minute
+    or for hours. A trailing partial record (crash mid-write) is ignored.
+    """
+    with open(os.path.join(directory, META_FILE)) as f:
+        meta = json.load(f)
+    if meta.get("record_size") != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{directory}: unsupported record layout")
+
+    path = os.path.join(directory, LANDMARKS_FILE)
+    count = os.path.getsize(path) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return meta, np.zeros(0, RECORD_DTYPE)
+    return meta, np.memmap(path, RECORD_DTYPE, mode="r", shape=(count,))
+
+
+# ================= RECORDER =================
+class SessionRecorder:
+    """
+    Records every processed frame of whatever mode runs.
+
+    The vision loop only packs a record and enqueues it; a writer
+    thread appends records to the landmarks file, and (optionally) a
+    second thread encodes the raw frames to video. Both queues are
+    bounded and drop (and count) when full, so recording never stalls
+    the loop.
+
+    record_video() takes the raw frame before the mode draws on it;
+    record() then stores the landmarks with that frame's video index.
+
+    session.json has the same keys as recording/batch.py writes: `mode`
+    and `hands_config` of the first mode recorded, `modes` for every
+    mode whose frames are in the session, and `frames` once closed.
+    """
+
+    def __init__(self, directory, video=False, mode=None, hands_config=None):
+        self.directory = directory
+        self.records = 0
+        self.dropped = 0
+        self.video_frames = 0
+        self.video_dropped = 0
+        self._video_seq = None
+        self._video_index = -1
+        os.makedirs(directory, exist_ok=True)
+
+        self._queue = queue.Queue(maxsize=BUFFER_FRAMES)
+        self._writer = threading.Thread(target=self._write_loop,
+                                        name="session-writer", daemon=True)
+        self._writer.start()
+
+        self._video_queue = None
+        if video:
+            self._video_queue = queue.Queue(maxsize=VIDEO_BUFFER_FRAMES)
+            self._encoder = threading.Thread(target=self._video_loop,
+                                             name="session-video", daemon=True)
+            self._encoder.start()
+
+        self.meta = dict(created=time.strftime("%Y-%m-%d %H:%M:%S"),
+                         source=None, video=VIDEO_FILE if video else None,
+                         video_fps=VIDEO_FPS, mode=None, hands_config=None,
+                         modes=[], labels=None, frames=0)
+        if mode is not None:
+            self.mode_started(mode, hands_config)
+        write_meta(directory, **self.meta)
+
+    def mode_started(self, mode, hands_config):
+        """A mode starts recording into this session (once per mode start)."""
+        if self.meta["mode"] is None:
+            self.meta.update(mode=mode, hands_config=hands_config)
+        if mode not in self.meta["modes"]:
+            self.meta["modes"].append(mode)
+        write_meta(self.directory, **self.meta)
+
+    # ================= VISION THREAD =================
+    def record_video(self, frame):
+        if self._video_queue is None:
+            return
+        self._video_seq = frame.seq
+        self._video_index = -1
+        try:
+            # Copy: the loop draws its overlay onto this image next
+            self._video_queue.put_nowait(frame.image.copy())
+            self._video_index = self.video_frames
+            self.video_frames += 1
+        except queue.Full:
+            self.video_dropped += 1
+
+    def record(self, mode, frame, results, gesture=""):
+        record = make_record(mode, frame.seq, frame.t, results, gesture,
+                             frame.t_source)
+        if frame.seq == self._video_seq:
+            record["video_frame"] = self._video_index
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    # ================= WRITER THREADS =================
+    def _write_loop(self):
+        path = os.path.join(self.directory, LANDMARKS_FILE)
+        with open(path, "ab") as f:
+            while True:
+                record = self._queue.get()
+                if record is _STOP:
+                    break
+                f.write(record.tobytes())
+                self.records += 1
+
+                # Flush whenever we catch up, so readers see recent frames
+                if self._queue.empty():
+                    f.flush()
+
+    def _video_loop(self):
+        import cv2
+
+        writer = None
+        size = None
+        while True:
+            image = self._video_queue.get()
+            if image is _STOP:
+                break
+
+            if writer is None:
+                size = (image.shape[1], image.shape[0])
+                writer = cv2.VideoWriter(
+                    os.path.join(self.directory, VIDEO_FILE),
+                    cv2.VideoWriter_fourcc(*VIDEO_FOURCC), VIDEO_FPS, size
+                )
+            elif (image.shape[1], image.shape[0]) != size:
+                # e.g. the low-resolution idle stream
+                image = cv2.resize(image, size)
+            writer.write(image)
+
+        if writer is not None:
+            writer.release()
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._writer.join()
+        if self._video_queue is not None:
+            self._video_queue.put(_STOP)
+            self._encoder.join()
+
+        self.meta["frames"] = self.records
+        write_meta(self.directory, **self.meta)
+
+
+# ---------------- MODULE LEVEL RECORDER ----------------
+_recorder = None
+_mode = None        # (name, hands_config) of the running mode
+
+
+def start_recording(directory=None, video=False):
+    global _recorder
+    stop_recording()
+
+    if directory is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        directory = os.path.join(RECORDING_DIR, f"session_{stamp}")
+
+    _recorder = SessionRecorder(directory, video, *(_mode or ()))
+    return directory
+
+
+def stop_recording():
+    global _recorder
+    recorder, _recorder = _recorder, None
+
+    if recorder:
+        recorder.close()
+        print(f"[Recording] {recorder.records} frames saved to "
+              f"{recorder.directory}")
+        if recorder.dropped or recorder.video_dropped:
+            print(f"[Recording] dropped {recorder.dropped} records, "
+                  f"{recorder.video_dropped} video frames (buffer full)")
+    return recorder
+
+
+def is_recording():
+    return _recorder is not None
+
+
+def mode_started(mode, hands_config):
+    """Called by the mode loop as it starts, for the session metadata."""
+    global _mode
+    _mode = (mode, hands_config)
+    recorder = _recorder
+    if recorder is not None:
+        recorder.mode_started(mode, hands_config)
+
+
+def mode_stopped():
+    global _mode
+    _mode = None
+
+
+# Both helpers are no-ops while no session is being recorded.
+
+def record_video(frame):
+    """Queue the raw captured frame for the session video."""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record_video(frame)
+
+
+def record(mode, frame, results, gesture=""):
+    """Record one processed frame's hands and gesture."""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record(mode, frame, results, gesture)
@@ -0,0 +1,110 @@
+import numpy as np
+
+# ---------------- CONFIG ----------------
+DEFAULT_CAPACITY = 64
+NUM_LANDMARKS = 21
+# ----------------------------------------
+
+HANDEDNESS = {"Left": 0, "Right": 1}
+NO_HAND = -1
+
+
+class LandmarkHistory:
+    """
+    Preallocated ring buffer of hand landmark frames.
+
+    Per slot: 21 x (x, y, z) normalised landmarks, capture time,
+    handedness (0 left, 1 right, -1 unknown) and detection score.
+
+    Every frame is written twice, at i and i + capacity, so the newest
+    n frames are always one contiguous slice: window(n) and the feature
+    helpers return views of the buffer instead of copies, and memory
+    stays the same however long the session runs.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, num_landmarks=NUM_LANDMARKS):
+        self.capacity = capacity
+        self.count = 0
+
+        self._points = np.zeros((2 * capacity, num_landmarks, 3), np.float32)
+        self._t = np.zeros(2 * capacity)
+        self._handedness = np.full(2 * capacity, NO_HAND, np.int8)
+        self._score = np.zeros(2 * capacity, np.float32)
+        self._head = 0
+        self._mean = np.zeros(3, np.float32)
+
+    # ================= WRITE =================
+    def push(self, t, hand_landmarks, handedness=None):
+        """
+        Store one hand from a mediapipe result.
+        `handedness` is the matching multi_handedness entry, if any.
+        """
+        i = self._head
+        slot = self._points[i]
+
+        for n, lm in enumerate(hand_landmarks.landmark):
+            slot[n, 0] = lm.x
+            slot[n, 1] = lm.y
+            slot[n, 2] = lm.z
+
+        if handedness is not None:
+            label = handedness.classification[0]
+            self._handedness[i] = HANDEDNESS.get(label.label, NO_HAND)
+            self._score[i] = label.score
+        else:
+            self._handedness[i] = NO_HAND
+            self._score[i] = 0.0
+        self._t[i] = t
+
+        mirror = i + self.capacity
+        self._points[mirror] = slot
+        self._t[mirror] = t
+        self._handedness[mirror] = self._handedness[i]
+        self._score[mirror] = self._score[i]
+
+        self._head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def clear(self):
+        self.count = 0
+
+    # ================= READ (views) =================
+    def _range(self, n):
+        n = min(n, self.count)
+        end = self._head + self.capacity
+        return end - n, end
+
+    def window(self, n):
+        """(points, t, handedness, score) for the newest n frames, oldest first."""
+        start, end = self._range(n)
+        return (self._points[start:end], self._t[start:end],
+                self._handedness[start:end], self._score[start:end])
+
+    def latest(self):
+        """Landmarks (21 x 3) of the newest frame, or None when empty."""
+        if not self.count:
+            return None
+        return self._points[self._head + self.capacity - 1]
+
+    # ================= TEMPORAL FEATURES =================
+    def mean(self, landmark, n):
+        """Mean (x, y, z) of one landmark over the newest n frames."""
+        start, end = self._range(n)
+        return np.mean(self._points[start:end, landmark], axis=0,
+                       out=self._mean)
+
+    def velocity(self, landmark, n):
+        """
+        (vx, vy) of one landmark across the newest n frames, in
+        normalised frame widths / heights per second.
+        """
+        start, end = self._range(n)
+        if end - start < 2:
+            return 0.0, 0.0
+
+        dt = self._t[end - 1] - self._t[start]
+        if dt <= 0:
+            return 0.0, 0.0
+        first = self._points[start, landmark]
+        last = self._points[end - 1, landmark]
+        return (last[0] - first[0]) / dt, (last[1] - first[1]) / dt
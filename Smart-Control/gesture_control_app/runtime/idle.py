@@ -0,0 +1,111 @@
+import cv2
+
+from runtime import trace
+from runtime.telemetry import BUS
+
+# ---------------- CONFIG ----------------
+IDLE_AFTER = 5.0
+IDLE_SIZE = (320, 240)
+IDLE_FPS = 5
+IDLE_INFER_WIDTH = 192
+# ----------------------------------------
+
+ACTIVE = "ACTIVE"
+IDLE = "IDLE"
+
+
+class IdleGovernor:
+    """
+    Power state machine for a mode loop.
+
+    ACTIVE -> IDLE after `idle_after` seconds without a hand: the camera
+    drops to a low resolution and frame rate and inference runs on a tiny
+    copy of the frame. With no hand being tracked MediaPipe only runs its
+    palm detector, so an idle frame is a small palm-detection pass.
+
+    IDLE -> ACTIVE on the first frame with a hand: the mode's own capture
+    size, rate and inference width are restored straight away.
+
+    When given the loop's FrameScheduler, its tick rate follows the state.
+
+    Time spent in each state is published on the telemetry bus.
+    """
+
+    def __init__(self, mode_name, camera, inference, scheduler=None,
+                 idle_after=IDLE_AFTER):
+        self.mode_name = mode_name
+        self.camera = camera
+        self.inference = inference
+        self.scheduler = scheduler
+        self.idle_after = idle_after
+
+        self.state = ACTIVE
+        self.time_in_state = {ACTIVE: 0.0, IDLE: 0.0}
+
+        self._active_profile = (camera.size, camera.fps, inference.infer_width)
+        self._active_rate = 1 / scheduler.period if scheduler else None
+        self._last_hand = None
+        self._last_t = None
+
+    def update(self, hand_present, t):
+        """Feed one frame; returns the (possibly new) state."""
+        if self._last_t is not None:
+            self.time_in_state[self.state] += t - self._last_t
+        self._last_t = t
+
+        if hand_present or self._last_hand is None:
+            self._last_hand = t
+
+        if self.state == ACTIVE and t - self._last_hand >= self.idle_after:
+            self._enter(IDLE)
+        elif self.state == IDLE and hand_present:
+            self._enter(ACTIVE)
+
+        return self.state
+
+    def display_frame(self, image):
+        """
+        Scale low-resolution idle frames back to the mode's capture size,
+        so overlays drawn in absolute pixels stay where they belong.
+        Display only: inference runs on the small frame as captured.
+        """
+        if (image.shape[1], image.shape[0]) != IDLE_SIZE:
+            return image
+        return cv2.resize(image, self._active_profile[0],
+                          interpolation=cv2.INTER_LINEAR)
+
+    def _enter(self, state):
+        trace.gesture(f"{self.mode_name} power", self.state, state)
+        self.state = state
+
+        if state == IDLE:
+            self.camera.configure(*IDLE_SIZE, IDLE_FPS)
+            self.inference.set_width(IDLE_INFER_WIDTH)
+            rate = IDLE_FPS
+        else:
+            (width, height), fps, infer_width = self._active_profile
+            self.camera.configure(width, height, fps)
+            self.inference.set_width(infer_width)
+            rate = self._active_rate
+
+        if self.scheduler:
+            self.scheduler.set_rate(rate)
+
+        self.publish()
+
+    def publish(self):
+        BUS.publish("power", {
+            "mode": self.mode_name,
+            "state": self.state,
+            "seconds": dict(self.time_in_state)
+        })
+
+    def close(self):
+        # Leave the shared camera the way the next mode expects it
+        if self.state == IDLE:
+            self._enter(ACTIVE)
+
+        seconds = self.time_in_state
+        print(f"[Power] {self.mode_name}: active {seconds[ACTIVE]:.1f}s, "
+              f"idle {seconds[IDLE]:.1f}s")
+        self.publish()
@@ -0,0 +1,63 @@
+import cv2
+import numpy as np
+
+
+class HandInference:
+    """
+    Runs a mediapipe Hands graph on a downscaled copy of each frame.
+
+    The frame is resized with INTER_AREA into a preallocated buffer of
+    `infer_width` pixels wide (aspect ratio kept) and converted to RGB
+    into a second preallocated buffer. MediaPipe landmarks are
+    normalised to [0, 1], so they apply unchanged to the full
+    resolution frame that is drawn and displayed.
+
+    infer_width=None (or a frame narrower than it) infers at full size.
+    """
+
+    def __init__(self, hands, infer_width=None):
+        self.hands = hands
+        self.infer_width = infer_width
+
+        self._shape = None
+        self._small = None
+        self._rgb = None
+
+    def set_width(self, infer_width):
+        if infer_width != self.infer_width:
+            self.infer_width = infer_width
+            self._shape = None
+
+    def _buffers(self, shape):
+        if shape == self._shape:
+            return
+
+        h, w = shape[:2]
+        if self.infer_width and w > self.infer_width:
+            size = (self.infer_width, round(h * self.infer_width / w))
+            self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        else:
+            self._small = None
+
+        rgb_shape = self._small.shape if self._small is not None else shape
+        self._rgb = np.empty(rgb_shape, dtype=np.uint8)
+        self._shape = shape
+
+    def process(self, bgr):
+        """Hand landmarks for a BGR frame (normalised coordinates)."""
+        self._buffers(bgr.shape)
+
+        source = bgr
+        if self._small is not None:
+            h, w = self._small.shape[:2]
+            cv2.resize(bgr, (w, h), dst=self._small,
+                       interpolation=cv2.INTER_AREA)
+            source = self._small
+
+        cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=self._rgb)
+
+        self._rgb.flags.writeable = False
+        try:
+            return self.hands.process(self._rgb)
+        finally:
+            self._rgb.flags.writeable = True
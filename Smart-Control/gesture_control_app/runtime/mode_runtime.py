@@ -0,0 +1,253 @@
+from collections import namedtuple
+from threading import Event
+
+import cv2
+
+from recording import session
+from runtime import trace
+from runtime.idle import IdleGovernor
+from runtime.profiler import FrameProfiler
+from runtime.scheduler import FrameScheduler
+from runtime.tracking import HandTracker
+from runtime.vision import get_camera, get_inference
+from streaming import server as stream
+
+# ---------------- CONFIG ----------------
+ESC = 27
+MEDIAPIPE_MAX_HANDS = 2     # mediapipe's default max_num_hands
+# ----------------------------------------
+
+# An OS action a plugin asks for. `event` names the handler and is the
+# name it is traced under; `args` are its keyword arguments.
+Intent = namedtuple("Intent", "event args")
+
+
+def intent(event, **args):
+    return Intent(event, args)
+
+
+# ================= ACTIONS =================
+_keyboard = None
+
+
+def _gui():
+    import pyautogui
+    return pyautogui
+
+
+def _key_press(key):
+    global _keyboard
+    if _keyboard is None:
+        from pynput.keyboard import Controller
+        _keyboard = Controller()
+    _keyboard.press(key)
+
+
+HANDLERS = {
+    "press": lambda key: _gui().press(key),
+    "moveTo": lambda x, y: _gui().moveTo(x, y, _pause=False),
+    "mouseDown": lambda button: _gui().mouseDown(button=button),
+    "mouseUp": lambda button: _gui().mouseUp(button=button),
+    "click": lambda button: _gui().click(button=button),
+    "doubleClick": lambda button: _gui().doubleClick(button=button),
+    "key": _key_press,
+}
+
+
+class Actions:
+    """
+    Performs the intents plugins return and traces each one as an OS
+    event. pyautogui and pynput are only imported by the first intent
+    that needs them; a plugin registers handlers for anything else
+    (e.g. Volume's pycaw endpoint) in on_start().
+    """
+
+    def __init__(self):
+        self.handlers = dict(HANDLERS)
+        self.performed = 0
+
+    def register(self, event, handler):
+        self.handlers[event] = handler
+
+    def perform(self, intents):
+        for action in intents or ():
+            self.handlers[action.event](**action.args)
+            trace.os_event(action.event, **action.args)
+            self.performed += 1
+
+
+# ================= PLUGINS =================
+class ModePlugin:
+    """
+    One mode's gesture logic, run by a ModeRuntime. The runtime owns the
+    frame loop; a plugin only sees hands:
+
+    - on_start(): once, before the first frame
+    - on_frame(hands, features, t): the visible TrackedHands, their
+      batched HandFeatures (see runtime/tracking.py) and the frame time;
+      returns the Intents to perform
+    - draw(image): this frame's overlay, drawn under the landmarks
+    - on_stop(): once, after the last frame; may return Intents too
+
+    `label` is the frame's gesture as recorded and streamed. While the
+    plugin runs, `runtime` is its ModeRuntime (frame_size, fps, tracker,
+    actions).
+    """
+
+    name = None
+    hands_config = dict(max_num_hands=1)
+    infer_width = None
+    target_fps = 30
+    capture_size = (640, 480)
+    window_title = None
+    exit_key = ESC
+    styled_landmarks = False
+
+    def __init__(self):
+        self.runtime = None
+        self.label = ""
+
+    def on_start(self):
+        pass
+
+    def on_frame(self, hands, features, t):
+        return []
+
+    def draw(self, image):
+        pass
+
+    def on_stop(self):
+        return []
+
+
+# ================= RUNTIME =================
+class ModeRuntime:
+    """
+    The frame loop of every mode: pace, capture, infer, track hands,
+    run the plugins, record and stream, draw, show, pump keys.
+
+    Several plugins can share one loop, and with it one camera read and
+    one inference pass per frame. The first plugin is the primary: it
+    names the mode and sets the capture size, tracking config, rate,
+    window and exit key; the others only add gesture logic and overlays.
+    """
+
+    def __init__(self, plugins):
+        self.plugins = list(plugins)
+        self.primary = self.plugins[0]
+        self.name = self.primary.name
+        self.tracker = HandTracker()
+        self.actions = Actions()
+        self.frame_size = self.primary.capture_size
+        self.fps = 0.0
+
+    def hands_config(self):
+        """The primary's tracking config, with room for every plugin's hands."""
+        config = dict(self.primary.hands_config)
+        config["max_num_hands"] = max(
+            plugin.hands_config.get("max_num_hands", MEDIAPIPE_MAX_HANDS)
+            for plugin in self.plugins
+        )
+        return config
+
+    def run(self, stop_event=None):
+        import mediapipe as mp
+
+        stop_event = stop_event or Event()
+        primary = self.primary
+
+        camera = get_camera(*primary.capture_size)
+        hands_config = self.hands_config()
+        hands = get_inference(camera, hands_config, primary.infer_width)
+        session.mode_started(self.name, hands_config)
+
+        # Landmark style, looked up once instead of per hand and frame
+        drawing = mp.solutions.drawing_utils
+        draw_args = (mp.solutions.hands.HAND_CONNECTIONS,)
+        if primary.styled_landmarks:
+            styles = mp.solutions.drawing_styles
+            draw_args += (styles.get_default_hand_landmarks_style(),
+                          styles.get_default_hand_connections_style())
+
+        profiler = FrameProfiler(self.name)
+        scheduler = FrameScheduler(self.name, primary.target_fps)
+        idle = IdleGovernor(self.name, camera, hands, scheduler)
+
+        for plugin in self.plugins:
+            plugin.runtime = self
+            plugin.on_start()
+
+        previous_t = None
+        try:
+            while not stop_event.is_set():
+                scheduler.wait()
+                profiler.begin_frame()
+
+                captured = camera.read()
+                if captured is None:
+                    break
+                if not scheduler.is_new(captured):
+                    # A repeated frame (e.g. a network stream that is
+                    # down) skips inference and gestures, but the window
+                    # keeps repainting and ESC still stops the mode
+                    profiler.discard_frame()
+                    key = scheduler.pump()
+                    profiler.handle_key(key)
+                    if key == primary.exit_key:
+                        break
+                    continue
+                session.record_video(captured)
+                profiler.lap("capture")
+
+                # Inference sees the frame as captured; only the copy that
+                # is drawn and shown is scaled back up while idle
+                results = hands.process(captured.image)
+                t = captured.t
+                idle.update(bool(results.multi_hand_landmarks), t)
+                image = idle.display_frame(captured.image)
+                self.frame_size = (image.shape[1], image.shape[0])
+                profiler.lap("inference")
+
+                visible = self.tracker.update(results, t)
+                features = self.tracker.features()
+                for plugin in self.plugins:
+                    self.actions.perform(plugin.on_frame(visible, features, t))
+
+                label = primary.label
+                session.record(self.name, captured, results, label)
+                stream.publish_frame(self.name, captured, results, label)
+                profiler.lap("gestures")
+
+                self.fps = 1 / (t - previous_t) if previous_t and t != previous_t else 0.0
+                previous_t = t
+
+                for plugin in self.plugins:
+                    plugin.draw(image)
+                for hand in visible:
+                    drawing.draw_landmarks(image, hand.landmarks, *draw_args)
+
+                cv2.imshow(primary.window_title, image)
+
+                key = scheduler.pump()
+                profiler.lap("render")
+                profiler.handle_key(key)
+                profiler.end_frame()
+
+                if key == primary.exit_key:
+                    break
+        finally:
+            session.mode_stopped()
+            for plugin in self.plugins:
+                self.actions.perform(plugin.on_stop())
+                plugin.runtime = None
+
+            idle.close()
+            scheduler.close()
+            profiler.close()
+            cv2.destroyAllWindows()
+            print(f"{self.name} mode stopped.")
+
+
+def run_plugins(plugin_classes, stop_event=None):
+    """Run one mode made of `plugin_classes` until stopped (ESC or the event)."""
+    ModeRuntime([plugin_class() for plugin_class in plugin_classes]).run(stop_event)
@@ -0,0 +1,198 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+from threading import Lock
+
+from runtime import trace
+
+# ---------------- CONFIG ----------------
+PROFILE_DIR = "profiles"
+DEFAULT_PROFILE_SECONDS = 10
+SUMMARY_TOP_N = 25
+PROFILE_HOTKEY = ord('p')
+DEFAULT_FRAME_BUDGET_MS = 50
+# ----------------------------------------
+
+_lock = Lock()
+_requested_seconds = None
+_frame_budget_ms = None
+_frame_listeners = []
+
+
+# ---------------- REQUESTS FROM THE UI THREAD ----------------
+def request_profile(seconds=DEFAULT_PROFILE_SECONDS):
+    """
+    Ask the running mode to profile its vision thread for `seconds`.
+    Picked up by the next FrameProfiler.begin_frame() call, so the
+    profiler is always enabled on the thread that runs the loop.
+    """
+    global _requested_seconds
+    with _lock:
+        _requested_seconds = seconds
+
+
+def set_frame_budget(budget_ms):
+    """Log frames slower than `budget_ms` (None disables)."""
+    global _frame_budget_ms
+    with _lock:
+        _frame_budget_ms = budget_ms
+
+
+def add_frame_listener(callback):
+    """Call `callback(frame_profiler, total_ms)` after every frame."""
+    if callback not in _frame_listeners:
+        _frame_listeners.append(callback)
+
+
+def remove_frame_listener(callback):
+    if callback in _frame_listeners:
+        _frame_listeners.remove(callback)
+
+
+def _take_request():
+    global _requested_seconds
+    with _lock:
+        seconds = _requested_seconds
+        _requested_seconds = None
+    return seconds
+
+
+# ---------------- FRAME PROFILER ----------------
+class FrameProfiler:
+    """
+    Per-mode frame timing hooks.
+    Handles:
+    - Per-stage timings for every frame
+    - Slow frame logging against a time budget
+    - On-demand cProfile capture of the vision thread
+    """
+
+    def __init__(self, mode_name):
+        self.mode_name = mode_name
+        self.frame_index = 0
+        self.stages = {}
+
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+        self._profile = None
+        self._profile_until = 0.0
+
+    # ================= FRAME BOUNDARIES =================
+    def begin_frame(self):
+        self.frame_index += 1
+        self.stages = {}
+        self._frame_start = time.perf_counter()
+        self._last_mark = self._frame_start
+
+        seconds = _take_request()
+        if seconds is not None:
+            self.start_profile(seconds)
+        elif self._profile and self._frame_start >= self._profile_until:
+            self.stop_profile()
+
+    def lap(self, name):
+        """Close the stage `name`: time since the previous mark."""
+        now = time.perf_counter()
+        self.stages[name] = self.stages.get(name, 0.0) + now - self._last_mark
+        trace.span(name, self._last_mark, now)
+        self._last_mark = now
+
+    def end_frame(self):
+        end = time.perf_counter()
+        total_ms = (end - self._frame_start) * 1000
+
+        trace.span(
+            f"{self.mode_name} frame",
+            self._frame_start, end,
+            cat="frame",
+            args={"frame": self.frame_index}
+        )
+
+        budget_ms = _frame_budget_ms
+        if budget_ms is not None and total_ms > budget_ms:
+            self._log_slow_frame(total_ms, budget_ms)
+
+        for listener in tuple(_frame_listeners):
+            listener(self, total_ms)
+
+        return total_ms
+
+    def discard_frame(self):
+        """Drop the frame begun last (nothing was processed) untimed."""
+        self.frame_index -= 1
+        self.stages = {}
+
+    # ================= HOTKEY =================
+    def handle_key(self, key):
+        """Toggle profiling from the OpenCV window ('p')."""
+        if key != PROFILE_HOTKEY:
+            return
+        if self._profile:
+            self.stop_profile()
+        else:
+            self.start_profile(DEFAULT_PROFILE_SECONDS)
+
+    # ================= CPROFILE =================
+    def start_profile(self, seconds):
+        if self._profile:
+            self.stop_profile()
+
+        self._profile = cProfile.Profile()
+        self._profile_until = time.perf_counter() + seconds
+        self._profile.enable()
+        print(f"[Profiler] {self.mode_name}: profiling for {seconds}s")
+
+    def stop_profile(self):
+        if not self._profile:
+            return
+
+        profile = self._profile
+        profile.disable()
+        self._profile = None
+
+        path = self._dump(profile)
+        print(f"[Profiler] {self.mode_name}: profile written to {path}")
+
+    def _dump(self, profile):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(
+            PROFILE_DIR,
+            f"{self.mode_name.lower()}_{stamp}"
+        )
+
+        profile.dump_stats(base + ".prof")
+
+        summary = io.StringIO()
+        stats = pstats.Stats(profile, stream=summary)
+        stats.sort_stats("cumulative").print_stats(SUMMARY_TOP_N)
+        stats.sort_stats("tottime").print_stats(SUMMARY_TOP_N)
+
+        with open(base + ".txt", "w") as f:
+            f.write(summary.getvalue())
+
+        return base + ".prof"
+
+    # ================= SLOW FRAMES =================
+    def _log_slow_frame(self, total_ms, budget_ms):
+        breakdown = "  ".join(
+            f"{name}={seconds * 1000:.1f}ms"
+            for name, seconds in self.stages.items()
+        )
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(
+            PROFILE_DIR,
+            f"{self.mode_name.lower()}_slow_frames.log"
+        )
+        with open(path, "a") as f:
+            f.write(
+                f"{time.strftime('%H:%M:%S')} frame={self.frame_index} "
+                f"total={total_ms:.1f}ms budget={budget_ms}ms  {breakdown}\n"
+            )
+
+    # ================= CLEANUP =================
+    def close(self):
+        self.stop_profile()
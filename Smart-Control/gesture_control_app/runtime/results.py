@@ -0,0 +1,36 @@
+from collections import namedtuple
+
+import numpy as np
+
+# The parts of a mediapipe Hands result the modes read, for results
+# that don't come from a local graph (other processes, simulation)
+class Landmark(namedtuple("Landmark", "x y z")):
+    __slots__ = ()
+
+    def HasField(self, name):
+        # mediapipe's drawing_utils asks about visibility / presence
+        return False
+
+
+HandLandmarks = namedtuple("HandLandmarks", "landmark")
+Classification = namedtuple("Classification", "index score label")
+Handedness = namedtuple("Handedness", "classification")
+Results = namedtuple("Results", "multi_hand_landmarks multi_handedness")
+
+NO_HANDS = Results(None, None)
+
+
+def hand_result(points, side, score):
+    """(HandLandmarks, Handedness) for one hand's (21, 3) points."""
+    landmarks = HandLandmarks([Landmark(*p) for p in np.asarray(points).tolist()])
+    handedness = Handedness([Classification(0 if side == "Left" else 1,
+                                            float(score), side)])
+    return landmarks, handedness
+
+
+def make_results(hands):
+    """Results from (points, side, score) tuples; NO_HANDS for none."""
+    if not hands:
+        return NO_HANDS
+    pairs = [hand_result(*hand) for hand in hands]
+    return Results([p[0] for p in pairs], [p[1] for p in pairs])
@@ -0,0 +1,76 @@
+import time
+
+import cv2
+
+# ---------------- CONFIG ----------------
+DEFAULT_RATE = 30
+# time.sleep() can overshoot by a scheduler quantum (several ms on
+# Windows), so the last stretch before a deadline is spun instead
+SPIN_MARGIN = 0.002
+# ----------------------------------------
+
+
+class FrameScheduler:
+    """
+    Paces a mode loop to a target rate.
+
+    - wait(): sleeps until the next tick deadline
+    - is_new(frame): False for a frame already processed (same seq),
+      so repeated driver buffers are not run through inference again
+    - pump(): services HighGUI events once per rendered frame and
+      returns the key pressed (0xFF when none)
+
+    Deadlines advance by a fixed period, so the rate does not drift
+    with per-frame work. A loop that falls more than a period behind
+    (slow frame, blocked camera read) restarts from now instead of
+    bursting to catch up.
+    """
+
+    def __init__(self, mode_name, rate=DEFAULT_RATE):
+        self.mode_name = mode_name
+        self.period = 1 / rate
+        self.ticks = 0
+        self.late = 0
+        self.skipped = 0
+
+        self._deadline = None
+        # Sources number frames from 1; seq 0 is a placeholder frame
+        self._last_seq = 0
+
+    def set_rate(self, rate):
+        self.period = 1 / rate
+        self._deadline = None
+
+    # ================= TICK =================
+    def wait(self):
+        now = time.perf_counter()
+        if self._deadline is None:
+            self._deadline = now
+        elif now - self._deadline > self.period:
+            self.late += 1
+            self._deadline = now
+        else:
+            remaining = self._deadline - now
+            if remaining > SPIN_MARGIN:
+                time.sleep(remaining - SPIN_MARGIN)
+            while time.perf_counter() < self._deadline:
+                pass
+
+        self._deadline += self.period
+        self.ticks += 1
+
+    def is_new(self, frame):
+        if frame.seq == self._last_seq:
+            self.skipped += 1
+            return False
+        self._last_seq = frame.seq
+        return True
+
+    # ================= GUI =================
+    def pump(self):
+        return cv2.waitKey(1) & 0xFF
+
+    def close(self):
+        print(f"[Scheduler] {self.mode_name}: {self.ticks} ticks at "
+              f"{1 / self.period:.0f} fps, {self.skipped} duplicate frames "
+              f"skipped, {self.late} late")
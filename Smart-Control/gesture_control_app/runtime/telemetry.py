@@ -0,0 +1,119 @@
+import time
+from collections import deque
+from threading import Lock
+
+# ---------------- CONFIG ----------------
+EVENT_CAPACITY = 64
+PUBLISH_INTERVAL = 0.25
+LATENCY_WINDOW = 120
+PERCENTILES = (50, 95, 99)
+# ----------------------------------------
+
+
+# ---------------- MESSAGE BUS ----------------
+class TelemetryBus:
+    """
+    Bounded, thread-safe channel from vision threads to the Tk thread.
+    - Events (status changes) are kept in order; the oldest are dropped
+      once EVENT_CAPACITY is reached.
+    - Snapshots (telemetry) are coalesced per topic: only the latest
+      one survives until the UI drains the bus.
+    Publishing never blocks on the UI.
+    """
+
+    def __init__(self, capacity=EVENT_CAPACITY):
+        self._lock = Lock()
+        self._events = deque(maxlen=capacity)
+        self._latest = {}
+
+    def post(self, topic, payload):
+        with self._lock:
+            self._events.append((topic, payload))
+
+    def publish(self, topic, payload):
+        with self._lock:
+            self._latest[topic] = payload
+
+    def drain(self):
+        """Return (events, latest snapshots) and empty the bus."""
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+            latest, self._latest = self._latest, {}
+        return events, latest
+
+
+BUS = TelemetryBus()
+
+
+# ---------------- TELEMETRY COLLECTOR ----------------
+def _percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))
+    return sorted_values[index]
+
+
+class TelemetryCollector:
+    """
+    Frame listener (see runtime.profiler.add_frame_listener) that turns
+    FrameProfiler timings into a periodic snapshot on the bus:
+    FPS, per-stage latency percentiles, frame accounting and CPU usage.
+    `frame_stats` returns the capture source's FrameStats (or None).
+    """
+
+    def __init__(self, bus=BUS, frame_stats=None):
+        self.bus = bus
+        self.frame_stats = frame_stats or (lambda: None)
+
+        self.mode_name = None
+        self.stage_ms = {}
+        self.frames = 0
+
+        self._window_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def on_frame(self, frame_profiler, total_ms):
+        if frame_profiler.mode_name != self.mode_name:
+            self.reset(frame_profiler.mode_name)
+
+        self.frames += 1
+        for name, seconds in frame_profiler.stages.items():
+            self.stage_ms.setdefault(
+                name, deque(maxlen=LATENCY_WINDOW)
+            ).append(seconds * 1000)
+        self.stage_ms.setdefault(
+            "total", deque(maxlen=LATENCY_WINDOW)
+        ).append(total_ms)
+
+        now = time.perf_counter()
+        if now - self._window_start >= PUBLISH_INTERVAL:
+            self.bus.publish("telemetry", self.snapshot(now))
+            self._window_start = now
+            self._cpu_start = time.process_time()
+            self.frames = 0
+
+    def snapshot(self, now):
+        elapsed = now - self._window_start
+        cpu = time.process_time() - self._cpu_start
+
+        latency = {}
+        for name, values in self.stage_ms.items():
+            ordered = sorted(values)
+            latency[name] = tuple(_percentile(ordered, p) for p in PERCENTILES)
+
+        stats = self.frame_stats()
+
+        return {
+            "mode": self.mode_name,
+            "fps": self.frames / elapsed,
+            "cpu": 100 * cpu / elapsed,
+            "dropped": stats.dropped if stats else 0,
+            "duplicates": stats.duplicates if stats else 0,
+            "latency_ms": latency
+        }
+
+    def reset(self, mode_name):
+        self.mode_name = mode_name
+        self.stage_ms = {}
+        self.frames = 0
+        self._window_start = time.perf_counter()
+        self._cpu_start = time.process_time()
@@ -0,0 +1,143 @@
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+# ---------------- CONFIG ----------------
+CONFIG_PATH = "thread_config.json"
+
+# None leaves the library / OS default in place. CPU lists are core
+# indices, e.g. [2, 3]. Values in CONFIG_PATH override these.
+THREAD_CONFIG = dict(
+    opencv_threads=None,      # cv2.setNumThreads
+    inference_threads=None,   # cores the MediaPipe graph threads may use
+    capture_cpus=None,        # MJPG grab / decode thread
+    inference_cpus=None,      # mode loop: inference, gestures, OS events
+    raise_priority=False      # raise the mode loop thread's priority
+)
+# ----------------------------------------
+
+_config = None
+
+
+# ================= CONFIGURATION =================
+def get_config():
+    """THREAD_CONFIG merged with the overrides in CONFIG_PATH."""
+    global _config
+
+    if _config is None:
+        config = dict(THREAD_CONFIG)
+        try:
+            with open(CONFIG_PATH) as f:
+                config.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        _config = config
+    return _config
+
+
+def set_config(**settings):
+    """Override settings for this process (used by the sweep benchmark)."""
+    get_config().update(settings)
+
+
+def save_config(settings):
+    tmp = CONFIG_PATH + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(settings, f, indent=2)
+    os.replace(tmp, CONFIG_PATH)
+
+
+# ================= AFFINITY / PRIORITY =================
+def _get_affinity():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _set_affinity(cpus):
+    """Pin the calling thread to `cpus`. Returns False if unsupported."""
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            # pid 0 is the calling thread on Linux
+            os.sched_setaffinity(0, cpus)
+            return True
+
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            mask = sum(1 << cpu for cpu in cpus)
+            return bool(kernel32.SetThreadAffinityMask(
+                kernel32.GetCurrentThread(), mask
+            ))
+    except OSError as e:
+        print(f"[Threads] Could not pin to CPUs {list(cpus)}: {e}")
+    return False
+
+
+def _raise_priority():
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            THREAD_PRIORITY_ABOVE_NORMAL = 1
+            return bool(kernel32.SetThreadPriority(
+                kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL
+            ))
+
+        # Negative nice values need CAP_SYS_NICE (or root)
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -5)
+        return True
+    except (OSError, AttributeError) as e:
+        print(f"[Threads] Could not raise priority: {e}")
+    return False
+
+
+# ================= APPLY =================
+def apply_process_settings():
+    """Process-wide settings; call once at start-up."""
+    config = get_config()
+    if config["opencv_threads"] is not None:
+        # Imported here so app start-up doesn't wait on OpenCV
+        import cv2
+        cv2.setNumThreads(config["opencv_threads"])
+
+
+def pin_thread(role):
+    """
+    Apply the affinity (and priority) configured for `role` to the
+    calling thread: "capture" or "inference".
+    """
+    config = get_config()
+
+    cpus = config.get(f"{role}_cpus")
+    if cpus:
+        _set_affinity(cpus)
+
+    if role == "inference" and config["raise_priority"]:
+        _raise_priority()
+
+
+@contextmanager
+def graph_affinity():
+    """
+    Build a MediaPipe graph inside this block to cap its threads.
+
+    MediaPipe has no thread-count option in its Python API, but on Linux
+    new threads inherit the creating thread's affinity, so restricting
+    it to `inference_threads` cores while the graph starts bounds the
+    executor and TFLite threads the graph spawns.
+    """
+    count = get_config()["inference_threads"]
+    if not count or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+
+    previous = _get_affinity()
+    cpus = (get_config()["inference_cpus"] or previous)[:count]
+    _set_affinity(cpus)
+    try:
+        yield
+    finally:
+        _set_affinity(previous)
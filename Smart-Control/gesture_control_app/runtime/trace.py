@@ -0,0 +1,161 @@
+import json
+import os
+import queue
+import threading
+import time
+
+# ---------------- CONFIG ----------------
+TRACE_DIR = "traces"
+BUFFER_EVENTS = 50000
+# ----------------------------------------
+
+_STOP = object()
+
+
+def _now_us():
+    return time.perf_counter() * 1e6
+
+
+# ---------------- TRACE RECORDER ----------------
+class TraceRecorder:
+    """
+    Chrome Trace Event / Perfetto JSON writer.
+    Vision threads only enqueue events into a bounded buffer;
+    a background thread serialises them to disk. When the buffer
+    is full, new events are dropped (and counted), never blocked on.
+    """
+
+    def __init__(self, path, capacity=BUFFER_EVENTS):
+        self.path = path
+        self.dropped = 0
+
+        self._queue = queue.Queue(maxsize=capacity)
+        self._pid = os.getpid()
+        self._named_threads = set()
+
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name="trace-writer",
+            daemon=True
+        )
+        self._writer.start()
+
+    # ================= RECORDING =================
+    def record(self, event):
+        tid = threading.get_ident()
+        event["pid"] = self._pid
+        event["tid"] = tid
+
+        if tid not in self._named_threads:
+            self._named_threads.add(tid)
+            self._put({
+                "ph": "M", "name": "thread_name",
+                "pid": self._pid, "tid": tid,
+                "args": {"name": threading.current_thread().name}
+            })
+
+        self._put(event)
+
+    def _put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    # ================= WRITER THREAD =================
+    def _write_loop(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self.path, "w") as f:
+            f.write("[\n")
+            first = True
+
+            while True:
+                event = self._queue.get()
+                if event is _STOP:
+                    break
+
+                if not first:
+                    f.write(",\n")
+                f.write(json.dumps(event, separators=(",", ":")))
+                first = False
+
+            f.write("\n]\n")
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._writer.join()
+
+
+# ---------------- MODULE LEVEL RECORDER ----------------
+_recorder = None
+
+
+def start_trace(path=None):
+    global _recorder
+    stop_trace()
+
+    if path is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(TRACE_DIR, f"trace_{stamp}.json")
+
+    _recorder = TraceRecorder(path)
+    return path
+
+
+def stop_trace():
+    global _recorder
+    recorder, _recorder = _recorder, None
+
+    if recorder:
+        recorder.close()
+        if recorder.dropped:
+            print(f"[Trace] {recorder.dropped} events dropped (buffer full)")
+    return recorder
+
+
+def is_tracing():
+    return _recorder is not None
+
+
+# ---------------- EVENT HELPERS ----------------
+# All helpers are no-ops while no trace is being recorded.
+
+def span(name, start, end, cat="stage", args=None):
+    """Complete event; `start`/`end` are time.perf_counter() seconds."""
+    recorder = _recorder
+    if recorder is None:
+        return
+    event = {
+        "ph": "X", "name": name, "cat": cat,
+        "ts": start * 1e6, "dur": (end - start) * 1e6
+    }
+    if args:
+        event["args"] = args
+    recorder.record(event)
+
+
+def instant(name, cat, args=None):
+    recorder = _recorder
+    if recorder is None:
+        return
+    event = {"ph": "i", "s": "t", "name": name, "cat": cat, "ts": _now_us()}
+    if args:
+        event["args"] = args
+    recorder.record(event)
+
+
+def gesture(mode_name, previous, current):
+    """Gesture state transition from a mode's stabilizer."""
+    instant(
+        f"{mode_name}: {previous or '-'} -> {current or '-'}",
+        "gesture",
+        {"mode": mode_name, "from": previous, "to": current}
+    )
+
+
+def os_event(action, **args):
+    """Input event injected into the OS (key press, click, volume)."""
+    instant(action, "input", args)
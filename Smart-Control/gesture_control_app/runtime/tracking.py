@@ -0,0 +1,200 @@
+from collections import namedtuple
+from itertools import permutations
+
+import numpy as np
+
+from runtime.history import LandmarkHistory
+
+# ---------------- CONFIG ----------------
+MAX_MATCH_DISTANCE = 0.25   # wrist travel between frames, normalised
+SIDE_PENALTY = 0.15         # cost added when handedness disagrees
+MAX_MISSED = 5              # frames a lost hand keeps its ID
+MAX_HANDS = 4
+# ----------------------------------------
+
+WRIST = 0
+FINGERTIPS = [4, 8, 12, 16, 20]
+
+HandFeatures = namedtuple("HandFeatures", "points tip_distances extended")
+
+
+class TrackedHand:
+    """One hand with an ID that stays the same from frame to frame."""
+
+    __slots__ = ("id", "side", "score", "landmarks", "history",
+                 "missed", "row")
+
+    def __init__(self, hand_id, side):
+        self.id = hand_id
+        self.side = side
+        self.score = 0.0
+        self.landmarks = None      # mediapipe landmark list, for drawing
+        self.history = LandmarkHistory()
+        self.missed = 0
+        self.row = None            # row in the tracker's feature batch
+
+    @property
+    def wrist(self):
+        return self.history.latest()[WRIST, :2]
+
+
+# ================= ASSIGNMENT =================
+def assign(cost, gate):
+    """
+    Minimum-cost matching of rows to columns; pairs costing `gate` or
+    more stay unmatched. Enumerates permutations, which is exact and
+    cheap for the handful of hands MediaPipe reports.
+    """
+    rows, cols = cost.shape
+    if not rows or not cols:
+        return []
+
+    clipped = np.minimum(cost, gate)
+    if rows <= cols:
+        candidates = (list(zip(range(rows), p))
+                      for p in permutations(range(cols), rows))
+    else:
+        candidates = (list(zip(p, range(cols)))
+                      for p in permutations(range(rows), cols))
+
+    best = min(candidates, key=lambda pairs: sum(clipped[r, c] for r, c in pairs))
+    return [(r, c) for r, c in best if cost[r, c] < gate]
+
+
+class HandTracker:
+    """
+    Gives each detected hand a persistent ID.
+
+    Detections are matched to existing tracks on wrist position plus a
+    penalty when handedness disagrees. A track survives MAX_MISSED
+    frames without a match, so a brief detection drop doesn't hand the
+    ID (and whatever the hand controls) to the other hand.
+
+    features() computes per-hand features for every visible hand in one
+    batch over a preallocated (hands x 21 x 3) array.
+    """
+
+    def __init__(self, max_hands=MAX_HANDS, max_distance=MAX_MATCH_DISTANCE,
+                 side_penalty=SIDE_PENALTY, max_missed=MAX_MISSED):
+        self.max_distance = max_distance
+        self.side_penalty = side_penalty
+        self.max_missed = max_missed
+
+        self.tracks = []
+        self.visible = []
+        self._next_id = 1
+        self._points = np.zeros((max_hands, 21, 3), np.float32)
+
+    def update(self, results, t):
+        """Match this frame's hands; returns the visible TrackedHands by ID."""
+        detections = results.multi_hand_landmarks or []
+        sides = results.multi_handedness or [None] * len(detections)
+        labels = [s.classification[0].label if s else None for s in sides]
+
+        cost = np.zeros((len(detections), len(self.tracks)))
+        for d, hand_landmarks in enumerate(detections):
+            wrist = hand_landmarks.landmark[WRIST]
+            for k, track in enumerate(self.tracks):
+                tx, ty = track.wrist
+                cost[d, k] = np.hypot(wrist.x - tx, wrist.y - ty)
+                if labels[d] != track.side:
+                    cost[d, k] += self.side_penalty
+
+        matched = dict(assign(cost, self.max_distance))
+
+        for track in self.tracks:
+            track.missed += 1
+
+        for d, hand_landmarks in enumerate(detections):
+            if d in matched:
+                track = self.tracks[matched[d]]
+            else:
+                track = TrackedHand(self._next_id, labels[d])
+                self._next_id += 1
+                self.tracks.append(track)
+
+            track.missed = 0
+            track.side = labels[d]
+            track.landmarks = hand_landmarks
+            track.history.push(t, hand_landmarks, sides[d])
+            track.score = sides[d].classification[0].score if sides[d] else 0.0
+
+        self.tracks = [tr for tr in self.tracks if tr.missed <= self.max_missed]
+        self.visible = sorted(
+            (tr for tr in self.tracks if tr.missed == 0),
+            key=lambda tr: tr.id
+        )[:len(self._points)]
+        return self.visible
+
+    # ================= BATCH FEATURES =================
+    def features(self):
+        """
+        HandFeatures for the visible hands; row i belongs to the hand
+        whose .row is i.
+        - points: (H, 21, 3) landmarks
+        - tip_distances: (H, 5, 5) 2D distance between fingertips
+          (thumb, index, middle, ring, pinky)
+        - extended: (H, 5) finger-up flags
+        """
+        count = len(self.visible)
+        points = self._points[:count]
+        for row, hand in enumerate(self.visible):
+            hand.row = row
+            points[row] = hand.history.latest()
+
+        tips = points[:, FINGERTIPS, :2]
+        tip_distances = np.linalg.norm(
+            tips[:, :, None, :] - tips[:, None, :, :], axis=-1
+        )
+
+        extended = np.empty((count, 5), dtype=bool)
+        # Fingers: tip above the PIP joint. Thumb: tip outside the IP
+        # joint, which depends on handedness in the mirrored image.
+        extended[:, 1:] = points[:, FINGERTIPS[1:], 1] < points[:, [6, 10, 14, 18], 1]
+        right = np.array([h.side == "Right" for h in self.visible], dtype=bool)
+        thumb_out = points[:, 4, 0] < points[:, 3, 0]
+        extended[:, 0] = np.where(right, thumb_out, ~thumb_out)
+
+        return HandFeatures(points, tip_distances, extended)
+
+
+# ================= ROUTING =================
+class HandRouter:
+    """
+    Assigns tracked hands to named consumers (e.g. "cursor", "media").
+
+    `routes` maps a route name to the side it wants ("Left", "Right")
+    or None for any hand. A route keeps the hand ID it was given for as
+    long as the tracker keeps that ID, even if the handedness label
+    flickers; a free route takes an unclaimed visible hand of its side.
+    """
+
+    def __init__(self, routes):
+        self.routes = dict(routes)
+        self.bound = {}
+
+    def assign(self, tracker):
+        """Route name -> visible TrackedHand for this frame."""
+        visible = tracker.visible
+        by_id = {hand.id: hand for hand in visible}
+        alive = {track.id for track in tracker.tracks}
+        routed = {}
+
+        for route, hand_id in list(self.bound.items()):
+            if hand_id not in alive:
+                del self.bound[route]
+            elif hand_id in by_id:
+                routed[route] = by_id[hand_id]
+
+        claimed = set(self.bound.values())
+        for route, side in self.routes.items():
+            if route in self.bound:
+                continue
+            for hand in visible:
+                if hand.id not in claimed and side in (None, hand.side):
+                    routed[route] = hand
+                    self.bound[route] = hand.id
+                    claimed.add(hand.id)
+                    break
+
+        return routed
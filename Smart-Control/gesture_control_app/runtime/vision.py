@@ -0,0 +1,156 @@
+from importlib import import_module
+from threading import Lock, Thread
+
+from models.mode_registry import MODE_REGISTRY
+from runtime.threads import graph_affinity
+
+# ---------------- CONFIG ----------------
+WARMUP_INFERENCES = 3
+WARMUP_FRAME_SIZE = (480, 640)
+
+# Device index, or a network camera: "http://host:8080/stream" (MJPEG)
+# or "rtsp://host/stream"; see camera/network.py. A list of sources
+# runs every camera in its own process; see camera/multi.py
+CAMERA_SOURCE = 0
+# ----------------------------------------
+
+# Shared vision stack. Hand-tracking graphs are cached per configuration
+# and the camera stays open between modes, so starting a mode after the
+# warm-up costs neither a graph build nor a camera open.
+_lock = Lock()
+_hands = {}
+_camera = None
+_warmup_thread = None
+
+
+# ================= HAND TRACKING =================
+class SharedHands:
+    """
+    A cached mediapipe Hands graph. The warm-up thread and a mode loop
+    can reach the same graph, and a graph must not run two frames at
+    once, so process() calls are serialised (uncontended, the lock
+    costs next to nothing per frame).
+    """
+
+    def __init__(self, hands):
+        self.hands = hands
+        self._lock = Lock()
+
+    def process(self, image):
+        with self._lock:
+            return self.hands.process(image)
+
+    def close(self):
+        with self._lock:
+            self.hands.close()
+
+
+def get_hands(config):
+    """Return the shared mediapipe Hands graph for `config` (a dict)."""
+    key = tuple(sorted(config.items()))
+
+    with _lock:
+        hands = _hands.get(key)
+        if hands is None:
+            import mediapipe as mp
+            with graph_affinity():
+                hands = SharedHands(mp.solutions.hands.Hands(**config))
+            _hands[key] = hands
+    return hands
+
+
+def get_inference(camera, config, infer_width=None):
+    """
+    Hand inference for a mode on `camera`, as get_camera() opened it: a
+    HandInference on the shared graph, or, with several cameras, the
+    hands their processes already tracked.
+    """
+    if isinstance(CAMERA_SOURCE, (list, tuple)) and len(CAMERA_SOURCE) > 1:
+        from camera.multi import MultiCameraHands
+        return MultiCameraHands(camera, config, infer_width)
+
+    from runtime.inference import HandInference
+    return HandInference(get_hands(config), infer_width)
+
+
+# ================= CAMERA =================
+def get_camera(width=640, height=480):
+    """Return the shared camera (CAMERA_SOURCE), opened at `width` x `height`."""
+    global _camera
+
+    with _lock:
+        if _camera is None:
+            from camera.network import open_source
+            _camera = open_source(CAMERA_SOURCE, width, height)
+        else:
+            _camera.configure(width, height)
+    return _camera
+
+
+def frame_stats():
+    """FrameStats of the shared camera, or None if it isn't open."""
+    camera = _camera
+    return camera.stats if camera is not None else None
+
+
+# ================= WARM UP =================
+def warm_up(mode_names=None):
+    """
+    Import every mode, build its hand-tracking graph, open the camera
+    and run a few inferences on a blank frame so the first real frame
+    doesn't pay for lazy initialisation.
+    """
+    import numpy as np
+
+    blank = np.zeros(WARMUP_FRAME_SIZE + (3,), dtype=np.uint8)
+
+    for mode_name in mode_names or MODE_REGISTRY:
+        module_name = MODE_REGISTRY[mode_name].split(":")[0]
+        try:
+            config = import_module(module_name).HANDS_CONFIG
+        except Exception as e:
+            # e.g. pycaw is Windows only
+            print(f"[Warm-up] Skipping {mode_name}: {e}")
+            continue
+
+        hands = get_hands(config)
+        for _ in range(WARMUP_INFERENCES):
+            hands.process(blank)
+
+    get_camera().read()
+
+
+def _warm_up_quietly(mode_names):
+    try:
+        warm_up(mode_names)
+    except Exception as e:
+        print(f"[Warm-up] Failed: {e}")
+
+
+def start_warmup(mode_names=None):
+    """Run warm_up() on a daemon thread; safe to call more than once."""
+    global _warmup_thread
+
+    if _warmup_thread is None:
+        _warmup_thread = Thread(
+            target=_warm_up_quietly,
+            args=(mode_names,),
+            name="vision-warmup",
+            daemon=True
+        )
+        _warmup_thread.start()
+    return _warmup_thread
+
+
+# ================= CLEANUP =================
+def release_all():
+    global _camera
+
+    with _lock:
+        for hands in _hands.values():
+            hands.close()
+        _hands.clear()
+
+        if _camera is not None:
+            _camera.release()
+            _camera = None
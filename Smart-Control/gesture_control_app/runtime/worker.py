@@ -0,0 +1,231 @@
+import struct
+import time
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from threading import Event, Thread
+
+from models.mode_registry import MODE_REGISTRY, load_mode
+
+# ---------------- CONFIG ----------------
+COMMAND_POLL = 0.25
+HEARTBEAT_TIMEOUT = 3.0
+FPS_SMOOTHING = 0.9
+# ----------------------------------------
+
+# Shared status block written by the worker, read by the launcher:
+# heartbeat, fps, frame ms, frame count, state, mode index
+STATUS_FORMAT = "<dddQii"
+STATUS_SIZE = struct.calcsize(STATUS_FORMAT)
+
+STATE_WARMING = 0
+STATE_IDLE = 1
+STATE_RUNNING = 2
+STATE_NAMES = {
+    STATE_WARMING: "Warming up",
+    STATE_IDLE: "Ready",
+    STATE_RUNNING: "Running"
+}
+
+MODE_NAMES = list(MODE_REGISTRY)
+
+
+# ================= WORKER PROCESS =================
+class _WorkerStatus:
+    """Worker side of the shared status block."""
+
+    def __init__(self, name):
+        self.shm = SharedMemory(name=name)
+        self.state = STATE_WARMING
+        self.mode_index = -1
+        self.fps = 0.0
+        self.frame_ms = 0.0
+        self.frames = 0
+        self._last_frame = None
+
+    def on_frame(self, frame_profiler, total_ms):
+        now = time.perf_counter()
+        if self._last_frame is not None and now > self._last_frame:
+            fps = 1 / (now - self._last_frame)
+            self.fps = FPS_SMOOTHING * self.fps + (1 - FPS_SMOOTHING) * fps
+        self._last_frame = now
+        self.frame_ms = total_ms
+        self.frames += 1
+        self.publish()
+
+    def set_state(self, state, mode_name=None):
+        self.state = state
+        self.mode_index = MODE_NAMES.index(mode_name) if mode_name else -1
+        self.fps = 0.0
+        self._last_frame = None
+        self.publish()
+
+    def publish(self):
+        struct.pack_into(
+            STATUS_FORMAT, self.shm.buf, 0,
+            time.time(), self.fps, self.frame_ms,
+            self.frames, self.state, self.mode_index
+        )
+
+    def close(self):
+        self.shm.close()
+
+
+def worker_main(conn, status_name):
+    """
+    Entry point of the warm worker process.
+    Loads the vision stack once, then runs modes on request:
+    ("start", mode_name), ("stop",) or ("exit",).
+    """
+    from runtime import profiler
+    from runtime import vision
+    from runtime.threads import apply_process_settings, pin_thread
+
+    apply_process_settings()
+
+    status = _WorkerStatus(status_name)
+    status.publish()
+
+    # Warm up in the background so heartbeats keep flowing
+    warmup = vision.start_warmup()
+    profiler.add_frame_listener(status.on_frame)
+
+    mode_thread = None
+    stop_event = Event()
+
+    def run(mode_name, event):
+        try:
+            pin_thread("inference")
+            load_mode(mode_name)(event)
+        finally:
+            if not event.is_set():
+                status.set_state(STATE_IDLE)
+
+    def stop():
+        stop_event.set()
+        # The mode exits after its current frame, and a camera read can
+        # take READ_TIMEOUT: keep heartbeating so the launcher doesn't
+        # take the wait for a hang
+        while mode_thread and mode_thread.is_alive():
+            mode_thread.join(COMMAND_POLL)
+            status.publish()
+
+    while True:
+        if conn.poll(COMMAND_POLL):
+            command = conn.recv()
+
+            if command[0] == "start":
+                stop()
+                stop_event = Event()
+                status.set_state(STATE_RUNNING, command[1])
+                mode_thread = Thread(
+                    target=run,
+                    args=(command[1], stop_event),
+                    daemon=True
+                )
+                mode_thread.start()
+
+            elif command[0] == "stop":
+                stop()
+                status.set_state(STATE_IDLE)
+
+            elif command[0] == "exit":
+                stop()
+                break
+
+        if status.state == STATE_WARMING and not warmup.is_alive():
+            status.set_state(STATE_IDLE)
+
+        status.publish()
+
+    vision.release_all()
+    status.close()
+
+
+# ================= SUPERVISOR =================
+class ModeSupervisor:
+    """
+    Launcher side: keeps one pre-warmed worker process alive,
+    switches its mode over a pipe and reads its health from
+    shared memory. A worker that stops heartbeating is replaced.
+    """
+
+    def __init__(self):
+        self._context = get_context("spawn")
+        self.process = None
+        self.conn = None
+        self.shm = None
+        self.current_mode = None
+        self.spawn()
+
+    def spawn(self):
+        self.shutdown()
+
+        self.shm = SharedMemory(create=True, size=STATUS_SIZE)
+        struct.pack_into(
+            STATUS_FORMAT, self.shm.buf, 0,
+            time.time(), 0.0, 0.0, 0, STATE_WARMING, -1
+        )
+
+        self.conn, child_conn = self._context.Pipe()
+        self.process = self._context.Process(
+            target=worker_main,
+            args=(child_conn, self.shm.name),
+            name="smart-control-worker",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    # ================= COMMANDS =================
+    def start_mode(self, mode_name):
+        self._ensure_alive()
+        self.current_mode = mode_name
+        self.conn.send(("start", mode_name))
+
+    def stop_mode(self):
+        self.current_mode = None
+        if self.process and self.process.is_alive():
+            self.conn.send(("stop",))
+
+    # ================= HEALTH =================
+    def status(self):
+        """Return a dict describing the worker's health and frame rate."""
+        heartbeat, fps, frame_ms, frames, state, mode_index = \
+            struct.unpack_from(STATUS_FORMAT, self.shm.buf, 0)
+
+        return {
+            "alive": self.is_healthy(heartbeat),
+            "state": STATE_NAMES.get(state, "Unknown"),
+            "mode": MODE_NAMES[mode_index] if mode_index >= 0 else None,
+            "fps": fps,
+            "frame_ms": frame_ms,
+            "frames": frames
+        }
+
+    def is_healthy(self, heartbeat=None):
+        if not self.process or not self.process.is_alive():
+            return False
+        if heartbeat is None:
+            heartbeat = struct.unpack_from(STATUS_FORMAT, self.shm.buf, 0)[0]
+        return time.time() - heartbeat < HEARTBEAT_TIMEOUT
+
+    def _ensure_alive(self):
+        if not self.is_healthy():
+            print("[Supervisor] Worker unresponsive, restarting")
+            self.spawn()
+
+    # ================= SHUTDOWN =================
+    def shutdown(self):
+        if self.process:
+            if self.process.is_alive():
+                self.conn.send(("exit",))
+                self.process.join(timeout=3)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+            self.conn.close()
+
+        if self.shm:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
@@ -0,0 +1,131 @@
+import math
+from collections import namedtuple
+
+import numpy as np
+
+# ---------------- CONFIG ----------------
+HAND_SIZE = 0.3         # wrist -> middle knuckle, as a fraction of frame height
+ASPECT = 640 / 480      # frame width / height the coordinates are normalised for
+# ----------------------------------------
+
+# Hand geometry in units of the wrist -> middle knuckle length, for a
+# right hand as the (mirrored) camera image shows it: palm to the
+# camera, fingers up (-y), thumb on the left.
+KNUCKLES = np.array([
+    (-0.38, -0.92),     # index  (landmark 5)
+    (0.00, -1.00),      # middle (9)
+    (0.30, -0.93),      # ring   (13)
+    (0.55, -0.80),      # pinky  (17)
+])
+SPREAD = np.radians([-8.0, 0.0, 7.0, 15.0])      # finger direction from vertical
+SEGMENTS = np.array([
+    (0.45, 0.28, 0.22),
+    (0.50, 0.30, 0.24),
+    (0.45, 0.28, 0.22),
+    (0.35, 0.22, 0.20),
+])
+# Bend at MCP, PIP, DIP for a fully curled finger (toward the camera)
+CURL = np.radians([80.0, 100.0, 70.0])
+
+THUMB_BASE = np.array([-0.25, -0.22])            # CMC (landmark 1)
+THUMB_SEGMENTS = np.array([0.40, 0.32, 0.28])
+THUMB_ANGLE = -135.0                             # image-plane angle, extended
+THUMB_CURL = np.radians([40.0, 60.0, 60.0])      # fold across the palm
+
+FINGERS = ("thumb", "index", "middle", "ring", "pinky")
+TIPS = {"thumb": 4, "index": 8, "middle": 12, "ring": 16, "pinky": 20}
+
+
+# Finger curls (thumb, index, middle, ring, pinky), 0 = straight,
+# 1 = fully curled; `pinch` brings two fingertips together.
+Pose = namedtuple("Pose", "curls thumb_angle pinch", defaults=(THUMB_ANGLE, None))
+
+POSES = {
+    "FIST": Pose((1, 1, 1, 1, 1)),
+    "ONE": Pose((1, 0, 1, 1, 1)),
+    "PEACE": Pose((1, 0, 0, 1, 1)),
+    "THREE": Pose((1, 0, 0, 0, 1)),
+    "FOUR": Pose((1, 0, 0, 0, 0)),
+    "OPEN": Pose((0, 0, 0, 0, 0)),
+    "THUMBS_UP": Pose((0, 1, 1, 1, 1), thumb_angle=-95.0),
+    "PINCH": Pose((0.3, 0.2, 0, 0, 0), pinch=("thumb", "index")),
+    "PINCH_MIDDLE": Pose((0.3, 0, 0.2, 0, 0), pinch=("thumb", "middle")),
+    "PINCH_RING": Pose((1, 0.2, 1, 0.2, 1), pinch=("index", "ring")),
+}
+
+
+def blend(a, b, amount):
+    """Pose between a (amount 0) and b (amount 1); a pinch fades with its pose."""
+    curls = tuple(x + (y - x) * amount for x, y in zip(a.curls, b.curls))
+    thumb_angle = a.thumb_angle + (b.thumb_angle - a.thumb_angle) * amount
+    pinch = b.pinch if amount >= 0.5 else a.pinch
+    return Pose(curls, thumb_angle, pinch)
+
+
+# ================= KINEMATICS =================
+def _finger(points, base_index, knuckle, spread, lengths, curl):
+    points[base_index] = (knuckle[0], knuckle[1], 0.0)
+    direction = np.array([math.sin(spread), -math.cos(spread)])
+    bend = 0.0
+    x, y, z = points[base_index]
+    for joint in range(3):
+        # Curling turns the finger toward the camera about its knuckle
+        bend += CURL[joint] * curl
+        step = lengths[joint]
+        x += direction[0] * step * math.cos(bend)
+        y += direction[1] * step * math.cos(bend)
+        z -= step * math.sin(bend)
+        points[base_index + joint + 1] = (x, y, z)
+
+
+def _thumb(points, curl, angle):
+    points[1] = (THUMB_BASE[0], THUMB_BASE[1], -0.05)
+    heading = math.radians(angle)
+    x, y, z = points[1]
+    for joint in range(3):
+        # A curled thumb folds across the palm, in the image plane
+        heading += THUMB_CURL[joint] * curl
+        step = THUMB_SEGMENTS[joint]
+        x += step * math.cos(heading)
+        y += step * math.sin(heading)
+        z -= 0.05 * step
+        points[joint + 2] = (x, y, z)
+
+
+def _pinch(points, first, second):
+    a, b = TIPS[first], TIPS[second]
+    middle = (points[a] + points[b]) / 2
+    # Tips meet; the joint before each tip goes half way
+    for tip in (a, b):
+        points[tip - 1] += (middle - points[tip]) / 2
+        points[tip] = middle
+
+
+def hand_points(pose, out=None):
+    """(21, 3) landmarks of `pose` in hand units, wrist at the origin."""
+    points = out if out is not None else np.empty((21, 3))
+    points[0] = 0.0
+    _thumb(points, pose.curls[0], pose.thumb_angle)
+    for f in range(4):
+        _finger(points, 5 + 4 * f, KNUCKLES[f], SPREAD[f], SEGMENTS[f],
+                pose.curls[f + 1])
+    if pose.pinch:
+        _pinch(points, *pose.pinch)
+    return points
+
+
+def place(points, x, y, side="Right", size=HAND_SIZE, roll=0.0,
+          aspect=ASPECT, out=None):
+    """
+    Hand-unit points -> MediaPipe-style normalised landmarks: wrist at
+    (x, y) of the frame, `size` of the frame height long, turned by
+    `roll` degrees. A left hand is the mirror image of a right hand.
+    """
+    out = out if out is not None else np.empty_like(points)
+    u = points[:, 0] if side == "Right" else -points[:, 0]
+    v = points[:, 1]
+    c, s = math.cos(math.radians(roll)), math.sin(math.radians(roll))
+    out[:, 0] = x + (u * c - v * s) * size / aspect
+    out[:, 1] = y + (u * s + v * c) * size
+    out[:, 2] = points[:, 2] * size
+    return out
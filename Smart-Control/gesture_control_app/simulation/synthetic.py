@@ -0,0 +1,196 @@
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from runtime.results import make_results
+from simulation.hand_model import ASPECT, HAND_SIZE, POSES, blend, hand_points, place
+
+# ---------------- CONFIG ----------------
+TRANSITION = 0.1            # seconds to blend into each step's pose
+HAND_SCORE = 0.95
+DROPOUT_FRAMES = (3, 10)    # length range of one occlusion, in frames
+# ----------------------------------------
+
+# pose: name in POSES, or None while the hand is out of view
+# motion: (dx, dy) travelled over the step, or ("circle", radius, clockwise)
+# label: the gesture a mode should see during the step
+Step = namedtuple("Step", "pose seconds motion label")
+
+
+def _ease(s):
+    return s * s * (3 - 2 * s)
+
+
+# ================= SCRIPTS =================
+class HandScript:
+    """
+    Scripted motion of one hand, built step by step:
+
+        HandScript("Right").hold("OPEN", 1).swipe("ONE", 0.3, 0, 0.3)
+
+    Each step blends from the previous pose over TRANSITION seconds and
+    records the gesture it shows (the pose name, or SWIPE_* / CIRCLE_*)
+    as ground truth.
+    """
+
+    def __init__(self, side="Right", x=0.5, y=0.75, size=HAND_SIZE, roll=0.0):
+        self.side = side
+        self.origin = (x, y)
+        self.size = size
+        self.roll = roll
+        self.steps = []
+        self._starts = [0.0]
+        self._origins = [(x, y)]     # wrist position as each step starts
+        self._points = np.empty((21, 3))
+
+    @property
+    def duration(self):
+        return self._starts[-1]
+
+    def _add(self, step):
+        self.steps.append(step)
+        self._starts.append(self._starts[-1] + step.seconds)
+        x, y = self._origins[-1]
+        if step.motion[0] != "circle":     # a circle ends where it began
+            x, y = x + step.motion[0], y + step.motion[1]
+        self._origins.append((x, y))
+        return self
+
+    def hold(self, pose, seconds, label=None):
+        return self._add(Step(pose, seconds, (0.0, 0.0), label or pose))
+
+    def hide(self, seconds):
+        return self._add(Step(None, seconds, (0.0, 0.0), None))
+
+    def swipe(self, pose, dx, dy, seconds):
+        if abs(dx) >= abs(dy):
+            label = "SWIPE_RIGHT" if dx > 0 else "SWIPE_LEFT"
+        else:
+            label = "SWIPE_DOWN" if dy > 0 else "SWIPE_UP"
+        return self._add(Step(pose, seconds, (dx, dy), label))
+
+    def circle(self, pose, radius, seconds, clockwise=True):
+        label = "CIRCLE_CW" if clockwise else "CIRCLE_CCW"
+        return self._add(Step(pose, seconds, ("circle", radius, clockwise), label))
+
+    @classmethod
+    def random(cls, seconds, seed=0, poses=None, side="Right", hold=(0.3, 1.5),
+               drift=0.05, **placement):
+        """Random holds of random poses with a slow drift, for false-positive runs."""
+        rng = np.random.default_rng(seed)
+        names = list(poses or POSES)
+        script = cls(side, **placement)
+        while script.duration < seconds:
+            dx, dy = rng.uniform(-drift, drift, 2)
+            script._add(Step(str(rng.choice(names)), float(rng.uniform(*hold)),
+                             (float(dx), float(dy)), None))
+        return script
+
+    # ================= EVALUATE =================
+    def _position(self, index, s):
+        """Wrist position `s` (0..1) of the way through step `index`."""
+        x, y = self._origins[index]
+        motion = self.steps[index].motion
+        if motion[0] == "circle":
+            _, radius, clockwise = motion
+            angle = 2 * math.pi * _ease(s) * (1 if clockwise else -1)
+            return (x + radius * (math.cos(angle) - 1) / ASPECT,
+                    y + radius * math.sin(angle))
+        return x + motion[0] * _ease(s), y + motion[1] * _ease(s)
+
+    def state(self, t):
+        """(landmarks (21, 3) or None, ground-truth label) at script time t."""
+        if t < 0 or t >= self.duration:
+            return None, None
+
+        index = int(np.searchsorted(self._starts, t, side="right")) - 1
+        step = self.steps[index]
+        if step.pose is None:
+            return None, None
+
+        elapsed = t - self._starts[index]
+        pose = POSES[step.pose]
+        previous = self.steps[index - 1].pose if index else None
+        if previous is not None and elapsed < TRANSITION:
+            pose = blend(POSES[previous], pose, elapsed / TRANSITION)
+
+        x, y = self._position(index, elapsed / step.seconds)
+        hand_points(pose, out=self._points)
+        return place(self._points, x, y, self.side, self.size, self.roll), step.label
+
+    def onsets(self, label):
+        """Script times at which steps labelled `label` begin."""
+        return [start for start, step in zip(self._starts, self.steps)
+                if step.label == label]
+
+
+# ================= RESULT STREAM =================
+class SyntheticHands:
+    """
+    Drop-in for HandInference that plays HandScripts instead of running
+    MediaPipe: process() ignores the image and returns the next frame's
+    hands as a mediapipe-shaped result, at `fps` frames per script second.
+
+    jitter adds Gaussian noise (normalised units) to every landmark;
+    dropout is the chance per frame and hand that an occlusion of
+    DROPOUT_FRAMES starts. `truth` holds each script's label for the
+    frame just returned (None while the hand is not shown).
+    """
+
+    def __init__(self, scripts, fps=30, jitter=0.0, dropout=0.0, seed=0):
+        self.scripts = list(scripts)
+        self.fps = fps
+        self.jitter = jitter
+        self.dropout = dropout
+        self.infer_width = None
+
+        self.frame = -1
+        self.t = 0.0
+        self.truth = [None] * len(self.scripts)
+        self._rng = np.random.default_rng(seed)
+        self._hidden = [0] * len(self.scripts)
+
+    @property
+    def duration(self):
+        return max((s.duration for s in self.scripts), default=0.0)
+
+    @property
+    def done(self):
+        return self.t >= self.duration
+
+    def set_width(self, infer_width):
+        self.infer_width = infer_width
+
+    def process(self, image=None):
+        self.frame += 1
+        self.t = self.frame / self.fps
+
+        hands = []
+        for i, script in enumerate(self.scripts):
+            points, label = script.state(self.t)
+
+            if points is not None and self.dropout and not self._hidden[i]:
+                if self._rng.random() < self.dropout:
+                    self._hidden[i] = int(self._rng.integers(*DROPOUT_FRAMES, endpoint=True))
+            if self._hidden[i]:
+                self._hidden[i] -= 1
+                points = None
+
+            self.truth[i] = label if points is not None else None
+            if points is None:
+                continue
+
+            if self.jitter:
+                points += self._rng.normal(0.0, self.jitter, (21, 3))
+            hands.append((points, script.side, HAND_SCORE))
+
+        return make_results(hands)
+
+    def __iter__(self):
+        """(t, results, truth) for every frame until the scripts end."""
+        while True:
+            results = self.process()
+            if self.done:
+                return
+            yield self.t, results, list(self.truth)
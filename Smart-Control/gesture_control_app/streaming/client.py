@@ -0,0 +1,65 @@
+"""
+Print what the streaming server sends.
+
+Connects to the Unix socket of streaming/server.py, decodes the
+fixed-size records and prints mode and gesture events as they arrive,
+plus the frame rate and hands seen once a second. A minimal example of
+a consumer; a browser can read the same records from the WebSocket.
+
+Run from the gesture_control_app directory while Smart Control streams:
+    python -m streaming.client
+"""
+
+import argparse
+import socket
+import time
+
+from streaming.protocol import (KIND_FRAME, KIND_GESTURE, KIND_MODE,
+                                RECORD_SIZE, decode)
+from streaming.server import SOCKET_PATH
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    args = parser.parse_args()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(args.socket)
+    print(f"Connected to {args.socket}")
+
+    pending = b""
+    frames = hands = 0
+    window_start = time.perf_counter()
+    while True:
+        chunk = sock.recv(1 << 16)
+        if not chunk:
+            break
+        pending += chunk
+
+        # Records may arrive split across reads; keep the remainder
+        whole = len(pending) - len(pending) % RECORD_SIZE
+        records, pending = decode(pending[:whole]), pending[whole:]
+
+        for record in records:
+            mode = record["mode"].decode()
+            if record["kind"] == KIND_FRAME:
+                frames += 1
+                hands += int(record["hands"])
+            elif record["kind"] == KIND_GESTURE:
+                print(f"{record['t']:.3f} {mode}: {record['gesture'].decode() or '-'}")
+            elif record["kind"] == KIND_MODE:
+                print(f"{record['t']:.3f} {mode} {record['gesture'].decode()}")
+
+        now = time.perf_counter()
+        if now - window_start >= 1.0:
+            print(f"  {frames / (now - window_start):.1f} fps, "
+                  f"{hands / max(frames, 1):.1f} hands per frame")
+            frames = hands = 0
+            window_start = now
+
+    print("Server closed the connection")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import numpy as np
+
+MAX_HANDS = 2
+LANDMARK_SCALE = 16384      # int16 units per normalised unit; covers [-2, 2)
+SCORE_SCALE = 255
+
+# Record kinds
+KIND_FRAME = 1              # one per processed frame
+KIND_GESTURE = 2            # a mode's gesture changed (name in `gesture`)
+KIND_MODE = 3               # a mode started or stopped ("START" / "STOP")
+
+# Every message is a whole number of these records, little-endian,
+# 300 bytes each. A frame's gesture events are sent together with the
+# frame record, in one write.
+STREAM_DTYPE = np.dtype([
+    ("kind", "u1"),
+    ("hands", "u1"),
+    ("reserved", "<u2"),
+    ("seq", "<u4"),                             # camera frame sequence
+    ("t", "<f8"),                               # capture time, perf_counter s
+    ("mode", "S12"),
+    ("gesture", "S16"),
+    ("landmarks", "<i2", (MAX_HANDS, 21, 3)),   # x, y, z * LANDMARK_SCALE
+    ("handedness", "i1", (MAX_HANDS,)),         # 0 left, 1 right, -1 none
+    ("score", "u1", (MAX_HANDS,)),              # score * SCORE_SCALE
+])
+
+RECORD_SIZE = STREAM_DTYPE.itemsize
+
+_HANDEDNESS = {"Left": 0, "Right": 1}
+
+
+def pack_frame(mode, seq, t, results, gesture=""):
+    """One KIND_FRAME record for a frame's hand results."""
+    record = np.zeros((), STREAM_DTYPE)
+    record["kind"] = KIND_FRAME
+    record["seq"] = seq & 0xFFFFFFFF
+    record["t"] = t
+    record["mode"] = mode.encode()[:12]
+    record["gesture"] = str(gesture).encode()[:16]
+    record["handedness"] = -1
+
+    detected = results.multi_hand_landmarks or []
+    sides = results.multi_handedness or []
+    record["hands"] = min(len(detected), MAX_HANDS)
+
+    for h, hand in enumerate(detected[:MAX_HANDS]):
+        points = np.array([(lm.x, lm.y, lm.z) for lm in hand.landmark])
+        np.clip(np.rint(points * LANDMARK_SCALE), -32768, 32767,
+                out=points)
+        record["landmarks"][h] = points
+        if h < len(sides):
+            label = sides[h].classification[0]
+            record["handedness"][h] = _HANDEDNESS.get(label.label, -1)
+            record["score"][h] = round(label.score * SCORE_SCALE)
+
+    return record
+
+
+def pack_event(kind, mode, name, t, seq=0):
+    """One KIND_GESTURE or KIND_MODE record."""
+    record = np.zeros((), STREAM_DTYPE)
+    record["kind"] = kind
+    record["seq"] = seq & 0xFFFFFFFF
+    record["t"] = t
+    record["mode"] = mode.encode()[:12]
+    record["gesture"] = str(name).encode()[:16]
+    record["handedness"] = -1
+    return record
+
+
+def decode(buffer):
+    """Records in `buffer` (bytes of whole records) as a STREAM_DTYPE array."""
+    return np.frombuffer(buffer, STREAM_DTYPE)
+
+
+def landmarks(record):
+    """(hands, 21, 3) float landmarks of a frame record."""
+    return record["landmarks"][:record["hands"]] / LANDMARK_SCALE
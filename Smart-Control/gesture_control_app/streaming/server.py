@@ -0,0 +1,293 @@
+import base64
+import hashlib
+import os
+import queue
+import socket
+import struct
+import tempfile
+import threading
+import time
+
+from streaming.protocol import (KIND_GESTURE, KIND_MODE, pack_event,
+                                pack_frame)
+
+# ---------------- CONFIG ----------------
+SOCKET_PATH = os.path.join(tempfile.gettempdir(), "smart_control.sock")
+WEBSOCKET_HOST = "127.0.0.1"    # local clients only
+WEBSOCKET_PORT = 8765
+CLIENT_BUFFER_FRAMES = 4        # batches queued per client before dropping
+HANDSHAKE_TIMEOUT = 2.0
+# Browser pages allowed to connect, e.g. "http://localhost:3000".
+# Browsers always send an Origin, so by default only non-browser
+# clients (which send none) get in; any open web page could otherwise
+# read the user's hands from ws://127.0.0.1.
+ALLOWED_ORIGINS = ()
+# ----------------------------------------
+
+_STOP = object()
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+# ================= WEBSOCKET =================
+def _handshake(sock):
+    """
+    Answer a WebSocket upgrade request; False if it isn't one or comes
+    from a page whose Origin isn't in ALLOWED_ORIGINS.
+    """
+    sock.settimeout(HANDSHAKE_TIMEOUT)
+    request = b""
+    while b"\r\n\r\n" not in request:
+        chunk = sock.recv(1024)
+        if not chunk or len(request) > 8192:
+            return False
+        request += chunk
+    sock.settimeout(None)
+
+    headers = {}
+    for line in request.decode("latin-1").split("\r\n")[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    key = headers.get("sec-websocket-key")
+    if key is None:
+        return False
+
+    origin = headers.get("origin")
+    if origin is not None and origin.rstrip("/") not in ALLOWED_ORIGINS:
+        print(f"[Streaming] Rejected WebSocket from origin {origin}")
+        sock.sendall(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n")
+        return False
+
+    accept = base64.b64encode(
+        hashlib.sha1((key + _WEBSOCKET_GUID).encode()).digest()
+    ).decode()
+    sock.sendall(
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode()
+    )
+    return True
+
+
+def _websocket_frame(payload):
+    """One unmasked binary WebSocket frame."""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x82, n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", 0x82, 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x82, 127, n)
+    return header + payload
+
+
+# ================= CLIENTS =================
+class _Client:
+    """
+    One connected consumer. Batches wait in a small queue for the
+    client's sender thread; when the client falls behind and the queue
+    is full, new batches are dropped (and counted) for that client only.
+    """
+
+    def __init__(self, server, sock, websocket):
+        self.server = server
+        self.sock = sock
+        self.websocket = websocket
+        self.sent = 0
+        self.dropped = 0
+        self.ready = False
+
+        self._queue = queue.Queue(maxsize=CLIENT_BUFFER_FRAMES)
+        self._thread = threading.Thread(target=self._send_loop,
+                                        name="stream-client", daemon=True)
+        self._thread.start()
+
+    def offer(self, payload):
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            self.dropped += 1
+            self.server.dropped += 1
+
+    def _send_loop(self):
+        try:
+            if self.websocket and not _handshake(self.sock):
+                return
+            self.ready = True
+            while True:
+                payload = self._queue.get()
+                if payload is _STOP:
+                    break
+                if self.websocket:
+                    payload = _websocket_frame(payload)
+                self.sock.sendall(payload)
+                self.sent += 1
+        except OSError:
+            pass
+        finally:
+            self.server._remove(self)
+            self.sock.close()
+
+    def close(self):
+        try:
+            self._queue.put_nowait(_STOP)
+        except queue.Full:
+            # Sender is stuck on a full socket: closing it unblocks it
+            self.sock.close()
+
+
+# ================= SERVER =================
+class StreamServer:
+    """
+    Streams landmarks, gesture changes and mode events to local
+    clients over a Unix socket and a WebSocket (127.0.0.1 only).
+
+    The vision thread packs each frame once (only while someone is
+    connected) into one batch of fixed-size records: the frame's
+    gesture change, if any, then the frame record. The same bytes go to
+    every client's queue; see streaming/protocol.py for the layout.
+    """
+
+    def __init__(self, socket_path=SOCKET_PATH, port=WEBSOCKET_PORT):
+        self.socket_path = socket_path
+        self.port = port
+        self.frames = 0
+        self.dropped = 0
+
+        self._lock = threading.Lock()
+        self._clients = []
+        self._gestures = {}
+        self._listeners = []
+
+        if hasattr(socket, "AF_UNIX") and socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            unix = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            unix.bind(socket_path)
+            # 0600 before anyone can connect: the temp directory is
+            # shared with other users
+            os.chmod(socket_path, 0o600)
+            self._listen(unix, websocket=False)
+
+        if port:
+            tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            tcp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            tcp.bind((WEBSOCKET_HOST, port))
+            self._listen(tcp, websocket=True)
+
+    def _listen(self, listener, websocket):
+        listener.listen()
+        self._listeners.append(listener)
+        threading.Thread(target=self._accept_loop, args=(listener, websocket),
+                         name="stream-accept", daemon=True).start()
+
+    def _accept_loop(self, listener, websocket):
+        while True:
+            try:
+                sock, _ = listener.accept()
+            except OSError:
+                break
+            if websocket:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self._clients.append(_Client(self, sock, websocket))
+
+    def _remove(self, client):
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
+    @property
+    def clients(self):
+        with self._lock:
+            return len(self._clients)
+
+    # ================= PUBLISHING =================
+    def _broadcast(self, payload):
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            if client.ready:
+                client.offer(payload)
+
+    def publish_frame(self, mode, frame, results, gesture=""):
+        gesture = str(gesture)
+        changed = self._gestures.get(mode) != gesture
+        self._gestures[mode] = gesture
+
+        if not self._clients:
+            return
+
+        record = pack_frame(mode, frame.seq, frame.t, results, gesture)
+        payload = record.tobytes()
+        if changed:
+            payload = pack_event(KIND_GESTURE, mode, gesture, frame.t,
+                                 frame.seq).tobytes() + payload
+        self._broadcast(payload)
+        self.frames += 1
+
+    def publish_mode(self, mode, state):
+        self._gestures.pop(mode, None)
+        if self._clients:
+            self._broadcast(pack_event(KIND_MODE, mode, state,
+                                       time.perf_counter()).tobytes())
+
+    def close(self):
+        for listener in self._listeners:
+            try:
+                listener.shutdown(socket.SHUT_RDWR)   # wakes accept()
+            except OSError:
+                pass
+            listener.close()
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.close()
+        if hasattr(socket, "AF_UNIX") and self.socket_path \
+                and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+# ---------------- MODULE LEVEL SERVER ----------------
+_server = None
+
+
+def start_streaming(socket_path=SOCKET_PATH, port=WEBSOCKET_PORT):
+    global _server
+    stop_streaming()
+    _server = StreamServer(socket_path, port)
+    print(f"[Streaming] Unix socket {socket_path}, "
+          f"ws://{WEBSOCKET_HOST}:{port}")
+    return _server
+
+
+def stop_streaming():
+    global _server
+    server, _server = _server, None
+
+    if server:
+        server.close()
+        print(f"[Streaming] {server.frames} frames published, "
+              f"{server.dropped} batches dropped for slow clients")
+    return server
+
+
+def is_streaming():
+    return _server is not None
+
+
+# Both helpers are no-ops while the server is off.
+
+def publish_frame(mode, frame, results, gesture=""):
+    """Stream one processed frame's hands and gesture."""
+    server = _server
+    if server is not None:
+        server.publish_frame(mode, frame, results, gesture)
+
+
+def publish_mode(mode, state):
+    """Stream a mode event, "START" or "STOP"."""
+    server = _server
+    if server is not None:
+        server.publish_mode(mode, state)
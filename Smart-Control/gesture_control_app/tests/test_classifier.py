@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from gestures.classifier import FRAME_ASPECT, MIDDLE_MCP, WRIST, landmark_features
+
+
+def rotate(points, angle, scale=1.0, offset=(0.0, 0.0), aspect=FRAME_ASPECT):
+    """
+    Turn normalised (21, 3) landmarks about the wrist as the hand turns
+    in a width / height = `aspect` frame, then scale and move them.
+    """
+    c, s = np.cos(angle), np.sin(angle)
+    moved = points.copy()
+    xy = points[:, :2] - points[WRIST, :2]
+    x, y = xy[:, 0] * aspect, xy[:, 1]
+    moved[:, 0] = (x * c - y * s) * scale / aspect + points[WRIST, 0] + offset[0]
+    moved[:, 1] = (x * s + y * c) * scale + points[WRIST, 1] + offset[1]
+    return moved
+
+
+class LandmarkFeaturesTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.hand = rng.uniform(0.3, 0.7, (21, 3)).astype(np.float32)
+
+    def test_axis_points_up(self):
+        features = landmark_features(self.hand)
+        x, y = features[MIDDLE_MCP], features[21 + MIDDLE_MCP]
+        self.assertAlmostEqual(x, 0.0, places=5)
+        self.assertAlmostEqual(y, -1.0, places=5)
+
+    def test_rotated_hand_matches_upright(self):
+        upright = landmark_features(self.hand)
+        for degrees in (-135, -90, -45, -10, 30, 90, 180):
+            turned = rotate(self.hand, np.radians(degrees), 1.7, (0.1, -0.05))
+            np.testing.assert_allclose(landmark_features(turned), upright,
+                                       atol=1e-4, err_msg=f"{degrees} degrees")
+
+    def test_rotated_hand_in_a_wide_frame(self):
+        aspect = 1280 / 720
+        upright = landmark_features(self.hand, aspect=aspect)
+        for degrees in (-90, -30, 45, 120):
+            turned = rotate(self.hand, np.radians(degrees), 0.8, aspect=aspect)
+            np.testing.assert_allclose(landmark_features(turned, aspect=aspect), upright,
+                                       atol=1e-4, err_msg=f"{degrees} degrees")
+
+    def test_rotation_in_normalised_units_is_a_shear(self):
+        # Ignoring the frame's proportions would not give the same features
+        turned = rotate(self.hand, np.radians(60))
+        self.assertGreater(np.abs(landmark_features(turned, aspect=1.0)
+                                  - landmark_features(self.hand, aspect=1.0)).max(), 0.01)
+
+    def test_per_hand_aspect(self):
+        hands = np.stack([self.hand, self.hand])
+        batch = landmark_features(hands, aspect=[FRAME_ASPECT, 16 / 9])
+        np.testing.assert_allclose(batch[0], landmark_features(self.hand), atol=1e-5)
+        np.testing.assert_allclose(batch[1], landmark_features(self.hand, aspect=16 / 9),
+                                   atol=1e-5)
+
+    def test_batch_matches_single(self):
+        hands = np.stack([self.hand, rotate(self.hand, 1.0)])
+        batch = landmark_features(hands, right=[True, False])
+        np.testing.assert_allclose(batch[0], landmark_features(self.hand), atol=1e-5)
+        np.testing.assert_allclose(batch[1], landmark_features(self.hand, right=False),
+                                   atol=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
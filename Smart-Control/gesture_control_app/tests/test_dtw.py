@@ -0,0 +1,89 @@
+import math
+import unittest
+
+import numpy as np
+
+from gestures.dtw import dtw, envelope, lb_keogh
+from gestures.dynamic import DynamicGestureRecognizer
+
+LENGTH = 24
+RADIUS = 3
+
+
+def naive_dtw(query, template, radius):
+    """Textbook banded DTW over the full cost matrix."""
+    n = len(query)
+    table = np.full((n + 1, n + 1), np.inf)
+    table[0, 0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(max(1, i - radius), min(n, i + radius) + 1):
+            cost = np.sum((query[i - 1] - template[j - 1]) ** 2)
+            table[i, j] = cost + min(table[i - 1, j], table[i, j - 1],
+                                     table[i - 1, j - 1])
+    return table[n, n]
+
+
+def random_walks(rng, count):
+    return np.cumsum(rng.normal(0, 0.1, (count, LENGTH, 2)), axis=1)
+
+
+class DtwTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def test_matches_naive_dtw(self):
+        for query, template in zip(random_walks(self.rng, 20), random_walks(self.rng, 20)):
+            self.assertAlmostEqual(dtw(query, template, RADIUS),
+                                   naive_dtw(query, template, RADIUS), places=9)
+
+    def test_lb_keogh_is_a_lower_bound(self):
+        templates = random_walks(self.rng, 30)
+        envelopes = [envelope(t, RADIUS) for t in templates]
+        upper = np.stack([u for u, _ in envelopes])
+        lower = np.stack([l for _, l in envelopes])
+        for query in random_walks(self.rng, 30):
+            bounds = lb_keogh(query, upper, lower)
+            for bound, template in zip(bounds, templates):
+                self.assertLessEqual(bound, dtw(query, template, RADIUS) + 1e-9)
+
+    def test_early_abandon(self):
+        pairs = zip(random_walks(self.rng, 50), random_walks(self.rng, 50))
+        for query, template in pairs:
+            full = dtw(query, template, RADIUS)
+            for cutoff in (full * 0.25, full * 0.9, full, full * 1.1, math.inf):
+                result = dtw(query, template, RADIUS, cutoff)
+                if full < cutoff:
+                    self.assertAlmostEqual(result, full, places=9)
+                else:
+                    self.assertGreaterEqual(result, cutoff)
+
+
+class PrunedMatchTest(unittest.TestCase):
+    """match()'s pruned search finds what trying every template finds."""
+
+    def test_pruned_equals_exhaustive(self):
+        rng = np.random.default_rng(1)
+        for threshold in (0.02, 0.12, 1.0, math.inf):
+            templates = {f"T{k}": walk for k, walk in enumerate(random_walks(rng, 12))}
+            recognizer = DynamicGestureRecognizer(templates, length=LENGTH,
+                                                  radius=RADIUS, threshold=threshold)
+            for query in random_walks(rng, 40):
+                # A template with more or less noise, so matches are close calls
+                near = recognizer.templates[rng.integers(len(templates))][1]
+                query = near + (query - query.mean(0)) * rng.uniform(0.1, 2.0)
+
+                distances = [dtw(query, series, RADIUS)
+                             for _, series in recognizer.templates]
+                k = int(np.argmin(distances))
+                expected = (recognizer.templates[k][0]
+                            if distances[k] < threshold * LENGTH else None)
+
+                name, distance = recognizer.match(query)
+                self.assertEqual(name, expected)
+                if name is not None:
+                    self.assertAlmostEqual(distance, distances[k] / LENGTH, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
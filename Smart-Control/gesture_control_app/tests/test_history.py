@@ -0,0 +1,74 @@
+import unittest
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+
+from runtime.history import HANDEDNESS, LandmarkHistory
+
+CAPACITY = 8
+
+
+def hand(points):
+    return SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in points])
+
+
+def side(label, score):
+    return SimpleNamespace(classification=[SimpleNamespace(label=label, score=score)])
+
+
+class LandmarkHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.history = LandmarkHistory(CAPACITY)
+        self.frames = deque(maxlen=CAPACITY)
+        for i in range(3 * CAPACITY + 3):
+            points = rng.uniform(0, 1, (21, 3)).astype(np.float32)
+            label = ("Left", "Right")[i % 2]
+            self.history.push(i / 30, hand(points), side(label, 0.5 + i / 100))
+            self.frames.append((points, i / 30, HANDEDNESS[label],
+                                np.float32(0.5 + i / 100)))
+
+    def test_window_after_wraparound(self):
+        for n in (1, 3, CAPACITY - 1, CAPACITY):
+            points, t, handedness, score = self.history.window(n)
+            expected = list(self.frames)[-n:]
+            np.testing.assert_array_equal(points, np.stack([f[0] for f in expected]))
+            np.testing.assert_array_equal(t, [f[1] for f in expected])
+            np.testing.assert_array_equal(handedness, [f[2] for f in expected])
+            np.testing.assert_array_equal(score, [f[3] for f in expected])
+
+    def test_window_is_a_contiguous_view(self):
+        for n in range(1, CAPACITY + 1):
+            points, t, _, _ = self.history.window(n)
+            self.assertTrue(points.flags.c_contiguous)
+            self.assertTrue(np.shares_memory(points, self.history._points))
+            self.assertTrue(np.shares_memory(t, self.history._t))
+
+    def test_window_is_capped_at_capacity(self):
+        self.assertEqual(len(self.history.window(10 * CAPACITY)[0]), CAPACITY)
+
+    def test_latest(self):
+        np.testing.assert_array_equal(self.history.latest(), self.frames[-1][0])
+
+    def test_mean_and_velocity(self):
+        for n in (2, 5, CAPACITY):
+            expected = list(self.frames)[-n:]
+            points = np.stack([f[0] for f in expected])
+            np.testing.assert_allclose(self.history.mean(8, n), points[:, 8].mean(axis=0),
+                                       rtol=1e-6)
+
+            dt = expected[-1][1] - expected[0][1]
+            vx, vy = self.history.velocity(8, n)
+            self.assertAlmostEqual(vx, (points[-1, 8, 0] - points[0, 8, 0]) / dt, places=4)
+            self.assertAlmostEqual(vy, (points[-1, 8, 1] - points[0, 8, 1]) / dt, places=4)
+
+    def test_clear(self):
+        self.history.clear()
+        self.assertIsNone(self.history.latest())
+        self.assertEqual(len(self.history.window(CAPACITY)[0]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+from camera.probe import CameraMode, choose_mode
+
+MODES = [
+    CameraMode("MJPG", 320, 240, 30),
+    CameraMode("MJPG", 320, 240, 15),
+    CameraMode("MJPG", 320, 240, 5),
+    CameraMode("YUYV", 320, 240, 10),
+    CameraMode("MJPG", 640, 480, 60),
+    CameraMode("MJPG", 640, 480, 30),
+    CameraMode("MJPG", 1280, 720, 30),
+]
+
+
+class ChooseModeTest(unittest.TestCase):
+
+    def test_lowest_rate_that_reaches_the_target(self):
+        self.assertEqual(choose_mode(MODES, 320, 240, 5), CameraMode("MJPG", 320, 240, 5))
+        self.assertEqual(choose_mode(MODES, 320, 240, 12), CameraMode("MJPG", 320, 240, 15))
+        self.assertEqual(choose_mode(MODES, 640, 480, 30), CameraMode("MJPG", 640, 480, 30))
+
+    def test_fastest_when_nothing_reaches_the_target(self):
+        self.assertEqual(choose_mode(MODES, 640, 480, 90), CameraMode("MJPG", 640, 480, 60))
+
+    def test_size_before_rate(self):
+        self.assertEqual(choose_mode(MODES, 1280, 720, 60), CameraMode("MJPG", 1280, 720, 30))
+
+    def test_no_modes(self):
+        self.assertIsNone(choose_mode([], 640, 480, 30))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from runtime.results import NO_HANDS, make_results
+from streaming.protocol import (KIND_FRAME, KIND_GESTURE, KIND_MODE, LANDMARK_SCALE,
+                                MAX_HANDS, RECORD_SIZE, SCORE_SCALE, STREAM_DTYPE,
+                                decode, landmarks, pack_event, pack_frame)
+
+
+class ProtocolTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = [rng.uniform(-0.2, 1.2, (21, 3)) for _ in range(MAX_HANDS + 1)]
+        sides = ["Left", "Right", "Left"]
+        self.results = make_results([(p, side, 0.5 + 0.2 * i)
+                                     for i, (p, side) in enumerate(zip(self.points, sides))])
+
+    def test_record_size(self):
+        self.assertEqual(RECORD_SIZE, 300)
+        self.assertEqual(STREAM_DTYPE.itemsize, 300)
+        self.assertEqual(len(pack_frame("Mouse", 1, 0.0, NO_HANDS).tobytes()), 300)
+
+    def test_frame_round_trip(self):
+        record = pack_frame("Keyboard", 2 ** 32 + 7, 12.5, self.results, "PINCH")
+        (decoded,) = decode(record.tobytes())
+
+        self.assertEqual(decoded["kind"], KIND_FRAME)
+        self.assertEqual(decoded["seq"], 7)
+        self.assertEqual(decoded["t"], 12.5)
+        self.assertEqual(decoded["mode"], b"Keyboard")
+        self.assertEqual(decoded["gesture"], b"PINCH")
+        self.assertEqual(decoded["hands"], MAX_HANDS)
+        np.testing.assert_array_equal(decoded["handedness"], [0, 1])
+        np.testing.assert_array_equal(decoded["score"],
+                                      [round(0.5 * SCORE_SCALE), round(0.7 * SCORE_SCALE)])
+        np.testing.assert_allclose(landmarks(decoded), np.stack(self.points[:MAX_HANDS]),
+                                   atol=0.5 / LANDMARK_SCALE + 1e-9)
+
+    def test_no_hands(self):
+        (decoded,) = decode(pack_frame("Media", 3, 1.0, NO_HANDS, 4).tobytes())
+        self.assertEqual(decoded["hands"], 0)
+        self.assertEqual(decoded["gesture"], b"4")
+        self.assertEqual(landmarks(decoded).shape, (0, 21, 3))
+        np.testing.assert_array_equal(decoded["handedness"], [-1, -1])
+
+    def test_out_of_range_landmarks_are_clipped(self):
+        far = make_results([(np.full((21, 3), 5.0), "Right", 1.0)])
+        (decoded,) = decode(pack_frame("Mouse", 1, 0.0, far).tobytes())
+        self.assertTrue(np.all(decoded["landmarks"][0] == 32767))
+
+    def test_events_and_frames_in_one_message(self):
+        message = b"".join(record.tobytes() for record in (
+            pack_event(KIND_MODE, "Volume", "START", 0.0),
+            pack_event(KIND_GESTURE, "Volume", "a gesture name too long", 0.1, seq=5),
+            pack_frame("Volume", 5, 0.1, self.results, "PEACE"),
+        ))
+        self.assertEqual(len(message), 3 * RECORD_SIZE)
+
+        records = decode(message)
+        np.testing.assert_array_equal(records["kind"], [KIND_MODE, KIND_GESTURE, KIND_FRAME])
+        self.assertEqual(records[0]["gesture"], b"START")
+        self.assertEqual(records[1]["gesture"], b"a gesture name t")
+        self.assertEqual(records[1]["seq"], 5)
+        self.assertEqual(records[2]["gesture"], b"PEACE")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from gestures.sequences import BLANK, SequenceAutomaton, Stabilizer, sequence
+
+LOCK = sequence("TOGGLE_LOCK", "PEACE PEACE", within=0.8)
+
+
+def run(automaton, symbols, dt=0.1, start=0.0):
+    """Feed one symbol per frame; returns [(frame, name)] of what fired."""
+    fired = []
+    for i, symbol in enumerate(symbols):
+        name = automaton.feed(symbol, start + i * dt)
+        if name:
+            fired.append((i, name))
+    return fired
+
+
+def volume_symbols(labels, stable=None):
+    """Per-frame Volume labels -> stable symbols, PINCH as the neutral pose."""
+    stable = stable or Stabilizer()
+    return [stable.update(BLANK if label == "PINCH" else label) for label in labels]
+
+
+class SequenceAutomatonTest(unittest.TestCase):
+
+    def test_peace_blank_peace_fires(self):
+        automaton = SequenceAutomaton([LOCK])
+        self.assertEqual(run(automaton, ["PEACE", BLANK, "PEACE"]),
+                         [(2, "TOGGLE_LOCK")])
+
+    def test_holding_a_pose_is_one_step(self):
+        automaton = SequenceAutomaton([LOCK])
+        self.assertEqual(run(automaton, ["PEACE"] * 6), [])
+
+    def test_overlapping_prefix_falls_back(self):
+        # A A A B: after the third A the longest live prefix is still "A A"
+        automaton = SequenceAutomaton([sequence("X", "A A B")])
+        self.assertEqual(run(automaton, ["A", BLANK, "A", BLANK, "A", "B"]),
+                         [(5, "X")])
+
+    def test_failed_step_restarts_on_its_symbol(self):
+        # A B A B C: the second A starts the sequence over
+        automaton = SequenceAutomaton([sequence("X", "A B C")])
+        self.assertEqual(run(automaton, ["A", "B", "A", "B", "C"]), [(4, "X")])
+
+    def test_shorter_sequence_inside_a_longer_one(self):
+        automaton = SequenceAutomaton([sequence("LONG", "A B C D"),
+                                       sequence("SHORT", "B C")])
+        self.assertEqual(run(automaton, ["A", "B", "C"]), [(2, "SHORT")])
+
+    def test_each_completion_starts_over(self):
+        automaton = SequenceAutomaton([LOCK])
+        symbols = ["PEACE", BLANK] * 4
+        self.assertEqual([name for _, name in run(automaton, symbols)],
+                         ["TOGGLE_LOCK", "TOGGLE_LOCK"])
+
+    def test_unknown_symbol_resets(self):
+        automaton = SequenceAutomaton([LOCK])
+        self.assertEqual(run(automaton, ["PEACE", "THUMBS_UP", "PEACE"]), [])
+
+    def test_timeout_resets(self):
+        automaton = SequenceAutomaton([LOCK])
+        self.assertIsNone(automaton.feed("PEACE", 0.0))
+        self.assertIsNone(automaton.feed(BLANK, 0.1))
+        # Too late to complete: this PEACE is a new first step
+        self.assertIsNone(automaton.feed("PEACE", 1.0))
+        self.assertIsNone(automaton.feed(BLANK, 1.1))
+        self.assertEqual(automaton.feed("PEACE", 1.5), "TOGGLE_LOCK")
+
+    def test_in_progress(self):
+        automaton = SequenceAutomaton([LOCK])
+        self.assertFalse(automaton.in_progress(0.0))
+        automaton.feed("PEACE", 0.0)
+        self.assertTrue(automaton.in_progress(0.5))
+        self.assertFalse(automaton.in_progress(0.9))
+        automaton.feed(BLANK, 0.2)
+        automaton.feed("PEACE", 0.4)
+        self.assertFalse(automaton.in_progress(0.4))
+
+
+class VolumeLockTest(unittest.TestCase):
+    """The Volume lock as its loop feeds it: PINCH is BLANK, poses stabilised."""
+
+    def test_pinch_between_peace_signs_fires(self):
+        labels = ["PEACE"] * 4 + ["PINCH"] * 4 + ["PEACE"] * 4
+        automaton = SequenceAutomaton([LOCK])
+        self.assertEqual(run(automaton, volume_symbols(labels), dt=1 / 30),
+                         [(10, "TOGGLE_LOCK")])
+
+    def test_flickers_are_not_steps(self):
+        # Two-frame PINCH flickers inside a held PEACE never reach BLANK
+        labels = ["PEACE"] * 4 + (["PINCH"] * 2 + ["PEACE"] * 3) * 3
+        automaton = SequenceAutomaton([LOCK])
+        self.assertEqual(run(automaton, volume_symbols(labels), dt=1 / 30), [])
+
+    def test_long_pinch_times_out(self):
+        labels = ["PEACE"] * 4 + ["PINCH"] * 30 + ["PEACE"] * 4
+        automaton = SequenceAutomaton([LOCK])
+        self.assertEqual(run(automaton, volume_symbols(labels), dt=1 / 30), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import math
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from recording import session
+from recording.session import (LANDMARKS_FILE, MAX_HANDS, RECORD_DTYPE, SessionRecorder,
+                               make_record, open_session)
+from runtime.results import NO_HANDS, make_results
+
+HANDS_CONFIG = dict(max_num_hands=1)
+
+
+def frame(seq):
+    return SimpleNamespace(seq=seq, t=seq / 30, t_source=None if seq % 2 else seq / 30 + 5,
+                           image=None)
+
+
+class SessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        rng = np.random.default_rng(0)
+        self.points = [rng.uniform(0, 1, (21, 3)).astype(np.float32) for _ in range(3)]
+
+    def tearDown(self):
+        session.stop_recording()
+        session.mode_stopped()
+        shutil.rmtree(self.directory)
+
+    def record_frames(self, count):
+        recorder = SessionRecorder(self.directory, mode="Mouse", hands_config=HANDS_CONFIG)
+        for seq in range(1, count + 1):
+            hands = [(self.points[k], ("Left", "Right", "Left")[k], 0.9) for k in range(seq % 4)]
+            recorder.record("Mouse", frame(seq), make_results(hands), f"G{seq}")
+        recorder.close()
+        return recorder
+
+    def test_make_record(self):
+        results = make_results([(self.points[0], "Right", 0.75)])
+        record = make_record("Keyboard", 9, 1.5, results, "PINCH", t_source=2.0)
+        self.assertEqual(record["hands"], 1)
+        self.assertEqual(record["mode"], b"Keyboard")
+        self.assertEqual(record["gesture"], b"PINCH")
+        np.testing.assert_array_equal(record["landmarks"][0], self.points[0])
+        np.testing.assert_array_equal(record["handedness"], [1, -1])
+        self.assertEqual(record["video_frame"], -1)
+
+        empty = make_record("Mouse", 1, 0.0, NO_HANDS)
+        self.assertEqual(empty["hands"], 0)
+        self.assertTrue(math.isnan(empty["t_source"]))
+
+    def test_round_trip(self):
+        self.record_frames(10)
+        meta, records = open_session(self.directory)
+
+        self.assertEqual(len(records), 10)
+        np.testing.assert_array_equal(records["seq"], np.arange(1, 11))
+        np.testing.assert_array_equal(records["hands"], [min(s % 4, MAX_HANDS) for s in range(1, 11)])
+        self.assertEqual(records[2]["gesture"], b"G3")
+        np.testing.assert_array_equal(records[2]["landmarks"], np.stack(self.points[:2]))
+        np.testing.assert_array_equal(records[2]["handedness"], [0, 1])
+        self.assertTrue(math.isnan(records[0]["t_source"]))
+        self.assertEqual(records[1]["t_source"], 2 / 30 + 5)
+
+    def test_truncated_trailing_record_is_ignored(self):
+        self.record_frames(5)
+        path = os.path.join(self.directory, LANDMARKS_FILE)
+        with open(path, "ab") as f:
+            f.write(b"\0" * (RECORD_DTYPE.itemsize // 2))
+
+        _, records = open_session(self.directory)
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[-1]["seq"], 5)
+
+    def test_empty_session(self):
+        SessionRecorder(self.directory).close()
+        meta, records = open_session(self.directory)
+        self.assertEqual(len(records), 0)
+        self.assertEqual(meta["frames"], 0)
+
+    def test_meta(self):
+        self.record_frames(4)
+        meta, _ = open_session(self.directory)
+        self.assertEqual(meta["mode"], "Mouse")
+        self.assertEqual(meta["hands_config"], HANDS_CONFIG)
+        self.assertEqual(meta["modes"], ["Mouse"])
+        self.assertEqual(meta["frames"], 4)
+        self.assertEqual(meta["record_size"], RECORD_DTYPE.itemsize)
+
+    def test_meta_of_a_recording_started_mid_mode(self):
+        session.mode_started("Volume", HANDS_CONFIG)
+        session.start_recording(self.directory)
+        session.mode_started("Media", dict(max_num_hands=2))
+        session.stop_recording()
+
+        meta, _ = open_session(self.directory)
+        self.assertEqual(meta["mode"], "Volume")
+        self.assertEqual(meta["hands_config"], HANDS_CONFIG)
+        self.assertEqual(meta["modes"], ["Volume", "Media"])
+
+
+if __name__ == "__main__":
+    unittest.main()
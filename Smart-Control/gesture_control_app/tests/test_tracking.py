@@ -0,0 +1,109 @@
+import unittest
+
+import numpy as np
+
+from runtime.results import NO_HANDS, make_results
+from runtime.tracking import MAX_HANDS, MAX_MISSED, HandTracker, assign
+
+SHAPE = np.random.default_rng(0).uniform(-0.05, 0.05, (21, 3))
+
+
+def at(x, y=0.5, side="Right"):
+    """A hand with its wrist at (x, y)."""
+    points = SHAPE + (x, y, 0.0)
+    points[0] = (x, y, 0.0)
+    return points, side, 0.9
+
+
+def ids_by_x(hands):
+    return {round(float(hand.wrist[0]), 2): hand.id for hand in hands}
+
+
+class AssignTest(unittest.TestCase):
+
+    def test_minimum_total_cost_beats_greedy(self):
+        # Greedy would give row 0 column 1 (0.05) and leave row 1 the gate
+        cost = np.array([[0.10, 0.05],
+                         [0.30, 0.10]])
+        self.assertEqual(sorted(assign(cost, 0.25)), [(0, 0), (1, 1)])
+
+    def test_gate(self):
+        cost = np.array([[0.1, 0.4]])
+        self.assertEqual(assign(cost, 0.25), [(0, 0)])
+        self.assertEqual(assign(np.array([[0.3]]), 0.25), [])
+
+    def test_more_rows_than_columns(self):
+        cost = np.array([[0.2], [0.05], [0.1]])
+        self.assertEqual(assign(cost, 0.25), [(1, 0)])
+
+
+class HandTrackerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = HandTracker()
+        self.t = 0.0
+
+    def step(self, *hands):
+        self.t += 1 / 30
+        return self.tracker.update(make_results(list(hands)) if hands else NO_HANDS,
+                                   self.t)
+
+    def test_ids_follow_hands_in_any_order(self):
+        first = ids_by_x(self.step(at(0.2, side="Left"), at(0.8)))
+        swapped = ids_by_x(self.step(at(0.8), at(0.2, side="Left")))
+        self.assertEqual(first, swapped)
+
+    def test_close_hands_moving_together_keep_their_ids(self):
+        first = self.step(at(0.40), at(0.55))
+        a, b = (hand.id for hand in sorted(first, key=lambda h: h.wrist[0]))
+        moved = self.step(at(0.65), at(0.50))
+        self.assertEqual(ids_by_x(moved), {0.5: a, 0.65: b})
+
+    def test_side_penalty_breaks_ties(self):
+        first = ids_by_x(self.step(at(0.45, side="Left"), at(0.55)))
+        # Crossed over: positions alone would swap the IDs
+        crossed = self.step(at(0.53, side="Left"), at(0.47))
+        self.assertEqual({hand.side: hand.id for hand in crossed},
+                         {"Left": first[0.45], "Right": first[0.55]})
+
+    def test_hand_keeps_its_id_through_a_short_dropout(self):
+        hand_id = self.step(at(0.3))[0].id
+        for _ in range(MAX_MISSED):
+            self.assertEqual(self.step(), [])
+        self.assertEqual(self.step(at(0.32))[0].id, hand_id)
+
+    def test_hand_gets_a_new_id_after_a_long_dropout(self):
+        hand_id = self.step(at(0.3))[0].id
+        for _ in range(MAX_MISSED + 1):
+            self.step()
+        self.assertEqual(self.tracker.tracks, [])
+        self.assertNotEqual(self.step(at(0.3))[0].id, hand_id)
+
+    def test_other_hand_does_not_take_a_lost_id(self):
+        left, right = (hand.id for hand in self.step(at(0.2, side="Left"), at(0.8)))
+        self.step(at(0.8))
+        self.step(at(0.8))
+        hands = self.step(at(0.21, side="Left"), at(0.8))
+        self.assertEqual({hand.side: hand.id for hand in hands},
+                         {"Left": left, "Right": right})
+
+    def test_more_hands_than_max_hands(self):
+        count = MAX_HANDS + 2
+        hands = [at((i + 0.5) / count) for i in range(count)]
+        visible = self.step(*hands)
+        self.assertEqual(len(visible), MAX_HANDS)
+        self.assertEqual(len(self.tracker.tracks), count)
+
+        features = self.tracker.features()
+        self.assertEqual(features.points.shape, (MAX_HANDS, 21, 3))
+        for hand in visible:
+            np.testing.assert_array_equal(features.points[hand.row],
+                                          hand.history.latest())
+
+        # IDs stay put on the next frame as well
+        self.assertEqual([hand.id for hand in self.step(*hands)],
+                         [hand.id for hand in visible])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,10 @@
+import time
 import tkinter as tk
 from views.sidebar_view import SidebarView
+from runtime.telemetry import BUS
+
+BUS_POLL_MS = 100
+TELEMETRY_STALE = 1.0
 
 
 class MainView:
@@ -17,8 +22,13 @@ class MainView:
         self.root.resizable(False, False)
 
         self.status_label = None
+        self.telemetry_label = None
+        self._last_telemetry = 0.0
+        self._power = None
         self._build_layout()
 
+        self.root.after(BUS_POLL_MS, self._poll_bus)
+
     def _build_layout(self):
         # Sidebar
         SidebarView(self.root, self.controller)
@@ -54,6 +64,106 @@ class MainView:
         )
         self.status_label.pack(pady=30)
 
+        # Diagnostics
+        tools = tk.Frame(main_area, bg="#121212")
+        tools.pack(pady=10)
+
+        tk.Button(
+            tools,
+            text="Stop Mode",
+            font=("Segoe UI", 10),
+            bg="#aa3333",
+            fg="white",
+            bd=0,
+            width=12,
+            height=1,
+            activebackground="#cc4444",
+            command=self.controller.stop_mode
+        ).pack(side="left", padx=8)
+
+        tk.Button(
+            tools,
+            text="Profile 10s",
+            font=("Segoe UI", 10),
+            bg="#333333",
+            fg="white",
+            bd=0,
+            width=12,
+            height=1,
+            activebackground="#444444",
+            command=lambda: self.controller.profile_mode(10)
+        ).pack(side="left", padx=8)
+
+        self.slow_frames_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            tools,
+            text="Log slow frames",
+            font=("Segoe UI", 10),
+            variable=self.slow_frames_var,
+            bg="#121212",
+            fg="#aaaaaa",
+            selectcolor="#333333",
+            activebackground="#121212",
+            command=lambda: self.controller.set_slow_frame_logging(
+                self.slow_frames_var.get()
+            )
+        ).pack(side="left", padx=8)
+
+        self.trace_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            tools,
+            text="Record trace",
+            font=("Segoe UI", 10),
+            variable=self.trace_var,
+            bg="#121212",
+            fg="#aaaaaa",
+            selectcolor="#333333",
+            activebackground="#121212",
+            command=lambda: self.controller.set_tracing(
+                self.trace_var.get()
+            )
+        ).pack(side="left", padx=8)
+
+        self.recording_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            tools,
+            text="Record session",
+            font=("Segoe UI", 10),
+            variable=self.recording_var,
+            bg="#121212",
+            fg="#aaaaaa",
+            selectcolor="#333333",
+            activebackground="#121212",
+            command=lambda: self.controller.set_recording(
+                self.recording_var.get()
+            )
+        ).pack(side="left", padx=8)
+
+        self.streaming_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            tools,
+            text="Stream landmarks",
+            font=("Segoe UI", 10),
+            variable=self.streaming_var,
+            bg="#121212",
+            fg="#aaaaaa",
+            selectcolor="#333333",
+            activebackground="#121212",
+            command=lambda: self.controller.set_streaming(
+                self.streaming_var.get()
+            )
+        ).pack(side="left", padx=8)
+
+        self.telemetry_label = tk.Label(
+            main_area,
+            text="",
+            font=("Consolas", 10),
+            bg="#121212",
+            fg="#66ccaa",
+            justify="left"
+        )
+        self.telemetry_label.pack(pady=15)
+
         footer = tk.Label(
             main_area,
             text="Smart Control v1.0  |  Built by L.A",
@@ -66,5 +176,44 @@ class MainView:
     def update_status(self, text, color="#aaaaaa"):
         self.status_label.config(text=text, fg=color)
 
+    # ---------------- TELEMETRY ----------------
+    def _poll_bus(self):
+        events, latest = BUS.drain()
+
+        for topic, payload in events:
+            if topic == "status":
+                self.update_status(*payload)
+
+        if "power" in latest:
+            self._power = latest["power"]
+
+        if "telemetry" in latest:
+            self._show_telemetry(latest["telemetry"])
+            self._last_telemetry = time.monotonic()
+        elif time.monotonic() - self._last_telemetry > TELEMETRY_STALE:
+            self.telemetry_label.config(text="")
+
+        self.root.after(BUS_POLL_MS, self._poll_bus)
+
+    def _show_telemetry(self, snapshot):
+        lines = [
+            f"{snapshot['mode']}   {snapshot['fps']:5.1f} FPS   "
+            f"CPU {snapshot['cpu']:5.1f}%   dropped {snapshot['dropped']}   "
+            f"duplicates {snapshot['duplicates']}",
+            f"{'stage':<10}{'p50':>8}{'p95':>8}{'p99':>8}  ms"
+        ]
+        for stage, (p50, p95, p99) in snapshot["latency_ms"].items():
+            lines.append(f"{stage:<10}{p50:8.1f}{p95:8.1f}{p99:8.1f}")
+
+        power = self._power
+        if power and power["mode"] == snapshot["mode"]:
+            seconds = power["seconds"]
+            lines.append(
+                f"power {power['state']:<8} active {seconds['ACTIVE']:.0f}s"
+                f"   idle {seconds['IDLE']:.0f}s"
+            )
+
+        self.telemetry_label.config(text="\n".join(lines))
+
     def start(self):
         self.root.mainloop()
\ No newline at end of file
@@ -1,187 +1,213 @@
 import cv2
-import mediapipe as mp
 import math
 import numpy as np
-import time
 from ctypes import cast, POINTER
 from comtypes import CLSCTX_ALL
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 
+from gestures.sequences import BLANK, SequenceAutomaton, Stabilizer, sequence
+from runtime import trace
+from runtime.mode_runtime import ModePlugin, intent
+
+HANDS_CONFIG = dict(
+    max_num_hands=1,
+    min_detection_confidence=0.7,
+    min_tracking_confidence=0.7
+)
+
+# Landmark inference width (None = full frame); see benchmarks/scale_benchmark.py
+INFER_WIDTH = None
+
+# Loop rate; see runtime/scheduler.py
+TARGET_FPS = 30
+
+# ---------------- UI CONSTANTS ----------------
+BAR_X, BAR_Y = 50, 100
+BAR_WIDTH, BAR_HEIGHT = 40, 300
+
+HAND_COLOR = (0, 255, 255)
+BAR_COLOR = (0, 255, 0)
+LOCKED_BAR_COLOR = (255, 165, 0)
+TEXT_COLOR = (255, 255, 255)
+BG_COLOR = (40, 40, 40)
+LOCK_COLOR = (255, 215, 0)
+
+
+# ===================== GESTURE DETECTORS =====================
+# lm: (21, 2) landmarks in pixels
+def detect_peace_sign(lm):
+    return (
+        lm[8, 1] < lm[6, 1] - 20 and
+        lm[12, 1] < lm[10, 1] - 20 and
+        lm[16, 1] > lm[14, 1] and
+        lm[20, 1] > lm[18, 1]
+    )
 
-# ===================== MAIN FUNCTION =====================
-def run_volume():
 
-    # ---------------- AUDIO SETUP ----------------
-    devices = AudioUtilities.GetSpeakers()
-    interface = devices.Activate(
-        IAudioEndpointVolume._iid_,
-        CLSCTX_ALL,
-        None
+def detect_thumbs_up(lm):
+    return (
+        lm[4, 1] < lm[3, 1] - 30 and
+        lm[8, 1] > lm[6, 1] and
+        lm[12, 1] > lm[10, 1] and
+        lm[16, 1] > lm[14, 1] and
+        lm[20, 1] > lm[18, 1]
     )
-    volume = cast(interface, POINTER(IAudioEndpointVolume))
-    minVol, maxVol, _ = volume.GetVolumeRange()
-
-    # ---------------- MEDIAPIPE ----------------
-    mp_hands = mp.solutions.hands
-    mp_draw = mp.solutions.drawing_utils
-
-    # ---------------- CAMERA ----------------
-    wCam, hCam = 640, 480
-    cap = cv2.VideoCapture(0)
-    cap.set(3, wCam)
-    cap.set(4, hCam)
-
-    # ---------------- UI CONSTANTS ----------------
-    BAR_X, BAR_Y = 50, 100
-    BAR_WIDTH, BAR_HEIGHT = 40, 300
-
-    HAND_COLOR = (0, 255, 255)
-    BAR_COLOR = (0, 255, 0)
-    LOCKED_BAR_COLOR = (255, 165, 0)
-    TEXT_COLOR = (255, 255, 255)
-    BG_COLOR = (40, 40, 40)
-    LOCK_COLOR = (255, 215, 0)
-
-    # ---------------- STATES ----------------
-    smoothness = 5
-    pTime = 0
-
-    volume_locked = False
-    locked_volume = None
-    lock_cooldown = 0
-    COOLDOWN_FRAMES = 30
-
-    peace_sign_counter = 0
-    PEACE_SIGN_THRESHOLD = 30
-
-    print("Advanced Volume Control Started (Press Q to exit)")
-
-    # ---------------- GESTURE DETECTORS ----------------
-    def detect_peace_sign(lmList):
-        if len(lmList) < 21:
-            return False
-        return (
-            lmList[8][2] < lmList[6][2] - 20 and
-            lmList[12][2] < lmList[10][2] - 20 and
-            lmList[16][2] > lmList[14][2] and
-            lmList[20][2] > lmList[18][2]
+
+
+def classify_hand(hand_landmarks, side, frame_size):
+    """This frame's gesture, as the loop names it; see recording/batch.py."""
+    w, h = frame_size
+    lm = np.array([(p.x * w, p.y * h) for p in hand_landmarks.landmark],
+                  np.float32)
+    if detect_peace_sign(lm):
+        return "PEACE"
+    if detect_thumbs_up(lm):
+        return "THUMBS_UP"
+    return "PINCH"
+
+
+# ===================== MODE PLUGIN =====================
+class VolumePlugin(ModePlugin):
+    name = "Volume"
+    hands_config = HANDS_CONFIG
+    infer_width = INFER_WIDTH
+    target_fps = TARGET_FPS
+    window_title = "Advanced Gesture Volume Control"
+    exit_key = ord('q')
+
+    def open_endpoint(self):
+        """The speakers' volume control; benchmarks/gesture_stress.py fakes it."""
+        devices = AudioUtilities.GetSpeakers()
+        interface = devices.Activate(
+            IAudioEndpointVolume._iid_,
+            CLSCTX_ALL,
+            None
         )
+        return cast(interface, POINTER(IAudioEndpointVolume))
 
-    def detect_thumbs_up(lmList):
-        if len(lmList) < 21:
-            return False
-        return (
-            lmList[4][2] < lmList[3][2] - 30 and
-            lmList[8][2] > lmList[6][2] and
-            lmList[12][2] > lmList[10][2] and
-            lmList[16][2] > lmList[14][2] and
-            lmList[20][2] > lmList[18][2]
+    def on_start(self):
+        # ---------------- AUDIO SETUP ----------------
+        self.volume = self.open_endpoint()
+        self.minVol, self.maxVol, _ = self.volume.GetVolumeRange()
+
+        self.runtime.actions.register(
+            "SetMasterVolumeLevel",
+            lambda level: self.volume.SetMasterVolumeLevel(level, None)
         )
 
-    with mp_hands.Hands(
-        max_num_hands=1,
-        min_detection_confidence=0.7,
-        min_tracking_confidence=0.7
-    ) as hands:
-
-        while cap.isOpened():
-
-            success, img = cap.read()
-            if not success:
-                break
-
-            img = cv2.flip(img, 1)
-            rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            result = hands.process(rgb)
-
-            lmList = []
-
-            if result.multi_hand_landmarks:
-                hand = result.multi_hand_landmarks[0]
-                mp_draw.draw_landmarks(img, hand, mp_hands.HAND_CONNECTIONS)
-
-                for id, lm in enumerate(hand.landmark):
-                    cx, cy = int(lm.x * wCam), int(lm.y * hCam)
-                    lmList.append([id, cx, cy])
-
-            # ---------------- CONTROL LOGIC ----------------
-            if lmList:
-
-                is_peace = detect_peace_sign(lmList)
-                is_thumbs_up = detect_thumbs_up(lmList)
-
-                # Lock / Unlock
-                if is_peace and lock_cooldown == 0:
-                    peace_sign_counter += 1
-                    if peace_sign_counter >= PEACE_SIGN_THRESHOLD:
-                        volume_locked = not volume_locked
-                        if volume_locked:
-                            locked_volume = volume.GetMasterVolumeLevel()
-                        else:
-                            locked_volume = None
-                        peace_sign_counter = 0
-                        lock_cooldown = COOLDOWN_FRAMES
-                else:
-                    peace_sign_counter = max(0, peace_sign_counter - 2)
+        # ---------------- STATES ----------------
+        self.smoothness = 5
 
-                # Max volume
-                if is_thumbs_up and not volume_locked:
-                    volume.SetMasterVolumeLevel(maxVol, None)
+        self.volume_locked = False
+        self.locked_volume = None
 
-                # Pinch adjust
-                if not is_peace and not is_thumbs_up:
-                    x1, y1 = lmList[4][1], lmList[4][2]
-                    x2, y2 = lmList[8][1], lmList[8][2]
+        # Peace sign twice toggles the lock (formerly a 1 s peace hold).
+        # Pinching is the neutral pose between the two peace signs.
+        self.stable_pose = Stabilizer()
+        self.lock_sequence = SequenceAutomaton([
+            sequence("TOGGLE_LOCK", "PEACE PEACE", within=0.8)
+        ])
 
-                    length = math.hypot(x2 - x1, y2 - y1)
+        self.current_gesture = ""
+        self.hand_found = False
 
-                    if not volume_locked:
-                        vol = np.interp(length, [40, 220], [minVol, maxVol])
-                        vol = round(vol / smoothness) * smoothness
-                        volume.SetMasterVolumeLevel(vol, None)
-                    else:
-                        volume.SetMasterVolumeLevel(locked_volume, None)
+        # The newest hand in pixels, preallocated
+        self.lm_px = np.zeros((21, 2), np.float32)
 
-                # Draw volume bar
-                current_vol = volume.GetMasterVolumeLevel()
-                volBar = np.interp(current_vol, [minVol, maxVol], [BAR_HEIGHT, 0])
-                volPer = np.interp(current_vol, [minVol, maxVol], [0, 100])
+        print("Advanced Volume Control Started (Press Q to exit)")
 
-                bar_color = LOCKED_BAR_COLOR if volume_locked else BAR_COLOR
+    def set_volume(self, level):
+        return intent("SetMasterVolumeLevel", level=float(level))
 
-                cv2.rectangle(img, (BAR_X, BAR_Y),
-                              (BAR_X + BAR_WIDTH, BAR_Y + BAR_HEIGHT),
-                              BG_COLOR, 2)
+    def on_frame(self, hands, features, now):
+        intents = []
+        gesture = ""
+        lm_px = self.lm_px
 
-                cv2.rectangle(img,
-                              (BAR_X, int(BAR_Y + volBar)),
-                              (BAR_X + BAR_WIDTH, BAR_Y + BAR_HEIGHT),
-                              bar_color, -1)
+        self.hand_found = bool(hands)
+        if self.hand_found:
+            px_scale = np.array(self.runtime.frame_size, np.float32)
+            np.multiply(hands[0].history.latest()[:, :2], px_scale, out=lm_px)
 
-                cv2.putText(img, f'{int(volPer)} %',
-                            (BAR_X - 10, BAR_Y + BAR_HEIGHT + 40),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.8,
-                            TEXT_COLOR, 2)
+        # ---------------- CONTROL LOGIC ----------------
+        if self.hand_found:
 
-            # Cooldown update
-            if lock_cooldown > 0:
-                lock_cooldown -= 1
+            is_peace = detect_peace_sign(lm_px)
+            is_thumbs_up = detect_thumbs_up(lm_px)
 
-            # FPS
-            cTime = time.time()
-            fps = 1 / (cTime - pTime) if cTime != pTime else 0
-            pTime = cTime
+            if is_peace:
+                gesture = "PEACE"
+            elif is_thumbs_up:
+                gesture = "THUMBS_UP"
+            else:
+                gesture = "PINCH"
 
-            cv2.putText(img, f'FPS: {int(fps)}',
-                        (500, 20),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6,
-                        (0, 255, 0), 2)
+            # Max volume
+            if is_thumbs_up and not self.volume_locked:
+                intents.append(self.set_volume(self.maxVol))
 
-            cv2.imshow("Advanced Gesture Volume Control", img)
+            # Pinch adjust; not between the two peace signs of the lock
+            # gesture, whose neutral pose is a pinch too
+            if (not is_peace and not is_thumbs_up
+                    and not self.lock_sequence.in_progress(now)):
+                x1, y1 = lm_px[4]
+                x2, y2 = lm_px[8]
 
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
+                length = math.hypot(x2 - x1, y2 - y1)
 
-    cap.release()
-    cv2.destroyAllWindows()
-    print("Volume mode stopped.")
+                if not self.volume_locked:
+                    vol = np.interp(length, [40, 220], [self.minVol, self.maxVol])
+                    vol = round(vol / self.smoothness) * self.smoothness
+                    intents.append(self.set_volume(vol))
+                else:
+                    intents.append(self.set_volume(self.locked_volume))
+
+        # ---------------- LOCK SEQUENCE ----------------
+        pose = self.stable_pose.update(gesture if gesture != "PINCH" else BLANK)
+        if self.lock_sequence.feed(pose, now) == "TOGGLE_LOCK":
+            self.volume_locked = not self.volume_locked
+            trace.gesture(
+                "Volume",
+                "UNLOCKED" if self.volume_locked else "LOCKED",
+                "LOCKED" if self.volume_locked else "UNLOCKED"
+            )
+            if self.volume_locked:
+                self.locked_volume = self.volume.GetMasterVolumeLevel()
+            else:
+                self.locked_volume = None
+
+        if gesture != self.current_gesture:
+            trace.gesture("Volume", self.current_gesture, gesture)
+            self.current_gesture = gesture
+
+        self.label = gesture
+        return intents
+
+    def draw(self, img):
+        # Draw volume bar
+        if self.hand_found:
+            current_vol = self.volume.GetMasterVolumeLevel()
+            volBar = np.interp(current_vol, [self.minVol, self.maxVol], [BAR_HEIGHT, 0])
+            volPer = np.interp(current_vol, [self.minVol, self.maxVol], [0, 100])
+
+            bar_color = LOCKED_BAR_COLOR if self.volume_locked else BAR_COLOR
+
+            cv2.rectangle(img, (BAR_X, BAR_Y),
+                          (BAR_X + BAR_WIDTH, BAR_Y + BAR_HEIGHT),
+                          BG_COLOR, 2)
+
+            cv2.rectangle(img,
+                          (BAR_X, int(BAR_Y + volBar)),
+                          (BAR_X + BAR_WIDTH, BAR_Y + BAR_HEIGHT),
+                          bar_color, -1)
+
+            cv2.putText(img, f'{int(volPer)} %',
+                        (BAR_X - 10, BAR_Y + BAR_HEIGHT + 40),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.8,
+                        TEXT_COLOR, 2)
+
+        # FPS
+        cv2.putText(img, f'FPS: {int(self.runtime.fps)}',
+                    (500, 20),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6,
+                    (0, 255, 0), 2)